@@ -1,11 +1,15 @@
-import pygame
+import argparse
 import random
+import pygame
+from bitboard import Engine2048, GRID_SIZE
+from expectimax import ExpectimaxAI
+from journal import Journal, best_scores, read_games, replay, summary_file, write_atomic
+from numpy_engine import GridEngine, MAX_SIZE, MIN_SIZE
 
 # Initialize Pygame
 pygame.init()
 
 # Constants
-GRID_SIZE = 4
 CELL_SIZE = 100
 MARGIN = 10
 WIDTH = GRID_SIZE * (CELL_SIZE + MARGIN) + MARGIN
@@ -14,6 +18,8 @@ BACKGROUND_COLOR = (187, 173, 160)
 EMPTY_CELL_COLOR = (205, 193, 180)
 FONT = pygame.font.Font(None, 36)
 LARGE_FONT = pygame.font.Font(None, 48)
+# The batched search plays ~1500 moves/s at depth 3 on one core
+AI_DEPTH = 3
 
 # Color scheme for tiles
 COLORS = {
@@ -32,138 +38,199 @@ COLORS = {
 }
 
 class Game2048:
-    def __init__(self):
+    def __init__(self, size=GRID_SIZE, record=True):
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("2048")
         self.clock = pygame.time.Clock()
+        self.journal = Journal() if record else None
+        self.ai = ExpectimaxAI(depth=AI_DEPTH)
+        self.autoplay = False
+        self.best_scores = {}
+        self.journal_best = None
+        self.set_size(size)
+
+    def set_size(self, size):
+        # The 4x4 board runs on the bitboard engine (which the AI needs);
+        # other sizes use the NumPy engine
+        self.size = size
+        # The constructors already spawn two tiles, so the journal is only
+        # hooked up afterwards; reset_game logs the START record first
+        if size == GRID_SIZE:
+            self.engine = Engine2048()
+        else:
+            self.engine = GridEngine(size)
+        if self.journal:
+            self.engine.on_spawn = self.journal.spawn
+        if size != GRID_SIZE:
+            self.autoplay = False
+        self.cell_size = (WIDTH - MARGIN * (size + 1)) // size
+        self.tile_font = pygame.font.Font(None, max(16, 36 * self.cell_size // CELL_SIZE))
+        self.tile_cache = {}
+        for value in COLORS:
+            self.tile_surface(value)
+        pygame.display.set_caption("2048" if size == GRID_SIZE else f"2048 ({size}x{size})")
         self.reset_game()
 
     def reset_game(self):
-        self.grid = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-        self.score = 0
+        seed = random.getrandbits(63)
+        if self.journal:
+            self.journal.start_game(self.size, seed)
+        self.engine.reset(seed)
         self.best_score = self.load_best_score()
         self.game_over = False
-        self.add_new_tile()
-        self.add_new_tile()
+        self.hint = None
+        self.invalidate()
+
+    @property
+    def grid(self):
+        return self.engine.grid
+
+    @property
+    def score(self):
+        return self.engine.score
 
     def load_best_score(self):
-        try:
-            with open("best_score.txt", "r") as f:
-                return int(f.read())
-        except FileNotFoundError:
-            return 0
+        # The summary file only seeds the best score the first time a size is
+        # played, before this run can have written it; after that the file may
+        # lag behind the background writer. Without a summary the journal is
+        # replayed, at most once per run
+        if self.size not in self.best_scores:
+            try:
+                with open(summary_file(self.size), "r") as f:
+                    self.best_scores[self.size] = int(f.read())
+            except (FileNotFoundError, ValueError):
+                if self.journal_best is None:
+                    self.journal_best = best_scores(read_games())
+                self.best_scores[self.size] = self.journal_best.get(self.size, 0)
+        return self.best_scores[self.size]
 
     def save_best_score(self):
-        with open("best_score.txt", "w") as f:
-            f.write(str(self.best_score))
+        self.best_scores[self.size] = self.best_score
+        if self.journal:
+            self.journal.write_summary(summary_file(self.size), str(self.best_score))
+        else:
+            write_atomic(summary_file(self.size), str(self.best_score))
 
     def add_new_tile(self):
-        empty_cells = [(i, j) for i in range(GRID_SIZE) for j in range(GRID_SIZE) if self.grid[i][j] == 0]
-        if empty_cells:
-            i, j = random.choice(empty_cells)
-            self.grid[i][j] = 2 if random.random() < 0.9 else 4
+        self.engine.add_new_tile()
 
     def move(self, direction):
-        moved = False
-        if direction == "UP":
-            for j in range(GRID_SIZE):
-                column = [self.grid[i][j] for i in range(GRID_SIZE) if self.grid[i][j] != 0]
-                column = self.merge(column)
-                for i in range(GRID_SIZE):
-                    value = column[i] if i < len(column) else 0
-                    if self.grid[i][j] != value:
-                        moved = True
-                    self.grid[i][j] = value
-        elif direction == "DOWN":
-            for j in range(GRID_SIZE):
-                column = [self.grid[i][j] for i in range(GRID_SIZE-1, -1, -1) if self.grid[i][j] != 0]
-                column = self.merge(column)
-                for i in range(GRID_SIZE-1, -1, -1):
-                    value = column[GRID_SIZE-1-i] if GRID_SIZE-1-i < len(column) else 0
-                    if self.grid[i][j] != value:
-                        moved = True
-                    self.grid[i][j] = value
-        elif direction == "LEFT":
-            for i in range(GRID_SIZE):
-                row = [self.grid[i][j] for j in range(GRID_SIZE) if self.grid[i][j] != 0]
-                row = self.merge(row)
-                for j in range(GRID_SIZE):
-                    value = row[j] if j < len(row) else 0
-                    if self.grid[i][j] != value:
-                        moved = True
-                    self.grid[i][j] = value
-        elif direction == "RIGHT":
-            for i in range(GRID_SIZE):
-                row = [self.grid[i][j] for j in range(GRID_SIZE-1, -1, -1) if self.grid[i][j] != 0]
-                row = self.merge(row)
-                for j in range(GRID_SIZE-1, -1, -1):
-                    value = row[GRID_SIZE-1-j] if GRID_SIZE-1-j < len(row) else 0
-                    if self.grid[i][j] != value:
-                        moved = True
-                    self.grid[i][j] = value
-        if moved:
-            self.add_new_tile()
+        self.hint = None
+        if self.engine.move(direction, spawn=False):
+            if self.journal:
+                self.journal.move(direction)
+            self.engine.add_new_tile()
             if self.is_game_over():
                 self.game_over = True
             if self.score > self.best_score:
                 self.best_score = self.score
                 self.save_best_score()
 
-    def merge(self, line):
-        for i in range(len(line) - 1):
-            if line[i] == line[i + 1]:
-                line[i] *= 2
-                self.score += line[i]
-                line.pop(i + 1)
-                line.append(0)
-        return line
-
     def is_game_over(self):
-        if any(0 in row for row in self.grid):
-            return False
-        for i in range(GRID_SIZE):
-            for j in range(GRID_SIZE):
-                value = self.grid[i][j]
-                if (i < GRID_SIZE-1 and value == self.grid[i+1][j]) or \
-                   (j < GRID_SIZE-1 and value == self.grid[i][j+1]):
-                    return False
-        return True
+        return self.engine.is_game_over()
+
+    def show_hint(self):
+        if self.size == GRID_SIZE:
+            self.hint = self.ai.best_move(self.engine.board)
+
+    def autoplay_step(self):
+        direction = self.ai.best_move(self.engine.board)
+        if direction is None:
+            self.game_over = True
+        else:
+            self.move(direction)
+
+    def tile_rect(self, i, j):
+        return pygame.Rect(j*(self.cell_size+MARGIN)+MARGIN, i*(self.cell_size+MARGIN)+MARGIN, self.cell_size, self.cell_size)
+
+    def tile_surface(self, value):
+        surface = self.tile_cache.get(value)
+        if surface is None:
+            surface = pygame.Surface((self.cell_size, self.cell_size))
+            surface.fill(COLORS.get(value, COLORS[0]))
+            if value != 0:
+                text = self.tile_font.render(str(value), True, (0, 0, 0))
+                surface.blit(text, text.get_rect(center=(self.cell_size//2, self.cell_size//2)))
+            self.tile_cache[value] = surface
+        return surface
+
+    def invalidate(self):
+        # A missing grid makes draw() fill the background and repaint every tile and the panel
+        self.drawn_grid = None
+        self.drawn_panel = None
+        self.drawn_game_over = False
 
     def draw(self):
-        self.screen.fill(BACKGROUND_COLOR)
-        for i in range(GRID_SIZE):
-            for j in range(GRID_SIZE):
-                value = self.grid[i][j]
-                color = COLORS.get(value, COLORS[0])
-                pygame.draw.rect(self.screen, color, (j*(CELL_SIZE+MARGIN)+MARGIN, i*(CELL_SIZE+MARGIN)+MARGIN, CELL_SIZE, CELL_SIZE))
-                if value != 0:
-                    text = FONT.render(str(value), True, (0, 0, 0))
-                    text_rect = text.get_rect(center=(j*(CELL_SIZE+MARGIN)+MARGIN+CELL_SIZE//2, i*(CELL_SIZE+MARGIN)+MARGIN+CELL_SIZE//2))
-                    self.screen.blit(text, text_rect)
-        
+        """Redraw the tiles and panel that changed and return the dirty rects."""
+        dirty = []
+        if self.drawn_grid is None:
+            self.screen.fill(BACKGROUND_COLOR)
+            dirty.append(self.screen.get_rect())
+        dirty += self.draw_tiles()
+        dirty += self.draw_panel()
+
+        if self.game_over and not self.drawn_game_over:
+            game_over_text = LARGE_FONT.render("Game Over!", True, (0, 0, 0))
+            dirty.append(self.screen.blit(game_over_text, (WIDTH//2 - game_over_text.get_width()//2, HEIGHT//2 - game_over_text.get_height()//2)))
+            self.drawn_game_over = True
+        return dirty
+
+    def draw_tiles(self):
+        dirty = []
+        grid = self.grid
+        for i in range(self.size):
+            for j in range(self.size):
+                value = grid[i][j]
+                if self.drawn_grid is None or self.drawn_grid[i][j] != value:
+                    dirty.append(self.screen.blit(self.tile_surface(value), self.tile_rect(i, j)))
+        self.drawn_grid = grid
+        return dirty
+
+    def draw_panel(self):
+        panel = (self.score, self.best_score, self.hint, self.autoplay)
+        if panel == self.drawn_panel:
+            return []
+        self.drawn_panel = panel
+        panel_rect = pygame.Rect(0, WIDTH, WIDTH, HEIGHT - WIDTH)
+        self.screen.fill(BACKGROUND_COLOR, panel_rect)
+
         score_text = FONT.render(f"Score: {self.score}", True, (0, 0, 0))
         best_score_text = FONT.render(f"Best: {self.best_score}", True, (0, 0, 0))
         self.screen.blit(score_text, (10, HEIGHT - 90))
         self.screen.blit(best_score_text, (WIDTH - best_score_text.get_width() - 10, HEIGHT - 90))
-
-        if self.game_over:
-            game_over_text = LARGE_FONT.render("Game Over!", True, (0, 0, 0))
-            self.screen.blit(game_over_text, (WIDTH//2 - game_over_text.get_width()//2, HEIGHT//2 - game_over_text.get_height()//2))
+        if self.hint:
+            hint_text = FONT.render(self.hint, True, (0, 0, 0))
+            self.screen.blit(hint_text, (WIDTH//2 - hint_text.get_width()//2, HEIGHT - 90))
 
         pygame.draw.rect(self.screen, (150, 150, 150), (10, HEIGHT - 50, 100, 40))
         restart_text = FONT.render("Restart", True, (0, 0, 0))
         self.screen.blit(restart_text, (20, HEIGHT - 45))
 
+        auto_color = (100, 180, 100) if self.autoplay else (150, 150, 150)
+        pygame.draw.rect(self.screen, auto_color, (120, HEIGHT - 50, 100, 40))
+        auto_text = FONT.render("Auto", True, (0, 0, 0))
+        self.screen.blit(auto_text, (140, HEIGHT - 45))
+
+        pygame.draw.rect(self.screen, (150, 150, 150), (230, HEIGHT - 50, 100, 40))
+        hint_button_text = FONT.render("Hint", True, (0, 0, 0))
+        self.screen.blit(hint_button_text, (255, HEIGHT - 45))
+
         pygame.draw.rect(self.screen, (150, 150, 150), (WIDTH - 110, HEIGHT - 50, 100, 40))
         quit_text = FONT.render("Quit", True, (0, 0, 0))
         self.screen.blit(quit_text, (WIDTH - 90, HEIGHT - 45))
+        return [panel_rect]
 
     def run(self):
         running = True
         while running:
-            for event in pygame.event.get():
+            # Only keep spinning while autoplay is running; otherwise sleep
+            # until the next event
+            animating = self.autoplay and not self.game_over
+            events = pygame.event.get() if animating else [pygame.event.wait()] + pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.invalidate()
                 if event.type == pygame.KEYDOWN and not self.game_over:
                     if event.key == pygame.K_UP:
                         self.move("UP")
@@ -173,20 +240,65 @@ class Game2048:
                         self.move("LEFT")
                     elif event.key == pygame.K_RIGHT:
                         self.move("RIGHT")
+                    elif event.key == pygame.K_h:
+                        self.show_hint()
+                    elif event.key == pygame.K_a and self.size == GRID_SIZE:
+                        self.autoplay = not self.autoplay
+                if event.type == pygame.KEYDOWN and event.unicode.isdigit():
+                    if MIN_SIZE <= int(event.unicode) <= MAX_SIZE:
+                        self.set_size(int(event.unicode))
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     x, y = pygame.mouse.get_pos()
                     if HEIGHT - 50 < y < HEIGHT - 10:
                         if 10 < x < 110:
                             self.reset_game()
+                        elif 120 < x < 220 and self.size == GRID_SIZE:
+                            self.autoplay = not self.autoplay
+                        elif 230 < x < 330 and not self.game_over:
+                            self.show_hint()
                         elif WIDTH - 110 < x < WIDTH - 10:
                             running = False
 
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(60)
+            if self.autoplay and not self.game_over:
+                self.autoplay_step()
+
+            dirty_rects = self.draw()
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            if animating:
+                self.clock.tick(60)
 
+        if self.journal:
+            self.journal.close()
+        pygame.quit()
+
+    def replay(self, index):
+        """Re-simulate a journaled game on screen, one move per frame."""
+        game = read_games()[index]
+        self.set_size(game['size'])
+        steps = replay(game)
+        running = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.invalidate()
+            engine = next(steps, None)
+            if engine is not None:
+                self.engine = engine
+            dirty_rects = self.draw()
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            self.clock.tick(10)
         pygame.quit()
 
 if __name__ == "__main__":
-    game = Game2048()
-    game.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="2048")
+    parser.add_argument("--replay", type=int, metavar="GAME", help="replay a game from the journal (-1 for the last)")
+    args = parser.parse_args()
+    if args.replay is not None:
+        Game2048(record=False).replay(args.replay)
+    else:
+        game = Game2048()
+        game.run()
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""Headless 2048 engine on a 64-bit bitboard.
+
+Each tile is stored as a 4-bit exponent (0 = empty, 1 = 2, 2 = 4, ...);
+row ``r`` occupies bits ``16*r`` to ``16*r + 15`` with column ``c`` at
+nibble ``c``. Left and right moves are looked up per row in precomputed
+65536-entry tables, and up/down reuse them on the transposed board.
+No pygame import, so it can be used for simulations.
+"""
+import random
+
+GRID_SIZE = 4
+ROW_MASK = 0xFFFF
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+
+
+def reverse_row(row):
+    return ((row >> 12) & 0xF) | ((row >> 4) & 0xF0) | ((row << 4) & 0xF00) | ((row << 12) & 0xF000)
+
+
+def slide_row_left(row):
+    """Return (new row, score gained) for one 16-bit row moved left."""
+    tiles = [(row >> (4 * c)) & 0xF for c in range(GRID_SIZE)]
+    line = [t for t in tiles if t]
+    merged = []
+    score = 0
+    i = 0
+    while i < len(line):
+        if i + 1 < len(line) and line[i] == line[i + 1] and line[i] < 15:
+            merged.append(line[i] + 1)
+            score += 1 << (line[i] + 1)
+            i += 2
+        else:
+            merged.append(line[i])
+            i += 1
+    result = 0
+    for c, t in enumerate(merged):
+        result |= t << (4 * c)
+    return result, score
+
+
+def build_tables():
+    left = [0] * 65536
+    right = [0] * 65536
+    left_score = [0] * 65536
+    right_score = [0] * 65536
+    for row in range(65536):
+        left[row], left_score[row] = slide_row_left(row)
+    for row in range(65536):
+        reversed_row = reverse_row(row)
+        right[row] = reverse_row(left[reversed_row])
+        right_score[row] = left_score[reversed_row]
+    return left, right, left_score, right_score
+
+
+ROW_LEFT, ROW_RIGHT, ROW_LEFT_SCORE, ROW_RIGHT_SCORE = build_tables()
+
+
+def transpose(board):
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def move_rows(board, table, score_table):
+    new_board = 0
+    score = 0
+    for shift in (0, 16, 32, 48):
+        row = (board >> shift) & ROW_MASK
+        new_board |= table[row] << shift
+        score += score_table[row]
+    return new_board, score
+
+
+def move(board, direction):
+    """Return (new board, score gained); the board is unchanged if the move is illegal."""
+    if direction == "LEFT":
+        return move_rows(board, ROW_LEFT, ROW_LEFT_SCORE)
+    if direction == "RIGHT":
+        return move_rows(board, ROW_RIGHT, ROW_RIGHT_SCORE)
+    if direction == "UP":
+        new_board, score = move_rows(transpose(board), ROW_LEFT, ROW_LEFT_SCORE)
+    elif direction == "DOWN":
+        new_board, score = move_rows(transpose(board), ROW_RIGHT, ROW_RIGHT_SCORE)
+    else:
+        raise ValueError(f"unknown direction {direction!r}")
+    return transpose(new_board), score
+
+
+def empty_cells(board):
+    return [i for i in range(16) if not (board >> (4 * i)) & 0xF]
+
+
+def add_random_tile(board, rng=random, four_probability=0.1):
+    empty = empty_cells(board)
+    if not empty:
+        return board
+    i = rng.choice(empty)
+    exponent = 2 if rng.random() < four_probability else 1
+    return board | (exponent << (4 * i))
+
+
+def can_move(board):
+    return any(move(board, direction)[0] != board for direction in DIRECTIONS)
+
+
+def max_exponent(board):
+    return max((board >> (4 * i)) & 0xF for i in range(16))
+
+
+def encode(grid):
+    board = 0
+    for r in range(GRID_SIZE):
+        for c in range(GRID_SIZE):
+            value = grid[r][c]
+            if value:
+                board |= (value.bit_length() - 1) << (4 * (GRID_SIZE * r + c))
+    return board
+
+
+def decode(board):
+    grid = []
+    for r in range(GRID_SIZE):
+        row = []
+        for c in range(GRID_SIZE):
+            exponent = (board >> (4 * (GRID_SIZE * r + c))) & 0xF
+            row.append(1 << exponent if exponent else 0)
+        grid.append(row)
+    return grid
+
+
+class Engine2048:
+    """One game of 2048: the board, the score and the tile RNG.
+
+    ``on_spawn(cell, exponent)`` is called for every spawned tile, with
+    cells numbered row-major from 0.
+    """
+
+    def __init__(self, rng=None, four_probability=0.1, on_spawn=None):
+        self.rng = rng or random.Random()
+        self.four_probability = four_probability
+        self.on_spawn = on_spawn
+        self.reset()
+
+    def clear(self):
+        self.board = 0
+        self.score = 0
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.rng.seed(seed)
+        self.clear()
+        self.add_new_tile()
+        self.add_new_tile()
+
+    def add_new_tile(self):
+        old_board = self.board
+        self.board = add_random_tile(self.board, self.rng, self.four_probability)
+        if self.on_spawn and self.board != old_board:
+            cell = ((self.board ^ old_board).bit_length() - 1) // 4
+            self.on_spawn(cell, (self.board >> (4 * cell)) & 0xF)
+
+    def place_tile(self, cell, exponent):
+        self.board = (self.board & ~(0xF << (4 * cell))) | (exponent << (4 * cell))
+
+    def move(self, direction, spawn=True):
+        """Apply a move and spawn a tile; return False if nothing moved."""
+        new_board, score = move(self.board, direction)
+        if new_board == self.board:
+            return False
+        self.board = new_board
+        self.score += score
+        if spawn:
+            self.add_new_tile()
+        return True
+
+    def is_game_over(self):
+        return not can_move(self.board)
+
+    @property
+    def grid(self):
+        return decode(self.board)
+
+    @property
+    def max_tile(self):
+        return 1 << max_exponent(self.board)
@@ -0,0 +1,197 @@
+"""Append-only session journal for 2048.
+
+Every game is logged as a START record (board size, RNG seed, time)
+followed by MOVE and SPAWN records in the order they happened. Records are
+small fixed-size structs queued by the game and written, flushed and
+fsynced by a background thread, so the input path never blocks on disk.
+A crash can at worst leave a truncated last record. Readers stop there,
+and the writer cuts it off before appending, so the next session starts
+on a record boundary.
+
+Scores are not stored: they are derived by re-simulating each game from
+its moves and spawns. The best-score summary files are only a cache of
+that, written atomically (temp file + rename) by the same thread.
+"""
+import argparse
+import os
+import queue
+import struct
+import threading
+import time
+
+from bitboard import DIRECTIONS, GRID_SIZE, Engine2048
+
+JOURNAL_FILE = "journal.bin"
+
+START = struct.Struct('<cBQd')   # b'S', size, seed, unix time
+MOVE = struct.Struct('<cB')      # b'M', index into DIRECTIONS
+SPAWN = struct.Struct('<cBB')    # b'T', cell (row-major), exponent
+RECORDS = {b'S': START, b'M': MOVE, b'T': SPAWN}
+
+
+def write_atomic(path, text):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class Journal:
+    def __init__(self, path=JOURNAL_FILE, flush_interval=0.5):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self.run, daemon=True)
+        self.writer.start()
+
+    def start_game(self, size, seed):
+        self.queue.put(START.pack(b'S', size, seed, time.time()))
+
+    def move(self, direction):
+        self.queue.put(MOVE.pack(b'M', DIRECTIONS.index(direction)))
+
+    def spawn(self, cell, exponent):
+        self.queue.put(SPAWN.pack(b'T', cell, exponent))
+
+    def write_summary(self, path, text):
+        self.queue.put((path, text))
+
+    def close(self):
+        self.queue.put(None)
+        self.writer.join()
+
+    def run(self):
+        repair(self.path)
+        with open(self.path, "ab") as f:
+            dirty = False
+            while True:
+                try:
+                    item = self.queue.get(timeout=self.flush_interval if dirty else None)
+                except queue.Empty:
+                    item = ()
+                if item is None:
+                    break
+                if isinstance(item, bytes):
+                    f.write(item)
+                    dirty = True
+                elif item:
+                    write_atomic(*item)
+                if dirty and self.queue.empty():
+                    f.flush()
+                    os.fsync(f.fileno())
+                    dirty = False
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def parse(data):
+    """Yield (record, fields, end offset) for each record, stopping at the
+    first one that is truncated, unknown or has an invalid direction."""
+    offset = 0
+    while offset < len(data):
+        record = RECORDS.get(data[offset:offset + 1])
+        if record is None or offset + record.size > len(data):
+            return
+        fields = record.unpack_from(data, offset)
+        if record is MOVE and fields[1] >= len(DIRECTIONS):
+            return
+        offset += record.size
+        yield record, fields, offset
+
+
+def read_games(path=JOURNAL_FILE):
+    """Parse the journal into a list of games.
+
+    Each game is a dict with size, seed, time and an events list of
+    ('M', direction) and ('T', cell, exponent) tuples. Reading stops at
+    the first truncated or unknown record.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+    games = []
+    for record, fields, _ in parse(data):
+        if record is START:
+            games.append({'size': fields[1], 'seed': fields[2], 'time': fields[3], 'events': []})
+        elif games:
+            if record is MOVE:
+                games[-1]['events'].append(('M', DIRECTIONS[fields[1]]))
+            else:
+                games[-1]['events'].append(('T', fields[1], fields[2]))
+    return games
+
+
+def repair(path):
+    """Truncate the journal after its last complete record."""
+    try:
+        with open(path, "r+b") as f:
+            data = f.read()
+            end = 0
+            for _, _, end in parse(data):
+                pass
+            if end < len(data):
+                f.truncate(end)
+    except FileNotFoundError:
+        pass
+
+
+def make_engine(size):
+    if size == GRID_SIZE:
+        return Engine2048()
+    from numpy_engine import GridEngine
+    return GridEngine(size)
+
+
+def replay(game):
+    """Re-simulate a game, yielding the engine after every spawned tile."""
+    engine = make_engine(game['size'])
+    engine.clear()
+    for event in game['events']:
+        if event[0] == 'M':
+            engine.move(event[1], spawn=False)
+        else:
+            engine.place_tile(event[1], event[2])
+            yield engine
+
+
+def final_score(game):
+    engine = None
+    for engine in replay(game):
+        pass
+    return engine.score if engine else 0
+
+
+def best_scores(games):
+    best = {}
+    for game in games:
+        best[game['size']] = max(best.get(game['size'], 0), final_score(game))
+    return best
+
+
+def summary_file(size):
+    return "best_score.txt" if size == GRID_SIZE else f"best_score_{size}x{size}.txt"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect the 2048 session journal")
+    parser.add_argument('--path', default=JOURNAL_FILE)
+    parser.add_argument('--rebuild', action='store_true', help="rewrite the best score files from the journal")
+    args = parser.parse_args()
+
+    games = read_games(args.path)
+    for index, game in enumerate(games):
+        moves = sum(1 for event in game['events'] if event[0] == 'M')
+        started = time.strftime("%Y-%m-%d %H:%M", time.localtime(game['time']))
+        print(f"{index:>4}  {started}  {game['size']}x{game['size']}  {moves:>5} moves  score {final_score(game)}")
+    if args.rebuild:
+        for size, score in best_scores(games).items():
+            write_atomic(summary_file(size), str(score))
+            print(f"wrote {summary_file(size)}: {score}")
+
+
+if __name__ == '__main__':
+    main()
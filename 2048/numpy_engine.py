@@ -0,0 +1,174 @@
+"""Vectorized 2048 engine for N x N boards (3 <= N <= 8).
+
+Boards are uint8 arrays of tile exponents (0 = empty, 1 = 2, 2 = 4, ...)
+with shape (B, N, N). A move is applied to the whole batch at once: every
+direction is turned into a left move by flipping/transposing, then each
+row is compressed, merged and compressed again with NumPy operations. The
+only Python loop is over the N - 1 merge positions.
+"""
+import numpy as np
+
+MIN_SIZE = 3
+MAX_SIZE = 8
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+
+
+def orient(boards, direction):
+    """View the boards so that the move becomes a left move."""
+    if direction == "LEFT":
+        return boards
+    if direction == "RIGHT":
+        return boards[:, :, ::-1]
+    if direction == "UP":
+        return boards.transpose(0, 2, 1)
+    if direction == "DOWN":
+        return boards.transpose(0, 2, 1)[:, :, ::-1]
+    raise ValueError(f"unknown direction {direction!r}")
+
+
+def unorient(boards, direction):
+    """Undo orient()."""
+    if direction == "DOWN":
+        return boards[:, :, ::-1].transpose(0, 2, 1)
+    return orient(boards, direction)
+
+
+def compress(rows):
+    # Stable sort on "is empty" pushes the tiles left and keeps their order
+    order = np.argsort(rows == 0, axis=-1, kind='stable')
+    return np.take_along_axis(rows, order, axis=-1)
+
+
+def move_left(boards):
+    """Move a (B, N, N) batch left; return (new boards, score gained per board)."""
+    rows = compress(boards.reshape(-1, boards.shape[-1]))
+    scores = np.zeros(rows.shape[0], dtype=np.int64)
+    for k in range(rows.shape[1] - 1):
+        merge = (rows[:, k] == rows[:, k + 1]) & (rows[:, k] > 0)
+        rows[merge, k] += 1
+        rows[merge, k + 1] = 0
+        scores[merge] += np.left_shift(1, rows[merge, k].astype(np.int64))
+    rows = compress(rows)
+    return rows.reshape(boards.shape), scores.reshape(boards.shape[0], -1).sum(axis=1)
+
+
+def move_batch(boards, direction):
+    """Return (new boards, score gained, moved mask) for one direction."""
+    new_oriented, scores = move_left(np.ascontiguousarray(orient(boards, direction)))
+    new_boards = np.ascontiguousarray(unorient(new_oriented, direction))
+    moved = (new_boards != boards).any(axis=(1, 2))
+    return new_boards, scores, moved
+
+
+def legal_moves(boards):
+    """Return a (B, 4) mask of which DIRECTIONS change each board."""
+    return np.stack([move_batch(boards, d)[2] for d in DIRECTIONS], axis=1)
+
+
+def add_random_tiles(boards, rng, four_probability=0.1, mask=None):
+    """Spawn one tile on a random empty cell of every board (or those in mask), in place."""
+    flat = boards.reshape(boards.shape[0], -1)
+    empty = flat == 0
+    if mask is not None:
+        empty &= mask[:, None]
+    has_empty = empty.any(axis=1)
+    # argmax of uniform noise over the empty cells picks one of them uniformly
+    cells = np.argmax(rng.random(flat.shape) * empty, axis=1)
+    values = np.where(rng.random(flat.shape[0]) < four_probability, 2, 1).astype(boards.dtype)
+    index = np.nonzero(has_empty)[0]
+    flat[index, cells[index]] = values[index]
+    return boards
+
+
+def new_boards(count, size, rng, four_probability=0.1):
+    if not MIN_SIZE <= size <= MAX_SIZE:
+        raise ValueError(f"board size must be between {MIN_SIZE} and {MAX_SIZE}")
+    boards = np.zeros((count, size, size), dtype=np.uint8)
+    add_random_tiles(boards, rng, four_probability)
+    add_random_tiles(boards, rng, four_probability)
+    return boards
+
+
+def play_random_batch(count, size, rng, four_probability=0.1):
+    """Play count games with uniformly random legal moves, all boards in lockstep.
+
+    Returns (scores, max tiles, moves per game) as arrays.
+    """
+    boards = new_boards(count, size, rng, four_probability)
+    scores = np.zeros(count, dtype=np.int64)
+    moves = np.zeros(count, dtype=np.int32)
+    active = np.arange(count)
+    while len(active):
+        # Step only the games still running
+        batch = boards[active]
+        results = [move_batch(batch, d) for d in DIRECTIONS]
+        legal = np.stack([r[2] for r in results], axis=1)
+        alive = legal.any(axis=1)
+        choice = np.argmax(rng.random(legal.shape) * legal, axis=1)
+        for i, (moved_boards, gained, _) in enumerate(results):
+            pick = alive & (choice == i)
+            batch[pick] = moved_boards[pick]
+            scores[active[pick]] += gained[pick]
+        add_random_tiles(batch, rng, four_probability, alive)
+        boards[active] = batch
+        active = active[alive]
+        moves[active] += 1
+    max_tiles = np.left_shift(1, boards.reshape(count, -1).max(axis=1).astype(np.int64))
+    return scores, max_tiles, moves
+
+
+class GridEngine:
+    """One N x N game with the same interface as bitboard.Engine2048."""
+
+    def __init__(self, size, rng=None, four_probability=0.1, on_spawn=None):
+        self.size = size
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.four_probability = four_probability
+        self.on_spawn = on_spawn
+        self.reset()
+
+    def clear(self):
+        self.boards = np.zeros((1, self.size, self.size), dtype=np.uint8)
+        self.score = 0
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.clear()
+        self.add_new_tile()
+        self.add_new_tile()
+
+    def add_new_tile(self):
+        old_board = self.boards[0].copy()
+        add_random_tiles(self.boards, self.rng, self.four_probability)
+        if self.on_spawn:
+            for cell in np.flatnonzero(self.boards[0] != old_board):
+                self.on_spawn(int(cell), int(self.boards[0].flat[cell]))
+
+    def place_tile(self, cell, exponent):
+        self.boards[0].flat[cell] = exponent
+
+    def move(self, direction, spawn=True):
+        new, gained, moved = move_batch(self.boards, direction)
+        if not moved[0]:
+            return False
+        self.boards = new
+        self.score += int(gained[0])
+        if spawn:
+            self.add_new_tile()
+        return True
+
+    def is_game_over(self):
+        return not legal_moves(self.boards)[0].any()
+
+    @property
+    def board(self):
+        return self.boards[0].tobytes()
+
+    @property
+    def grid(self):
+        return [[1 << int(e) if e else 0 for e in row] for row in self.boards[0]]
+
+    @property
+    def max_tile(self):
+        return 1 << int(self.boards.max())
@@ -0,0 +1,136 @@
+"""Headless mass simulation of 2048 games.
+
+Each worker process plays its share of games with its own seeded RNG (the
+worker seeds are spawned from one --seed, so a run is reproducible for a
+given worker count). Per-game score, max tile and move count are collected
+into NumPy arrays and written to a compressed .npz file.
+"""
+import argparse
+import os
+import random
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from bitboard import DIRECTIONS, Engine2048, GRID_SIZE, move
+from expectimax import ExpectimaxAI
+from numpy_engine import play_random_batch
+
+
+def random_strategy():
+    def choose(board, rng):
+        legal = [d for d in DIRECTIONS if move(board, d)[0] != board]
+        return rng.choice(legal) if legal else None
+    return choose
+
+
+def expectimax_strategy(depth):
+    ai = ExpectimaxAI(depth=depth)
+    return lambda board, rng: ai.best_move(board)
+
+
+STRATEGIES = ('random', 'expectimax')
+# Boards other than 4x4 are stepped by numpy_engine, which only plays randomly
+ANY_SIZE_STRATEGIES = ('random',)
+
+
+def play_games(task):
+    """Play one worker's share of games and return its per-game columns."""
+    games, seed, strategy, depth, four_probability, size = task
+    if size != GRID_SIZE:
+        # Other board sizes are stepped as one batch
+        return play_random_batch(games, size, np.random.default_rng(seed), four_probability)
+    rng = random.Random(seed)
+    choose = expectimax_strategy(depth) if strategy == 'expectimax' else random_strategy()
+    scores = np.zeros(games, dtype=np.int64)
+    max_tiles = np.zeros(games, dtype=np.int32)
+    moves = np.zeros(games, dtype=np.int32)
+    for game in range(games):
+        engine = Engine2048(rng, four_probability)
+        count = 0
+        while True:
+            direction = choose(engine.board, rng)
+            if direction is None:
+                break
+            engine.move(direction)
+            count += 1
+        scores[game] = engine.score
+        max_tiles[game] = engine.max_tile
+        moves[game] = count
+    return scores, max_tiles, moves
+
+
+def simulate(games, workers, seed, strategy, depth=1, four_probability=0.1, size=GRID_SIZE):
+    if strategy not in STRATEGIES:
+        raise ValueError(f"unknown strategy {strategy!r}")
+    if size != GRID_SIZE and strategy not in ANY_SIZE_STRATEGIES:
+        raise ValueError(f"strategy {strategy!r} only plays {GRID_SIZE}x{GRID_SIZE} boards")
+    seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(workers)]
+    shares = [games // workers + (1 if i < games % workers else 0) for i in range(workers)]
+    tasks = [(share, s, strategy, depth, four_probability, size) for share, s in zip(shares, seeds) if share]
+    with Pool(len(tasks)) as pool:
+        results = pool.map(play_games, tasks)
+    return {
+        'scores': np.concatenate([r[0] for r in results]),
+        'max_tiles': np.concatenate([r[1] for r in results]),
+        'moves': np.concatenate([r[2] for r in results]),
+        'worker': np.concatenate([np.full(len(r[0]), i, dtype=np.int16) for i, r in enumerate(results)]),
+    }
+
+
+def summarize(results):
+    scores = results['scores']
+    moves = results['moves']
+    tiles, counts = np.unique(results['max_tiles'], return_counts=True)
+    print(f"games: {len(scores)}")
+    p10, p50, p90 = np.percentile(scores, [10, 50, 90])
+    print(f"score: mean {scores.mean():.0f}, p10 {p10:.0f}, median {p50:.0f}, p90 {p90:.0f}, max {scores.max()}")
+    print(f"moves per game: mean {moves.mean():.1f}, max {moves.max()}")
+    print("max tile histogram:")
+    for tile, count in zip(tiles, counts):
+        print(f"  {tile:>6}: {count:>8} ({100 * count / len(scores):.1f}%)")
+    return tiles, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate many 2048 games headless")
+    parser.add_argument('--games', type=int, default=1000, help="total games")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--strategy', choices=STRATEGIES, default='random')
+    parser.add_argument('--depth', type=int, default=1, help="search depth for expectimax")
+    parser.add_argument('--four-probability', type=float, default=0.1, help="chance a spawned tile is a 4")
+    parser.add_argument('--size', type=int, default=GRID_SIZE, help="board size (random strategy only when not 4)")
+    parser.add_argument('--output', default='simulation.npz')
+    args = parser.parse_args()
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.size != GRID_SIZE and args.strategy not in ANY_SIZE_STRATEGIES:
+        parser.error(f"board sizes other than 4 only support --strategy {', '.join(ANY_SIZE_STRATEGIES)}")
+
+    workers = args.workers or os.cpu_count()
+    start = time.perf_counter()
+    results = simulate(args.games, workers, args.seed, args.strategy, args.depth, args.four_probability, args.size)
+    elapsed = time.perf_counter() - start
+    tiles, counts = summarize(results)
+    print(f"{len(results['scores']) / elapsed:.1f} games/s, {results['moves'].sum() / elapsed:.0f} moves/s")
+
+    np.savez_compressed(
+        args.output,
+        max_tile_values=tiles,
+        max_tile_counts=counts,
+        strategy=args.strategy,
+        depth=args.depth,
+        seed=args.seed,
+        four_probability=args.four_probability,
+        size=args.size,
+        **results,
+    )
+    print(f"wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+import random
+
+import numpy as np
+
+import bitboard
+import numpy_engine
+from bitboard import DIRECTIONS
+
+
+def slide_left(row, max_tile):
+    # The plain list version of a 2048 move, tile values rather than exponents
+    tiles = [value for value in row if value]
+    merged, score = [], 0
+    while tiles:
+        if len(tiles) > 1 and tiles[0] == tiles[1] and tiles[0] < max_tile:
+            merged.append(tiles[0] * 2)
+            score += tiles[0] * 2
+            tiles = tiles[2:]
+        else:
+            merged.append(tiles.pop(0))
+    return merged + [0] * (len(row) - len(merged)), score
+
+
+def reference_move(grid, direction, max_tile=float('inf')):
+    # Turn the board so the move is a left move, and back again
+    if direction in ("UP", "DOWN"):
+        grid = [list(column) for column in zip(*grid)]
+    if direction in ("RIGHT", "DOWN"):
+        grid = [row[::-1] for row in grid]
+    rows, score = [], 0
+    for row in grid:
+        row, gained = slide_left(row, max_tile)
+        rows.append(row)
+        score += gained
+    if direction in ("RIGHT", "DOWN"):
+        rows = [row[::-1] for row in rows]
+    if direction in ("UP", "DOWN"):
+        rows = [list(column) for column in zip(*rows)]
+    return rows, score
+
+
+def random_grid(rng, size, max_exponent=11):
+    # Few distinct values, so most boards have merges in every direction
+    return [[1 << rng.randint(1, max_exponent) if rng.random() < 0.7 else 0
+             for _ in range(size)] for _ in range(size)]
+
+
+def test_bitboard_moves_match_the_reference():
+    rng = random.Random(1)
+    for _ in range(2000):
+        grid = random_grid(rng, 4, rng.choice([3, 11, 15]))
+        board = bitboard.encode(grid)
+        assert bitboard.decode(board) == grid
+        for direction in DIRECTIONS:
+            new_board, score = bitboard.move(board, direction)
+            # A nibble holds exponents up to 15, so 32768 tiles don't merge
+            assert (bitboard.decode(new_board), score) == reference_move(grid, direction, 1 << 15)
+
+
+def test_numpy_moves_match_the_reference():
+    rng = random.Random(2)
+    for size in range(numpy_engine.MIN_SIZE, numpy_engine.MAX_SIZE + 1):
+        grids = [random_grid(rng, size, rng.choice([3, 11])) for _ in range(200)]
+        exponents = np.array([[[value.bit_length() - 1 if value else 0 for value in row] for row in grid]
+                              for grid in grids], dtype=np.uint8)
+        for direction in DIRECTIONS:
+            boards, scores, moved = numpy_engine.move_batch(exponents, direction)
+            for i, grid in enumerate(grids):
+                expected, score = reference_move(grid, direction)
+                assert [[1 << int(e) if e else 0 for e in row] for row in boards[i]] == expected
+                assert scores[i] == score
+                assert moved[i] == (expected != grid)
+
+
+def test_engines_play_the_same_game():
+    bit = bitboard.Engine2048()
+    grid = numpy_engine.GridEngine(4)
+    rng = random.Random(3)
+    for _ in range(50):
+        bit.reset(rng.getrandbits(32))
+        grid.clear()
+        for cell in range(16):
+            grid.place_tile(cell, (bit.board >> (4 * cell)) & 0xF)
+        while not bit.is_game_over():
+            assert not grid.is_game_over()
+            direction = rng.choice(DIRECTIONS)
+            moved = bit.move(direction, spawn=False)
+            assert grid.move(direction, spawn=False) == moved
+            assert grid.grid == bit.grid and grid.score == bit.score
+            if moved:
+                bit.add_new_tile()
+                cell = ((bit.board ^ bitboard.encode(grid.grid)).bit_length() - 1) // 4
+                grid.place_tile(cell, (bit.board >> (4 * cell)) & 0xF)
+        assert grid.is_game_over()
@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+
+from bitboard import DIRECTIONS, Engine2048, add_random_tile, move
+from expectimax import ExpectimaxAI, heuristic, heuristic_all, transpose_all
+
+
+def reference_chance(board, depth, probability, min_probability):
+    # The search node by node, with every 4 spawn kept
+    if depth <= 0 or probability < min_probability:
+        return heuristic(board)
+    empty = [4 * i for i in range(16) if not (board >> (4 * i)) & 0xF]
+    if not empty:
+        return heuristic(board)
+    total = 0.0
+    for shift in empty:
+        for tile, chance in ((1, 0.9), (2, 0.1)):
+            spawned = board | (tile << shift)
+            moved = [move(spawned, d)[0] for d in DIRECTIONS]
+            total += chance * max([reference_chance(m, depth - 1, probability * chance / len(empty), min_probability)
+                                   for m in moved if m != spawned] or [0.0])
+    return total / len(empty)
+
+
+def random_board(rng, tiles):
+    board = 0
+    for _ in range(tiles):
+        board = add_random_tile(board, rng)
+        board = move(board, rng.choice(DIRECTIONS))[0]
+    return board
+
+
+def test_batched_search_matches_the_node_by_node_search():
+    rng = random.Random(1)
+    for min_probability in (0.0, 0.001):
+        ai = ExpectimaxAI(depth=3, min_probability=min_probability, four_cutoff=0.0)
+        for _ in range(10):
+            board = random_board(rng, rng.randint(8, 40))
+            boards = np.array([board], dtype=np.uint64)
+            for depth in (0, 1, 2):
+                expected = reference_chance(board, depth, 1.0, min_probability)
+                assert abs(ai.chance_nodes(boards, depth, np.ones(1))[0] - expected) < 1e-9 * expected
+
+
+def test_heuristic_ignores_transposition():
+    rng = random.Random(2)
+    boards = np.array([random_board(rng, 30) for _ in range(50)], dtype=np.uint64)
+    # Rows and columns swap places, so only the order of the additions changes
+    assert np.allclose(heuristic_all(boards), heuristic_all(transpose_all(boards)), rtol=1e-12)
+    assert np.allclose(heuristic_all(boards), [heuristic(int(b)) for b in boards], rtol=1e-12)
+
+
+def test_plays_legal_moves_to_the_end():
+    ai = ExpectimaxAI(depth=2)
+    engine = Engine2048(random.Random(3))
+    while True:
+        direction = ai.best_move(engine.board)
+        if direction is None:
+            break
+        assert engine.move(direction)
+    assert engine.is_game_over()
+    assert engine.max_tile >= 512
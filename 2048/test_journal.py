@@ -0,0 +1,103 @@
+import importlib.util
+import os
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from journal import DIRECTIONS, Journal, MOVE, read_games, replay
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_game_module():
+    # 2048.py can't be imported by name
+    spec = importlib.util.spec_from_file_location('game2048', os.path.join(HERE, '2048.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def play(game, rng, moves):
+    for _ in range(moves):
+        if game.game_over:
+            break
+        game.move(rng.choice(['UP', 'DOWN', 'LEFT', 'RIGHT']))
+
+
+def final_grid(game_record):
+    engine = None
+    for engine in replay(game_record):
+        pass
+    return engine.grid
+
+
+def test_journaled_games_replay_to_the_played_boards(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    module = load_game_module()
+    rng = random.Random(1)
+    game = module.Game2048()
+    played = []
+    for size in (5, 4, 3):
+        play(game, rng, 40)
+        played.append((game.size, game.grid))
+        game.set_size(size)
+    play(game, rng, 40)
+    played.append((game.size, game.grid))
+    game.journal.close()
+
+    games = read_games()
+    assert [(g['size'], final_grid(g)) for g in games] == played
+    for g in games:
+        assert all(event[1] < g['size'] ** 2 for event in g['events'] if event[0] == 'T')
+
+
+def write_game(path, seed, moves):
+    journal = Journal(str(path))
+    journal.start_game(4, seed)
+    journal.spawn(0, 1)
+    journal.spawn(5, 1)
+    for direction in moves:
+        journal.move(direction)
+    journal.close()
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / 'journal.bin'
+    write_game(path, 7, ['LEFT', 'UP'])
+    write_game(path, 8, ['DOWN'])
+    games = read_games(str(path))
+    assert [g['seed'] for g in games] == [7, 8]
+    assert games[0]['events'] == [('T', 0, 1), ('T', 5, 1), ('M', 'LEFT'), ('M', 'UP')]
+
+
+def test_torn_tail_is_cut_before_the_next_session(tmp_path):
+    path = tmp_path / 'journal.bin'
+    write_game(path, 7, ['LEFT'])
+    with open(path, 'ab') as f:
+        f.write(MOVE.pack(b'M', 0)[:1])  # crash halfway through a record
+    write_game(path, 8, ['RIGHT'])
+    games = read_games(str(path))
+    assert [g['seed'] for g in games] == [7, 8]
+    assert games[1]['events'][-1] == ('M', 'RIGHT')
+
+
+def test_invalid_direction_stops_reading(tmp_path):
+    path = tmp_path / 'journal.bin'
+    write_game(path, 7, ['LEFT'])
+    with open(path, 'ab') as f:
+        f.write(MOVE.pack(b'M', len(DIRECTIONS)))
+    assert [g['seed'] for g in read_games(str(path))] == [7]
+
+
+def test_best_score_is_kept_in_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'best_score.txt').write_text('100')
+    module = load_game_module()
+    game = module.Game2048(record=False)
+    assert game.best_score == 100
+    game.best_score = 5000
+    game.save_best_score()
+    # A stale summary file must not win over what this run already knows
+    (tmp_path / 'best_score.txt').write_text('100')
+    game.reset_game()
+    assert game.best_score == 5000
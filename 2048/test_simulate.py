@@ -0,0 +1,15 @@
+import pytest
+
+from simulate import simulate
+
+
+def test_strategies_reject_board_sizes_they_cannot_play():
+    with pytest.raises(ValueError):
+        simulate(10, 1, 0, 'expectimax', size=5)
+    with pytest.raises(ValueError):
+        simulate(10, 1, 0, 'greedy')
+
+
+def test_random_play_runs_on_other_sizes():
+    results = simulate(4, 1, 0, 'random', size=5)
+    assert len(results['scores']) == 4 and results['max_tiles'].min() >= 4
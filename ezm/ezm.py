@@ -3,14 +3,22 @@ import sys
 import pygame
 import time
 import json
+import log
 from maze import Maze
+from flow_field import FlowField
+from maze_registry import registry
+from maze_pool import MazePool
+from maze_cache import daily_seed, maze_id, seeded_maze
+from mazegen import ALGORITHMS
+from profiler import FrameProfiler
 import random
 import importlib.util
-import execjs
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv('ezm.env')
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'warning')
+log.configure(LOG_LEVEL)
 
 # Update the getenv function to use os.getenv directly
 def getenv(key, default):
@@ -39,11 +47,26 @@ MAX_MAZE_WIDTH = int(getenv('MAX_MAZE_WIDTH', '99'))
 MIN_ZOMBIE_DELAY = int(getenv('MIN_ZOMBIE_DELAY', '1'))
 MAX_ZOMBIE_DELAY = int(getenv('MAX_ZOMBIE_DELAY', '9'))
 TILE_SIZE = int(getenv('TILE_SIZE', '32'))
+# Gameplay is simulated in fixed steps, independent of the frame rate
+SIMULATION_STEP = 1 / 30
+MAX_FRAME_TIME = 0.25  # longer stalls are not caught up
+FPS = 60
+# Mazes that don't fit at this cell size scroll with the player instead
+MIN_CELL_SIZE = int(getenv('MIN_CELL_SIZE', '6'))
+# Walls are pre-rendered into chunks of about this many pixels a side,
+# and at most MAX_WALL_CHUNKS of them are kept
+CHUNK_PIXELS = 256
+MAX_WALL_CHUNKS = 96
 
 MAP_WIDTH = int(getenv('MAP_WIDTH', '800'))
 MAP_HEIGHT = int(getenv('MAP_HEIGHT', '600'))
 
 MAX_ZOMBIES = int(getenv('MAX_ZOMBIES', '2'))
+# Large mazes get one more zombie per this many open cells, so a 999x999 maze
+# holds a horde of about 250
+ZOMBIE_CELLS = int(getenv('ZOMBIE_CELLS', '2000'))
+# Zombies never spawn closer to the player than this many steps
+ZOMBIE_SPAWN_DISTANCE = int(getenv('ZOMBIE_SPAWN_DISTANCE', '3'))
 
 # Default settings
 DEFAULT_MAZE_WIDTH = int(getenv('DEFAULT_MAZE_WIDTH', '29'))
@@ -53,6 +76,26 @@ DEFAULT_ZOMBIE_SPEED_FAST = getenv('DEFAULT_ZOMBIE_SPEED_FAST', 'True').lower()
 DEFAULT_ZOMBIE_SPAWNING_ENABLED = getenv('DEFAULT_ZOMBIE_SPAWNING_ENABLED', 'True').lower() == 'true'
 DEFAULT_GENERATION_ALGORITHM = getenv('DEFAULT_GENERATION_ALGORITHM', 'recursive_division')
 DEFAULT_PLAYER_NAME = getenv('DEFAULT_PLAYER_NAME', 'Mario')
+# random: wander; pursuit: follow the flow field to the player; mixed: half of them pursue
+ZOMBIE_BEHAVIORS = ['random', 'pursuit', 'mixed']
+DEFAULT_ZOMBIE_BEHAVIOR = getenv('DEFAULT_ZOMBIE_BEHAVIOR', 'random')
+# 'native' uses mazegen.py; 'js' runs mazeai/*.js through PyExecJS
+MAZE_BACKEND = getenv('MAZE_BACKEND', 'native')
+# Frame-time overlay, toggled with F9; F10 dumps the recorded frames to CSV
+PROFILE = getenv('PROFILE', 'False').lower() == 'true'
+# Mazes are pre-generated in this many worker processes while the player is
+# on the welcome or game-over screen; 0 turns the pool off
+MAZE_POOL_WORKERS = int(getenv('MAZE_POOL_WORKERS', '1'))
+# At most this many mazes, and this many cells in total, are held ready
+MAZE_POOL_SIZE = int(getenv('MAZE_POOL_SIZE', '2'))
+MAZE_POOL_CELLS = int(getenv('MAZE_POOL_CELLS', '4000000'))
+# A seed makes the maze reproducible; the daily maze is the same for everyone on a given UTC day
+MAX_SEED_DIGITS = 12
+DAILY_MAZE_WIDTH = int(getenv('DAILY_MAZE_WIDTH', '39'))
+DAILY_MAZE_HEIGHT = int(getenv('DAILY_MAZE_HEIGHT', '39'))
+# Scores are kept per seeded maze or per algorithm and size for random mazes,
+# for this many of the most recently played boards besides the classic one
+MAX_LEADERBOARD_MAZES = 100
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, pos):
@@ -67,9 +110,10 @@ class Player(pygame.sprite.Sprite):
         self.image.fill(YELLOW)  # Change color when sword is collected
 
 class Zombie(pygame.sprite.Sprite):
-    def __init__(self, grid_pos):
+    def __init__(self, grid_pos, pursuer=False):
         super().__init__()
         self.grid_position = grid_pos  # (row, col)
+        self.pursuer = pursuer
         self.target_grid_position = self.grid_position
         self.move_progress = 0
         self.move_duration = 1  # 1 second per tile
@@ -105,8 +149,18 @@ class Game:
         self.offset_x = self.margin
         self.offset_y = self.margin
         self.cell_size = None
-
-        self.leaderboard = self.load_leaderboard()
+        self.viewport = None
+        self.wall_chunks = {}
+        self.chunk_key = None
+        self.sprite_cache = {}
+        self.flow_field = None
+        self.profiler = FrameProfiler(PROFILE)
+        self.maze_pool = MazePool(MAZE_POOL_WORKERS, MAZE_POOL_SIZE, MAZE_POOL_CELLS, LOG_LEVEL)
+        self.behavior_rect = None
+        self.daily_rect = None
+
+        self.leaderboards = self.load_leaderboard()
+        self.leaderboard = []  # scores for the maze just played
         self.maze = None
         self.player_position = None
         self.zombies = pygame.sprite.Group()
@@ -122,11 +176,8 @@ class Game:
         self.font = pygame.font.Font(None, int(min(self.screen_width, self.screen_height) * 0.03))
         self.title_font = pygame.font.Font(None, int(min(self.screen_width, self.screen_height) * 0.05))
 
-        self.ZOMBIE_UPDATE_EVENT = pygame.USEREVENT + 1
-        pygame.time.set_timer(self.ZOMBIE_UPDATE_EVENT, 200)  # Update every 200ms
-
         self.state = "welcome"
-        print(f"Game initialized. Initial state: {self.state}")
+        log.debug("Game initialized. Initial state: %s", self.state)
         self.settings = {
             "maze_width": int(DEFAULT_MAZE_WIDTH),
             "maze_height": int(DEFAULT_MAZE_HEIGHT),
@@ -134,15 +185,18 @@ class Game:
             "zombie_speed_fast": DEFAULT_ZOMBIE_SPEED_FAST,
             "zombie_spawning_enabled": DEFAULT_ZOMBIE_SPAWNING_ENABLED,
             "generation_algorithm": DEFAULT_GENERATION_ALGORITHM,
+            "zombie_behavior": DEFAULT_ZOMBIE_BEHAVIOR,
             "show_trail": False,
-            "show_solution": False
+            "show_solution": False,
+            "seed": ""  # empty for a fresh random maze every game
         }
         self.player_name = getenv('DEFAULT_PLAYER_NAME', 'Mario')
         self.input_boxes = {
             "player": pygame.Rect(0, 0, 200, 32),
             "maze_width": pygame.Rect(0, 0, 60, 32),
             "maze_height": pygame.Rect(0, 0, 60, 32),
-            "zombie_delay": pygame.Rect(0, 0, 60, 32)
+            "zombie_delay": pygame.Rect(0, 0, 60, 32),
+            "seed": pygame.Rect(0, 0, 140, 32)
         }
         self.active_input = "player"  # Set initial active input to player name
 
@@ -177,7 +231,7 @@ class Game:
         self.zombie_move_time = 0
         self.zombie_move_delay = 1  # Adjust this value to change zombie speed (higher = slower)
 
-        self.maze_algorithms = {}
+        self.maze_algorithms = []
         self.load_maze_algorithms()
         self.current_algorithm = 'backtracking'  # Default algorithm
 
@@ -185,8 +239,8 @@ class Game:
         self.show_solution = False
         self.solution_color = (255, 215, 0)  # Gold color for solution
 
-        print(f"Initial generation algorithm: {self.settings['generation_algorithm']}")
-        print(f"Initial game state: {self.state}")  # Add this line
+        log.debug("Initial generation algorithm: %s", self.settings['generation_algorithm'])
+        log.debug("Initial game state: %s", self.state)  # Add this line
 
         # Load asset images for the welcome screen
         self.sword_welcome_image = pygame.image.load(os.path.join("assets", "sword.jpg")).convert_alpha()
@@ -201,140 +255,162 @@ class Game:
         self.player_with_sword_welcome_image = pygame.transform.smoothscale(self.player_with_sword_welcome_image, welcome_image_size)
         self.zombie_welcome_image = pygame.transform.smoothscale(self.zombie_welcome_image, welcome_image_size)
 
-        # Draw the welcome screen immediately
-        self.draw_welcome_screen()
-        pygame.display.flip()
+        self.needs_redraw = True
 
         self.last_zombie_spawn_time = time.time()
 
     def load_leaderboard(self):
+        # Scores are kept per maze id; the old single list becomes the "classic" board
         try:
             with open('leaderboard.json', 'r') as f:
-                return json.load(f)
+                boards = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
-            return []
+            return {}
+        return {"classic": boards} if isinstance(boards, list) else boards
 
     def load_maze_algorithms(self):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        algorithm_dir = os.path.join(current_dir, "mazeai")
-        print(f"Searching for algorithms in directory: {algorithm_dir}")
-        for filename in os.listdir(algorithm_dir):
-            if filename.endswith('.js'):
-                algorithm_name = filename[:-3].replace('-', '_')  # Remove .js and replace - with _
-                file_path = os.path.join(algorithm_dir, filename)
-                with open(file_path, 'r') as file:
-                    js_code = file.read()
-                try:
-                    ctx = execjs.compile(js_code)
-                    self.maze_algorithms[algorithm_name] = ctx
-                except Exception as e:
-                    print(f"Error loading algorithm {algorithm_name}: {str(e)}")
-                    print(f"JavaScript code causing the error:\n{js_code}")
-        print(f"Loaded algorithms: {list(self.maze_algorithms.keys())}")
+        # The registry compiles JS algorithms once per process and Maze reuses them
+        self.maze_algorithms = registry.available(MAZE_BACKEND)
+        log.info("Loaded algorithms: %s", self.maze_algorithms)
 
     def change_algorithm(self, algorithm_name):
         if algorithm_name in self.maze_algorithms:
             self.settings["generation_algorithm"] = algorithm_name
         else:
-            print(f"Algorithm {algorithm_name} not found.")
+            log.warning("Algorithm %s not found.", algorithm_name)
 
     # Game initialization and state management
     def start_game(self):
         errors = self.validate_settings()
         if errors:
-            print("Invalid settings:")
+            log.warning("Invalid settings:")
             for error in errors:
-                print(error)
+                log.warning("%s", error)
             return
         
-        print(f"Available algorithms: {list(self.maze_algorithms.keys())}")
-        max_attempts = 5
-        for attempt in range(max_attempts):
-            try:
-                algorithm = self.settings["generation_algorithm"]
-                print(f"Attempting to use algorithm: {algorithm}")
-                self.maze = Maze(self.settings["maze_height"], self.settings["maze_width"], algorithm)
-                if self.maze.solution:
-                    print(f"Maze generated successfully on attempt {attempt + 1}")
-                    break
-                else:
-                    raise ValueError("Generated maze has no solution")
-            except Exception as e:
-                print(f"Error generating maze (attempt {attempt + 1}): {str(e)}")
+        log.debug("Available algorithms: %s", self.maze_algorithms)
+        self.maze = self.maze_pool.take(self.maze_key())
+        if self.maze:
+            log.debug("Using pre-generated maze")
+        elif self.maze_pool.building(self.maze_key()):
+            # The run loop polls the pool and calls begin_game once it is built
+            self.state = "loading"
+            log.debug("Waiting for the background maze")
+            return
         else:
-            print(f"Failed to generate a valid maze after {max_attempts} attempts. Using fallback method.")
-            self.maze = Maze(self.settings["maze_height"], self.settings["maze_width"], "fallback")
+            self.maze = self.generate_maze()
+        self.begin_game()
 
+    def poll_loading(self):
+        self.maze = self.maze_pool.take(self.maze_key())
+        if self.maze:
+            self.begin_game()
+        elif not self.maze_pool.building(self.maze_key()):
+            # The background job failed, so build it here
+            self.maze = self.generate_maze()
+            self.begin_game()
+
+    def begin_game(self):
         # Only proceed if maze generation was successful
         if self.maze:
             self.player_position = self.maze.in_point
-            print(f"Initial player position: {self.player_position}")
+            # Built with the maze, so the first zombie tick doesn't pay for the BFS
+            self.flow_field = None
+            if self.settings["zombie_behavior"] != "random":
+                self.flow_field = FlowField(self.maze)
+                self.flow_field.update(self.player_position)
+            log.debug("Initial player position: %s", self.player_position)
             self.zombies = pygame.sprite.Group()
             self.player_path = [self.player_position]
             self.tentative_path = []
             self.game_finished = False
             self.game_message = ""
             self.state = "playing"
-            print(f"Game started. New state: {self.state}")
+            log.info("Game started. New state: %s", self.state)
             self.zombie_spawn_start_time = time.time() + self.settings["zombie_delay"]
-            print(f"Zombie spawn start time set to: {self.zombie_spawn_start_time}")
+            log.debug("Zombie spawn start time set to: %s", self.zombie_spawn_start_time)
             self.zombies_vanquished = 0
             self.calculate_maze_dimensions()
             self.spawn_sword()
             self.sword_collected = False  # Reset sword collection status
-            print(f"Sword spawned at {self.sword_position}")
-            self.update_zombie_timer()
+            log.debug("Sword spawned at %s", self.sword_position)
             self.player_sprite = Player(self.player_position)
             self.spawn_initial_zombies()  # New method to spawn initial zombies
         else:
-            print("Maze generation failed. Returning to welcome screen.")
+            log.warning("Maze generation failed. Returning to welcome screen.")
             self.state = "welcome"
-            print(f"State changed to: {self.state}")
+            log.debug("State changed to: %s", self.state)
             self.zombie_spawn_start_time = None
 
-        print(f"Zombie spawning enabled: {self.settings['zombie_spawning_enabled']}")
-        print(f"Zombie delay: {self.settings['zombie_delay']}")
-        print(f"Max zombies: {MAX_ZOMBIES}")
+        log.debug("Zombie spawning enabled: %s", self.settings['zombie_spawning_enabled'])
+        log.debug("Zombie delay: %s", self.settings['zombie_delay'])
+        log.debug("Zombies: %s", self.zombie_count() if self.maze else 0)
 
         self.last_zombie_spawn_time = time.time()
 
+    def maze_key(self):
+        # Seeded mazes always come from the native generators, the JS ones can't be seeded
+        seed = int(self.settings["seed"]) if self.settings["seed"] else None
+        return (self.settings["maze_height"], self.settings["maze_width"],
+                self.settings["generation_algorithm"], MAZE_BACKEND if seed is None else 'native', seed)
+
+    def generate_maze(self):
+        if self.settings["seed"]:
+            return seeded_maze(self.settings["maze_height"], self.settings["maze_width"],
+                               self.settings["generation_algorithm"], int(self.settings["seed"]))
+        max_attempts = 5
+        for attempt in range(max_attempts):
+            try:
+                algorithm = self.settings["generation_algorithm"]
+                log.debug("Attempting to use algorithm: %s", algorithm)
+                maze = Maze(self.settings["maze_height"], self.settings["maze_width"], algorithm, MAZE_BACKEND)
+                if maze.solution:
+                    log.debug("Maze generated successfully on attempt %s", attempt + 1)
+                    return maze
+                else:
+                    raise ValueError("Generated maze has no solution")
+            except Exception as e:
+                log.warning("Error generating maze (attempt %s): %s", attempt + 1, e)
+        log.warning("Failed to generate a valid maze after %s attempts. Using fallback method.", max_attempts)
+        return Maze(self.settings["maze_height"], self.settings["maze_width"], "fallback", MAZE_BACKEND)
+
     def spawn_sword(self):
-        empty_cells = [(r, c) for r in range(self.maze.rows) for c in range(self.maze.cols) 
-                       if self.maze.grid[r][c] == 0 and (r, c) != self.player_position
-                       and (r, c) != self.maze.out_point]
-        if empty_cells:
-            self.sword_position = random.choice(empty_cells)
-            print(f"Sword spawned at {self.sword_position}")
+        self.sword_position = self.maze.random_open_cell(exclude={self.player_position, self.maze.out_point})
+        if self.sword_position:
+            log.debug("Sword spawned at %s", self.sword_position)
         else:
-            print("No empty cells available for sword spawning")
+            log.warning("No empty cells available for sword spawning")
+
+    def zombie_count(self):
+        return max(MAX_ZOMBIES, len(self.maze.open_cells) // ZOMBIE_CELLS)
 
     def spawn_initial_zombies(self):
-        for _ in range(MAX_ZOMBIES):
+        for _ in range(self.zombie_count()):
             new_pos = self.get_random_empty_position()
             if new_pos:
-                new_zombie = Zombie(new_pos)
+                new_zombie = self.create_zombie(new_pos)
                 self.zombies.add(new_zombie)
-                print(f"Initial zombie spawned at grid position: {new_pos}")
+                log.debug("Initial zombie spawned at grid position: %s", new_pos)
             else:
-                print("No empty position found for zombie spawning")
+                log.warning("No empty position found for zombie spawning")
+
+    def create_zombie(self, grid_pos):
+        behavior = self.settings["zombie_behavior"]
+        pursuer = behavior == "pursuit" or (behavior == "mixed" and random.random() < 0.5)
+        return Zombie(grid_pos, pursuer)
 
     def spawn_zombies(self):
         # This method is now empty or can be removed
         pass
 
-    def update_zombie_timer(self):
-        interval = int(self.settings["zombie_delay"] * 1000 * (0.5 if self.settings["zombie_speed_fast"] else 1))
-        pygame.time.set_timer(self.ZOMBIE_UPDATE_EVENT, interval)
-
     def game_over(self, message):
         self.state = "game_over"
-        print(f"Game over. New state: {self.state}")
+        log.info("Game over. New state: %s", self.state)
         self.game_message = message
         score = self.calculate_score()
         if self.player_position == self.maze.out_point:  # Success scenario
             score *= 2  # Double the score for successful escape
         self.update_leaderboard(score)
-        self.draw_score_board()
 
     # Drawing methods
     def draw(self):
@@ -352,14 +428,17 @@ class Game:
                 error_surface = self.font.render(error_text, True, RED)
                 error_rect = error_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
                 self.screen.blit(error_surface, error_rect)
+        elif self.state == "loading":
+            loading_surface = self.font.render("Building maze...", True, BLACK)
+            loading_rect = loading_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
+            self.screen.blit(loading_surface, loading_rect)
         elif self.state == "game_over":
             self.draw_score_board()
 
         # Draw custom cursor
         mouse_pos = pygame.mouse.get_pos()
+        self.profiler.draw(self.screen, self.font)
         self.screen.blit(self.cursor, (mouse_pos[0] - 7, mouse_pos[1] - 7))
-        
-        pygame.display.flip()
 
     def draw_welcome_screen(self):
         self.screen.fill(BLACK)
@@ -434,7 +513,7 @@ class Game:
         for i, (image, label) in enumerate(images):
             x = rules_pane.x + 10 + i * (welcome_image_size[0] + image_spacing)
             y = images_start_y
-            self.screen.blit(pygame.transform.smoothscale(image, welcome_image_size), (x, y))
+            self.screen.blit(self.scaled_sprite(image, welcome_image_size), (x, y))
             label_surface = self.font.render(label, True, WHITE)
             label_rect = label_surface.get_rect(center=(x + welcome_image_size[0] // 2, y + welcome_image_size[1] + 20))
             self.screen.blit(label_surface, label_rect)
@@ -485,6 +564,31 @@ class Game:
             ("Show Solution", "show_solution", "F4")
         ]
 
+        behavior_text = self.font.render(f"Zombie AI: {self.settings.get('zombie_behavior', 'random')}", True, WHITE)
+        self.behavior_rect = behavior_text.get_rect(topleft=(controls_pane.x + controls_pane.width // 2, y))
+        self.screen.blit(behavior_text, self.behavior_rect)
+        pygame.draw.rect(self.screen, WHITE, self.behavior_rect.inflate(10, 10), 1)
+        behavior_key = self.font.render("Press F6 to change", True, LIGHT_GRAY)
+        self.screen.blit(behavior_key, (self.behavior_rect.x, y + 30))
+
+        # Seed and daily maze share the right-hand column with the zombie AI button
+        seed_x = self.behavior_rect.x
+        seed_label = self.font.render("Seed:", True, WHITE)
+        self.screen.blit(seed_label, (seed_x, y + 75))
+        seed_box = self.input_boxes["seed"]
+        seed_box.topleft = (seed_x + seed_label.get_width() + 10, y + 70)
+        pygame.draw.rect(self.screen, YELLOW if self.active_input == "seed" else LIGHT_GRAY, seed_box, 2)
+        self.screen.blit(self.font.render(self.settings["seed"], True, WHITE), (seed_box.x + 5, seed_box.y + 5))
+        seed_hint = self.font.render("Empty for a random maze", True, LIGHT_GRAY)
+        self.screen.blit(seed_hint, (seed_x, y + 110))
+
+        daily_text = self.font.render("Daily Maze", True, WHITE)
+        self.daily_rect = daily_text.get_rect(topleft=(seed_x, y + 150))
+        self.screen.blit(daily_text, self.daily_rect)
+        pygame.draw.rect(self.screen, WHITE, self.daily_rect.inflate(10, 10), 1)
+        daily_key = self.font.render("Press F7 to load", True, LIGHT_GRAY)
+        self.screen.blit(daily_key, (seed_x, y + 180))
+
         for text, setting, key in toggle_settings:
             toggle_text = f"{text}: {'ON' if self.settings.get(setting, False) else 'OFF'}"
             toggle_surface = self.font.render(toggle_text, True, WHITE)
@@ -509,8 +613,8 @@ class Game:
         self.screen.blit(start_text, start_rect)
 
         # Add this print statement at the end of the method
-        print(f"End of draw_welcome_screen. Active input is: {self.active_input}")
-        print(f"Current player name: {self.player_name}")
+        log.debug("End of draw_welcome_screen. Active input is: %s", self.active_input)
+        log.debug("Current player name: %s", self.player_name)
 
     def draw_legend(self):
         legend_x = self.screen_width - self.legend_width
@@ -541,10 +645,14 @@ class Game:
         if self.state == "playing" and self.maze:
             info_text = [
                 f"Maze Size: {self.maze.rows}x{self.maze.cols}",
+                f"Maze Seed: {self.maze.seed if self.maze.seed is not None else 'none'}",
                 f"Solution Length: {self.maze.get_solution_length()}",
+                f"Distance to Exit: {self.maze.distance_to_exit(self.player_position)}",
+                f"Generated In: {self.maze.generation_seconds * 1000:.0f} ms",
                 f"Zombie Delay: {self.settings.get('zombie_delay', 0)}s",
                 f"Zombie Speed: {'Fast' if self.settings.get('zombie_speed_fast', False) else 'Slow'}",
                 f"Spawning: {'ON' if self.settings.get('zombie_spawning_enabled', False) else 'OFF'}",
+                f"Zombie AI: {self.settings.get('zombie_behavior', 'random')}",
                 f"Sword: {'Collected' if self.sword_collected else 'Not Collected'}",
                 f"Zombies Vanquished: {self.zombies_vanquished}",
                 f"Show Trail: {'ON' if self.settings.get('show_trail', False) else 'OFF'}",
@@ -562,72 +670,144 @@ class Game:
         if not self.maze or self.cell_size is None:
             return  # Don't try to draw if maze doesn't exist or cell_size is not set
 
-        self.calculate_maze_dimensions()  # Ensure cell_size is set
-
-        maze_rect = pygame.Rect(self.offset_x, self.offset_y, 
-                               self.cell_size * self.maze.cols, 
-                               self.cell_size * self.maze.rows)
-        pygame.draw.rect(self.screen, WHITE, maze_rect)
-        pygame.draw.rect(self.screen, BLACK, maze_rect, 2)  # Border
-
-        for row in range(self.maze.rows):
-            for col in range(self.maze.cols):
-                x = self.offset_x + col * self.cell_size
-                y = self.offset_y + row * self.cell_size
-                cell_rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
-
-                if self.maze.is_wall(row, col):
-                    pygame.draw.rect(self.screen, BLACK, cell_rect)
-
-        # Draw IN point
-        in_rect = pygame.Rect(self.offset_x + self.maze.in_point[1] * self.cell_size,
-                              self.offset_y + self.maze.in_point[0] * self.cell_size,
-                              self.cell_size, self.cell_size)
-        pygame.draw.rect(self.screen, self.in_color, in_rect)
-        
-        # Draw OUT point
-        out_rect = pygame.Rect(self.offset_x + self.maze.out_point[1] * self.cell_size,
-                               self.offset_y + self.maze.out_point[0] * self.cell_size,
-                               self.cell_size, self.cell_size)
-        pygame.draw.rect(self.screen, self.out_color, out_rect)
+        self.calculate_maze_dimensions()  # Ensure cell_size is set and the camera follows the player
+
+        show_solution = self.settings.get('show_solution', False)
+        chunk_key = (self.maze, self.cell_size, show_solution)
+        if chunk_key != self.chunk_key:
+            self.chunk_key = chunk_key
+            self.wall_chunks = {}
+            self.chunk_cells = max(1, CHUNK_PIXELS // self.cell_size)
+            self.solution_index = {cell: i for i, cell in enumerate(self.maze.solution)} if show_solution else {}
+
+        # Only the chunks overlapping the viewport are blitted
+        self.screen.set_clip(self.viewport)
+        top, bottom, left, right = self.visible_cells()
+        chunk_px = self.chunk_cells * self.cell_size
+        for chunk_row in range(top // self.chunk_cells, bottom // self.chunk_cells + 1):
+            for chunk_col in range(left // self.chunk_cells, right // self.chunk_cells + 1):
+                self.screen.blit(self.wall_chunk(chunk_row, chunk_col),
+                                 (self.offset_x + chunk_col * chunk_px, self.offset_y + chunk_row * chunk_px))
 
         # Draw the sword if not collected
-        if not self.sword_collected and self.sword_position:
+        if not self.sword_collected and self.sword_position and self.is_cell_visible(self.sword_position):
             sword_x = self.offset_x + self.sword_position[1] * self.cell_size
             sword_y = self.offset_y + self.sword_position[0] * self.cell_size
-            scaled_sword = pygame.transform.smoothscale(self.sword_image, (self.cell_size, self.cell_size))
+            scaled_sword = self.scaled_sprite(self.sword_image)
             self.screen.blit(scaled_sword, (sword_x, sword_y))
 
-        # Draw solution if enabled
-        if self.settings.get('show_solution', False) and self.maze.solution:
-            solution_points = [(self.offset_x + col * self.cell_size + self.cell_size // 2,
-                                self.offset_y + row * self.cell_size + self.cell_size // 2)
-                               for row, col in self.maze.solution]
-            pygame.draw.lines(self.screen, self.solution_color, False, solution_points, 2)
-
         # Draw player trail if enabled
         if self.settings.get('show_trail', False) and len(self.player_path) > 1:
-            trail_points = [(self.offset_x + col * self.cell_size + self.cell_size // 2,
-                             self.offset_y + row * self.cell_size + self.cell_size // 2)
-                            for row, col in self.player_path]
-            pygame.draw.lines(self.screen, self.trail_color, False, trail_points, 2)
+            self.draw_path(self.player_path, self.trail_color)
 
         # Draw zombies
         for zombie in self.zombies:
             pos = zombie.get_current_position()
+            if not self.is_cell_visible((int(pos[0]), int(pos[1]))):
+                continue
             zombie_x = self.offset_x + pos[1] * self.cell_size
             zombie_y = self.offset_y + pos[0] * self.cell_size
-            scaled_zombie = pygame.transform.smoothscale(self.zombie_image, (self.cell_size, self.cell_size))
+            scaled_zombie = self.scaled_sprite(self.zombie_image)
             self.screen.blit(scaled_zombie, (zombie_x, zombie_y))
 
+        self.screen.set_clip(None)
+        pygame.draw.rect(self.screen, BLACK, self.viewport, 2)  # Border
+
+    def wall_chunk(self, chunk_row, chunk_col):
+        key = (chunk_row, chunk_col)
+        chunk = self.wall_chunks.pop(key, None)
+        if chunk is None:
+            chunk = self.render_wall_chunk(chunk_row, chunk_col)
+            if len(self.wall_chunks) >= MAX_WALL_CHUNKS:
+                del self.wall_chunks[next(iter(self.wall_chunks))]
+        # Re-insert so the least recently used chunk is always first
+        self.wall_chunks[key] = chunk
+        return chunk
+
+    def render_wall_chunk(self, chunk_row, chunk_col):
+        cell = self.cell_size
+        first_row, first_col = chunk_row * self.chunk_cells, chunk_col * self.chunk_cells
+        last_row = min(self.maze.rows, first_row + self.chunk_cells)
+        last_col = min(self.maze.cols, first_col + self.chunk_cells)
+        chunk = pygame.Surface(((last_col - first_col) * cell, (last_row - first_row) * cell))
+        chunk.fill(WHITE)
+
+        # One rect per horizontal run of wall cells
+        for row in range(first_row, last_row):
+            cells = self.maze.grid[row]
+            y = (row - first_row) * cell
+            col = first_col
+            while col < last_col:
+                if cells[col]:
+                    start = col
+                    while col < last_col and cells[col]:
+                        col += 1
+                    chunk.fill(BLACK, ((start - first_col) * cell, y, (col - start) * cell, cell))
+                else:
+                    col += 1
+
+        for point, color in ((self.maze.in_point, self.in_color), (self.maze.out_point, self.out_color)):
+            if first_row <= point[0] < last_row and first_col <= point[1] < last_col:
+                chunk.fill(color, ((point[1] - first_col) * cell, (point[0] - first_row) * cell, cell, cell))
+
+        # Solution segments from each cell's centre towards its neighbours on the path
+        solution = self.maze.solution
+        for row in range(first_row, last_row):
+            for col in range(first_col, last_col):
+                i = self.solution_index.get((row, col))
+                if i is None:
+                    continue
+                center = ((col - first_col) * cell + cell // 2, (row - first_row) * cell + cell // 2)
+                for j in (i - 1, i + 1):
+                    if 0 <= j < len(solution):
+                        end = (center[0] + (solution[j][1] - col) * (cell - cell // 2),
+                               center[1] + (solution[j][0] - row) * (cell - cell // 2))
+                        pygame.draw.line(chunk, self.solution_color, center, end, 2)
+        return chunk
+
+    def visible_cells(self):
+        """(top, bottom, left, right) cell range inside the viewport, inclusive."""
+        top = max(0, (self.viewport.top - self.offset_y) // self.cell_size)
+        bottom = min(self.maze.rows - 1, (self.viewport.bottom - 1 - self.offset_y) // self.cell_size)
+        left = max(0, (self.viewport.left - self.offset_x) // self.cell_size)
+        right = min(self.maze.cols - 1, (self.viewport.right - 1 - self.offset_x) // self.cell_size)
+        return top, bottom, left, right
+
+    def is_cell_visible(self, cell):
+        top, bottom, left, right = self.visible_cells()
+        return top - 1 <= cell[0] <= bottom + 1 and left - 1 <= cell[1] <= right + 1
+
+    def draw_path(self, path, color):
+        # Only the runs of the path near the viewport are drawn
+        top, bottom, left, right = self.visible_cells()
+        run = []
+        for row, col in path + [(None, None)]:
+            if row is not None and top - 1 <= row <= bottom + 1 and left - 1 <= col <= right + 1:
+                run.append((self.offset_x + col * self.cell_size + self.cell_size // 2,
+                            self.offset_y + row * self.cell_size + self.cell_size // 2))
+                continue
+            if len(run) > 1:
+                pygame.draw.lines(self.screen, color, False, run, 2)
+            run = []
+
     def draw_player(self):
         if self.player_position:
             player_x = self.offset_x + self.player_position[1] * self.cell_size
             player_y = self.offset_y + self.player_position[0] * self.cell_size
             player_image = self.player_with_sword_image if self.sword_collected else self.player_image
-            scaled_player = pygame.transform.smoothscale(player_image, (self.cell_size, self.cell_size))
+            scaled_player = self.scaled_sprite(player_image)
             self.screen.blit(scaled_player, (player_x, player_y))
 
+    def scaled_sprite(self, image, size=None):
+        # Scaled copies are kept until the cell size changes or the window is resized
+        size = size or (self.cell_size, self.cell_size)
+        key = (image, size)
+        sprite = self.sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.transform.smoothscale(image, size)
+            self.sprite_cache[key] = sprite
+        return sprite
+
     def draw_score_board(self):
         # Dark background
         self.screen.fill((20, 20, 20))  # Very dark gray
@@ -650,8 +830,12 @@ class Game:
         leaderboard_title = self.title_font.render("Leaderboard", True, GREEN)  # Changed to GREEN
         leaderboard_title_rect = leaderboard_title.get_rect(center=(self.screen_width // 2, 150))
         self.screen.blit(leaderboard_title, leaderboard_title_rect)
+        algorithm, rows, cols, seed = self.maze.key
+        seed_text = f"seed {seed}" if self.settings["seed"] else "random mazes"
+        maze_text = self.font.render(f"{algorithm} {rows}x{cols}, {seed_text}", True, LIGHT_GRAY)
+        self.screen.blit(maze_text, maze_text.get_rect(center=(self.screen_width // 2, 180)))
 
-        y = 200
+        y = 215
         for i, (name, score) in enumerate(self.leaderboard[:10], 1):
             if i == 1:
                 color = (255, 215, 0)  # Gold
@@ -688,13 +872,21 @@ class Game:
 
     # Event handling methods
     def handle_welcome_click(self, pos):
-        print(f"Welcome click at position: {pos}")
+        log.debug("Welcome click at position: %s", pos)
         for setting, box in self.input_boxes.items():
             if box.collidepoint(pos):
                 self.active_input = setting
-                print(f"Activated input box: {setting}")
+                log.debug("Activated input box: %s", setting)
                 return
 
+        # The zombie AI button sits next to the toggles, so handle it first
+        if self.behavior_rect and self.behavior_rect.inflate(10, 10).collidepoint(pos):
+            self.cycle_zombie_behavior()
+            return
+        if self.daily_rect and self.daily_rect.inflate(10, 10).collidepoint(pos):
+            self.load_daily_maze()
+            return
+
         # Check for clicks on toggle buttons
         y = self.input_boxes["zombie_delay"].bottom + 20
         toggle_settings = [
@@ -706,108 +898,122 @@ class Game:
         for setting, key in toggle_settings:
             if pygame.Rect(self.input_boxes["player"].left, y, 200, 30).collidepoint(pos):
                 self.settings[setting] = not self.settings.get(setting, False)
-                print(f"Toggled {setting}: {self.settings[setting]}")
+                log.debug("Toggled %s: %s", setting, self.settings[setting])
                 break
             y += 70
 
         # Check for click on algorithm change button
         if pygame.Rect(self.input_boxes["player"].left, y, 200, 30).collidepoint(pos):
-            algorithms = list(self.maze_algorithms.keys())
+            algorithms = self.maze_algorithms
             current_index = algorithms.index(self.settings.get("generation_algorithm", algorithms[0]))
             next_index = (current_index + 1) % len(algorithms)
             self.settings["generation_algorithm"] = algorithms[next_index]
-            print(f"Changed algorithm to: {self.settings['generation_algorithm']}")
+            log.debug("Changed algorithm to: %s", self.settings['generation_algorithm'])
 
         # Check for click on start game button
         start_button_rect = pygame.Rect(self.screen_width // 2 - 100, self.screen_height - 50, 200, 40)
         if start_button_rect.collidepoint(pos):
-            print("Current settings before starting game:")
+            log.debug("Current settings before starting game:")
             for key, value in self.settings.items():
-                print(f"{key}: {value}")
+                log.debug("%s: %s", key, value)
             errors = self.validate_settings()
             if not errors:
-                print("Starting game...")
+                log.debug("Starting game...")
                 self.start_game()
-                self.state = "playing"  # Immediately change the state
-                print(f"Game started. New state: {self.state}")
+                log.debug("Game started. New state: %s", self.state)
             else:
-                print("Invalid settings. Please check and try again.")
+                log.warning("Invalid settings. Please check and try again.")
                 for error in errors:
-                    print(error)
-
-        self.draw_welcome_screen()
-        pygame.display.flip()
+                    log.warning("%s", error)
 
     def handle_welcome_keydown(self, event):
-        print(f"Welcome keydown: {pygame.key.name(event.key)}")
+        log.debug("Welcome keydown: %s", pygame.key.name(event.key))
         if event.key == pygame.K_ESCAPE:
-            print("Escape key pressed on welcome screen. Quitting the game.")
+            log.info("Escape key pressed on welcome screen. Quitting the game.")
             pygame.quit()
             sys.exit()
         elif event.key == pygame.K_RETURN:
-            print("Current settings before starting game:")
+            log.debug("Current settings before starting game:")
             for key, value in self.settings.items():
-                print(f"{key}: {value}")
+                log.debug("%s: %s", key, value)
             errors = self.validate_settings()
             if not errors:
-                print("Starting game...")
+                log.debug("Starting game...")
                 self.start_game()
-                self.state = "playing"  # Immediately change the state
-                print(f"Game started. New state: {self.state}")
+                log.debug("Game started. New state: %s", self.state)
             else:
-                print("Invalid settings. Please check and try again.")
+                log.warning("Invalid settings. Please check and try again.")
                 for error in errors:
-                    print(error)
+                    log.warning("%s", error)
         elif event.key == pygame.K_TAB:
             # Cycle through input boxes
             input_boxes = list(self.input_boxes.keys())
             current_index = input_boxes.index(self.active_input) if self.active_input else -1
             self.active_input = input_boxes[(current_index + 1) % len(input_boxes)]
-            print(f"Active input changed to: {self.active_input}")
+            log.debug("Active input changed to: %s", self.active_input)
         elif event.key == pygame.K_F1:
             self.settings["zombie_speed_fast"] = not self.settings.get("zombie_speed_fast", False)
-            print(f"Zombie speed toggled: {'fast' if self.settings['zombie_speed_fast'] else 'normal'}")
+            log.debug("Zombie speed toggled: %s", 'fast' if self.settings['zombie_speed_fast'] else 'normal')
         elif event.key == pygame.K_F2:
             self.settings["zombie_spawning_enabled"] = not self.settings.get("zombie_spawning_enabled", False)
-            print(f"Zombie spawning toggled: {'enabled' if self.settings['zombie_spawning_enabled'] else 'disabled'}")
+            log.debug("Zombie spawning toggled: %s", 'enabled' if self.settings['zombie_spawning_enabled'] else 'disabled')
         elif event.key == pygame.K_F3:
             self.settings["show_trail"] = not self.settings.get("show_trail", False)
-            print(f"Trail display toggled: {'enabled' if self.settings['show_trail'] else 'disabled'}")
+            log.debug("Trail display toggled: %s", 'enabled' if self.settings['show_trail'] else 'disabled')
         elif event.key == pygame.K_F4:
             self.settings["show_solution"] = not self.settings.get("show_solution", False)
-            print(f"Solution display toggled: {'enabled' if self.settings['show_solution'] else 'disabled'}")
+            log.debug("Solution display toggled: %s", 'enabled' if self.settings['show_solution'] else 'disabled')
         elif event.key == pygame.K_F5:
-            algorithms = list(self.maze_algorithms.keys())
+            algorithms = self.maze_algorithms
             current_index = algorithms.index(self.settings.get("generation_algorithm", algorithms[0]))
             next_index = (current_index + 1) % len(algorithms)
             self.settings["generation_algorithm"] = algorithms[next_index]
-            print(f"Changed algorithm to: {self.settings['generation_algorithm']}")
+            log.debug("Changed algorithm to: %s", self.settings['generation_algorithm'])
+        elif event.key == pygame.K_F6:
+            self.cycle_zombie_behavior()
+        elif event.key == pygame.K_F7:
+            self.load_daily_maze()
         elif event.key == pygame.K_BACKSPACE:
             if self.active_input == "player":
                 self.player_name = self.player_name[:-1]
+            elif self.active_input == "seed":
+                self.settings["seed"] = self.settings["seed"][:-1]
             elif self.active_input in ["maze_width", "maze_height", "zombie_delay"]:
                 current_value = str(self.settings[self.active_input])
                 self.settings[self.active_input] = int(current_value[:-1]) if current_value[:-1] else 0
         elif event.unicode.isprintable():
             if self.active_input == "player":
                 self.player_name += event.unicode
+            elif self.active_input == "seed":
+                if event.unicode.isdigit() and len(self.settings["seed"]) < MAX_SEED_DIGITS:
+                    self.settings["seed"] += event.unicode
             elif self.active_input in ["maze_width", "maze_height", "zombie_delay"]:
                 current_value = str(self.settings[self.active_input])
                 new_value = current_value + event.unicode
                 if new_value.isdigit():
                     self.settings[self.active_input] = int(new_value)
 
-        print(f"After input processing:")
-        print(f"Active input: {self.active_input}")
-        print(f"Player name: {self.player_name}")
-        print(f"Settings: {self.settings}")
+        log.debug("After input processing:")
+        log.debug("Active input: %s", self.active_input)
+        log.debug("Player name: %s", self.player_name)
+        log.debug("Settings: %s", self.settings)
+
+        log.debug("End of handle_welcome_keydown. Active input is now: %s", self.active_input)
+        log.debug("Current player name: %s", self.player_name)
 
-        # Redraw the welcome screen to reflect changes
-        self.draw_welcome_screen()
-        pygame.display.flip()
+    def load_daily_maze(self):
+        seed = daily_seed()
+        self.settings["maze_width"] = DAILY_MAZE_WIDTH
+        self.settings["maze_height"] = DAILY_MAZE_HEIGHT
+        self.settings["generation_algorithm"] = list(ALGORITHMS)[seed % len(ALGORITHMS)]
+        self.settings["seed"] = str(seed)
+        log.debug("Daily maze: %s", self.settings)
 
-        print(f"End of handle_welcome_keydown. Active input is now: {self.active_input}")
-        print(f"Current player name: {self.player_name}")
+    def cycle_zombie_behavior(self):
+        current = self.settings.get("zombie_behavior", ZOMBIE_BEHAVIORS[0])
+        index = ZOMBIE_BEHAVIORS.index(current) if current in ZOMBIE_BEHAVIORS else -1
+        self.settings["zombie_behavior"] = ZOMBIE_BEHAVIORS[(index + 1) % len(ZOMBIE_BEHAVIORS)]
+        log.debug("Zombie behavior changed to: %s", self.settings['zombie_behavior'])
 
     def replay_game(self):
         # Reset game state
@@ -820,27 +1026,96 @@ class Game:
         
         # Start a new game with the same settings
         self.start_game()
-        print(f"Game replayed. New state: {self.state}")
-
-    def update_gameplay(self):
-        events = pygame.event.get()
-        for event in events:
-            if event.type == pygame.QUIT:
+        log.info("Game replayed. New state: %s", self.state)
+
+    # Main loop
+    def run(self):
+        accumulator = 0.0
+        previous = time.perf_counter()
+        running = True
+        while running:
+            # Static screens sleep until something happens
+            events = [] if self.state in ("playing", "loading") else [pygame.event.wait()]
+            self.profiler.start_frame()
+            events += pygame.event.get()
+            for event in events:
+                if not self.handle_event(event):
+                    running = False
+                    break
+            if not running:
+                break
+            self.profiler.mark('event')
+
+            now = time.perf_counter()
+            if self.state == "playing" and self.maze:
+                accumulator += min(now - previous, MAX_FRAME_TIME)
+                while accumulator >= SIMULATION_STEP and self.state == "playing":
+                    self.simulate(SIMULATION_STEP)
+                    accumulator -= SIMULATION_STEP
+            elif self.state == "loading":
+                self.poll_loading()
+                self.needs_redraw = True
+            else:
+                accumulator = 0.0
+                # Build the next maze in the background while the player is on a menu
+                if not self.validate_settings():
+                    self.maze_pool.prefetch(self.maze_key())
+            previous = now
+            self.profiler.mark('update')
+
+            if self.needs_redraw or self.is_animating() or self.profiler.active:
+                self.draw()
+                self.profiler.mark('draw')
+                pygame.display.flip()
+                self.profiler.mark('flip')
+                self.needs_redraw = False
+            self.profiler.end_frame()
+            if self.state in ("playing", "loading"):
+                self.clock.tick(FPS)
+        self.maze_pool.shutdown()
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            log.info("Quit event detected")
+            return False
+        if event.type == pygame.VIDEORESIZE:
+            self.handle_resize(event.size)
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+            self.profiler.toggle()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+            log.info("Frame profile written to %s", self.profiler.dump())
+        elif event.type == pygame.KEYDOWN:
+            if self.state == "welcome" and event.key == pygame.K_ESCAPE:
+                log.info("Escape key pressed on welcome screen. Quitting the game.")
                 return False
-            elif event.type == pygame.KEYDOWN:
+            elif self.state == "welcome":
+                self.handle_welcome_keydown(event)
+            elif self.state == "playing":
                 self.handle_keystroke(event.key)
+            elif self.state == "game_over":
+                self.handle_game_over_keydown(event)
+            elif self.state == "loading" and event.key == pygame.K_ESCAPE:
+                self.state = "welcome"
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if self.state == "welcome":
+                self.handle_welcome_click(event.pos)
+        # Input, mouse moves (the cursor is drawn by hand) and window events all show on screen
+        self.needs_redraw = True
+        return True
 
+    def simulate(self, dt):
+        """One fixed step of zombie decisions, movement and collisions."""
+        before = (self.state, [zombie.grid_position for zombie in self.zombies])
         self.move_zombies()
-        dt = self.clock.get_time() / 1000
         for zombie in self.zombies:
             zombie.update(dt)
+        self.check_zombie_collisions()
+        if before != (self.state, [zombie.grid_position for zombie in self.zombies]):
+            self.needs_redraw = True
 
-        self.check_zombie_collisions()  # Add this line
-
-        self.draw()
-        pygame.display.flip()
-        self.clock.tick(60)
-        return True
+    def is_animating(self):
+        return self.state == "playing" and any(zombie.grid_position != zombie.target_grid_position
+                                               for zombie in self.zombies)
 
     def handle_resize(self, size):
         self.screen_width, self.screen_height = size
@@ -852,7 +1127,9 @@ class Game:
         self.offset_y = self.margin
         self.font = pygame.font.Font(None, int(min(self.screen_width, self.screen_height) * 0.03))
         self.title_font = pygame.font.Font(None, int(min(self.screen_width, self.screen_height) * 0.05))
-        self.calculate_maze_dimensions()
+        self.sprite_cache = {}
+        if self.maze:
+            self.calculate_maze_dimensions()
 
     # Helper methods
     def round_to_odd(self, value, min_value, max_value):
@@ -906,21 +1183,30 @@ class Game:
         return all(self.maze.get_valid_neighbors(cell) for cell in path)
 
     def move_zombies(self):
+        if any(zombie.pursuer for zombie in self.zombies):
+            # One shared field; only changes when the player changes cell
+            self.flow_field.update(self.player_position)
+
         for zombie in self.zombies:
             if zombie.grid_position == zombie.target_grid_position:
-                possible_moves = [
-                    (zombie.grid_position[0] - 1, zombie.grid_position[1]),
-                    (zombie.grid_position[0] + 1, zombie.grid_position[1]),
-                    (zombie.grid_position[0], zombie.grid_position[1] - 1),
-                    (zombie.grid_position[0], zombie.grid_position[1] + 1)
-                ]
-                valid_moves = [move for move in possible_moves 
-                               if not self.maze.is_wall(*move) 
-                               and move != self.maze.in_point 
-                               and move != self.maze.out_point]
-                
-                if valid_moves:
-                    new_pos = random.choice(valid_moves)
+                new_pos = self.flow_field.next_step(zombie.grid_position) if zombie.pursuer else None
+                if new_pos in (self.maze.in_point, self.maze.out_point):
+                    new_pos = None
+                if new_pos is None:
+                    possible_moves = [
+                        (zombie.grid_position[0] - 1, zombie.grid_position[1]),
+                        (zombie.grid_position[0] + 1, zombie.grid_position[1]),
+                        (zombie.grid_position[0], zombie.grid_position[1] - 1),
+                        (zombie.grid_position[0], zombie.grid_position[1] + 1)
+                    ]
+                    valid_moves = [move for move in possible_moves 
+                                   if not self.maze.is_wall(*move) 
+                                   and move != self.maze.in_point 
+                                   and move != self.maze.out_point]
+                    if valid_moves:
+                        new_pos = random.choice(valid_moves)
+
+                if new_pos:
                     zombie.move_to(new_pos)
                     
                     # Check for collision immediately after moving
@@ -931,16 +1217,15 @@ class Game:
         if self.sword_collected:
             self.zombies.remove(zombie)
             self.zombies_vanquished += 1
-            print(f"Zombie vanquished! Total vanquished: {self.zombies_vanquished}")
+            log.info("Zombie vanquished! Total vanquished: %s", self.zombies_vanquished)
         else:
             self.game_over("Game over! You were caught by a zombie.")
 
     def get_random_empty_position(self):
-        empty_cells = [(r, c) for r in range(self.maze.rows) for c in range(self.maze.cols)
-                       if self.maze.grid[r][c] == 0 and (r, c) != self.player_position
-                       and (r, c) != self.maze.out_point and (r, c) != self.sword_position
-                       and (r, c) != self.maze.in_point]
-        return random.choice(empty_cells) if empty_cells else None
+        reserved = {self.player_position, self.maze.out_point, self.sword_position, self.maze.in_point}
+        reserved.update(zombie.grid_position for zombie in self.zombies)
+        return self.maze.random_open_cell(exclude=reserved, origin=self.player_position,
+                                          min_distance=ZOMBIE_SPAWN_DISTANCE)
 
     def calculate_score(self):
         if not self.settings.get("zombie_spawning_enabled", False):
@@ -951,47 +1236,35 @@ class Game:
         speed_factor = 2 if self.settings.get("zombie_speed_fast", False) else 1
         return int(maze_difficulty * zombie_time_factor * speed_factor)
 
-    def update_static_screen(self):
-        redraw_needed = False
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                print("Quit event detected")
-                return False
-            elif event.type == pygame.KEYDOWN:
-                if self.state == "welcome" and event.key == pygame.K_ESCAPE:
-                    print("Escape key pressed on welcome screen. Quitting the game.")
-                    return False
-                elif self.state == "welcome":
-                    self.handle_welcome_keydown(event)
-                    redraw_needed = True
-                elif self.state == "game_over":
-                    self.handle_game_over_keydown(event)
-                    redraw_needed = True
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if self.state == "welcome":
-                    self.handle_welcome_click(event.pos)
-                    redraw_needed = True
-
-        if redraw_needed:
-            self.draw()
-            pygame.display.flip()
-            print(f"Current state: {self.state}, Active input: {self.active_input}, Player name: {self.player_name}")
-
-        return True
-
     # Leaderboard methods
+    def leaderboard_id(self):
+        # Seeded and daily mazes can be replayed, so each gets its own board;
+        # random mazes share one board per algorithm and size
+        algorithm, rows, cols, _ = self.maze.key
+        if self.settings["seed"]:
+            return maze_id(self.maze.key)
+        return f"{algorithm}-{rows}x{cols}"
+
     def update_leaderboard(self, score):
-        self.leaderboard.append((self.player_name, score))
-        self.leaderboard.sort(key=lambda x: x[1], reverse=True)
-        self.leaderboard = self.leaderboard[:10]
+        board_id = self.leaderboard_id()
+        board = self.leaderboards.pop(board_id, [])
+        board.append((self.player_name, score))
+        board.sort(key=lambda x: x[1], reverse=True)
+        self.leaderboard = board[:10]
+        # Re-inserted last, so the least recently played mazes are dropped first
+        self.leaderboards[board_id] = self.leaderboard
+        # The classic board holds the scores from before boards were per maze
+        while len(self.leaderboards) > MAX_LEADERBOARD_MAZES:
+            oldest = next(board for board in self.leaderboards if board != "classic")
+            del self.leaderboards[oldest]
         self.save_leaderboard()
 
     def save_leaderboard(self):
         try:
             with open('leaderboard.json', 'w') as f:
-                json.dump(self.leaderboard, f)
+                json.dump(self.leaderboards, f)
         except IOError:
-            print("Error saving leaderboard.")
+            log.error("Error saving leaderboard.")
 
     def calculate_maze_dimensions(self):
         available_width = self.maze_area_width
@@ -1000,20 +1273,38 @@ class Game:
         cell_width = available_width // self.maze.cols
         cell_height = available_height // self.maze.rows
 
-        self.cell_size = min(cell_width, cell_height)
+        cell_size = max(MIN_CELL_SIZE, min(cell_width, cell_height))
+        if cell_size != self.cell_size:
+            self.sprite_cache = {}
+        self.cell_size = cell_size
 
         total_maze_width = self.cell_size * self.maze.cols
         total_maze_height = self.cell_size * self.maze.rows
 
-        self.offset_x = self.margin + (available_width - total_maze_width) // 2
-        self.offset_y = self.margin + (available_height - total_maze_height) // 2
+        # The viewport is the maze itself when it fits, else the whole maze area
+        view_width = min(available_width, total_maze_width)
+        view_height = min(available_height, total_maze_height)
+        self.viewport = pygame.Rect(self.margin + (available_width - view_width) // 2,
+                                    self.margin + (available_height - view_height) // 2,
+                                    view_width, view_height)
+
+        # Camera centred on the player, clamped to the maze edges; it is
+        # folded into the offsets so cell-to-screen maths stays the same
+        camera_x = camera_y = 0
+        if self.player_position:
+            camera_x = (self.player_position[1] * self.cell_size + self.cell_size // 2) - view_width // 2
+            camera_y = (self.player_position[0] * self.cell_size + self.cell_size // 2) - view_height // 2
+        camera_x = max(0, min(total_maze_width - view_width, camera_x))
+        camera_y = max(0, min(total_maze_height - view_height, camera_y))
+        self.offset_x = self.viewport.x - camera_x
+        self.offset_y = self.viewport.y - camera_y
 
     # Main game loop
     def handle_events(self):
         events = pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
-                print("Quit event detected")
+                log.info("Quit event detected")
                 return False
             elif event.type == pygame.KEYDOWN:
                 if self.state == "welcome":
@@ -1025,20 +1316,19 @@ class Game:
         return True
 
     def handle_keystroke(self, key):
-        print(f"Keystroke in playing state: {pygame.key.name(key)}")
+        log.debug("Keystroke in playing state: %s", pygame.key.name(key))
         if self.state != "playing" or not self.maze:
-            print("Not in playing state or maze not generated")
+            log.debug("Not in playing state or maze not generated")
             return
 
         if key == pygame.K_ESCAPE:
-            print("Escaping to welcome screen")
+            log.debug("Escaping to welcome screen")
             self.state = "welcome"
-            self.draw_welcome_screen()
             return
 
         current_time = time.time()
         if current_time - self.last_move_time < self.move_delay:
-            print("Move ignored due to delay")
+            log.debug("Move ignored due to delay")
             return
 
         move = {
@@ -1058,11 +1348,11 @@ class Game:
                 self.player_path.append(new_pos)
                 self.update_valid_moves()
                 self.last_move_time = current_time
-                print(f"Player moved to: {new_pos}")
+                log.debug("Player moved to: %s", new_pos)
 
                 if self.player_position == self.sword_position and not self.sword_collected:
                     self.sword_collected = True
-                    print("Sword collected!")
+                    log.info("Sword collected!")
 
                 self.check_zombie_collisions()  # Check for collisions after movement
 
@@ -1071,23 +1361,21 @@ class Game:
                     self.game_over("Congratulations! You've escaped the maze!")
                     return
             else:
-                print("Move blocked by wall")
+                log.debug("Move blocked by wall")
         elif key == pygame.K_F3:
             self.settings["show_trail"] = not self.settings.get("show_trail", False)
-            print(f"Trail display toggled: {'enabled' if self.settings['show_trail'] else 'disabled'}")
+            log.debug("Trail display toggled: %s", 'enabled' if self.settings['show_trail'] else 'disabled')
         elif key == pygame.K_F4:
             self.settings["show_solution"] = not self.settings.get("show_solution", False)
-            print(f"Solution display toggled: {'enabled' if self.settings['show_solution'] else 'disabled'}")
+            log.debug("Solution display toggled: %s", 'enabled' if self.settings['show_solution'] else 'disabled')
         elif key == pygame.K_F2:
             self.settings["zombie_spawning_enabled"] = not self.settings.get("zombie_spawning_enabled", False)
-            print(f"Zombie spawning toggled: {'enabled' if self.settings['zombie_spawning_enabled'] else 'disabled'}")
+            log.debug("Zombie spawning toggled: %s", 'enabled' if self.settings['zombie_spawning_enabled'] else 'disabled')
         elif key == pygame.K_F1:
             self.settings["zombie_speed_fast"] = not self.settings.get("zombie_speed_fast", False)
-            self.update_zombie_timer()
-            print(f"Zombie speed toggled: {'fast' if self.settings['zombie_speed_fast'] else 'normal'}")
+            log.debug("Zombie speed toggled: %s", 'fast' if self.settings['zombie_speed_fast'] else 'normal')
 
-        print("Current settings:", self.settings)
-        self.draw()  # Redraw the game after each action
+        log.debug("Current settings: %s", self.settings)
 
     def check_zombie_collisions(self):
         for zombie in self.zombies:
@@ -1097,60 +1385,18 @@ class Game:
 
     def handle_game_over_keydown(self, event):
         if event.key == pygame.K_RETURN:
-            print("Replaying game")
+            log.debug("Replaying game")
             self.replay_game()
         elif event.key == pygame.K_ESCAPE:
-            print("Changing state to welcome")
+            log.debug("Changing state to welcome")
             self.state = "welcome"
-            print(f"State changed to: {self.state}")
-            self.draw_welcome_screen()
+            log.debug("State changed to: %s", self.state)
         elif event.key == pygame.K_TAB:
             # Cycle through input boxes
             input_boxes = list(self.input_boxes.keys())
             current_index = input_boxes.index(self.active_input) if self.active_input else -1
             self.active_input = input_boxes[(current_index + 1) % len(input_boxes)]
-            print(f"Active input changed to: {self.active_input}")
-        return True
-
-    def update(self):
-        events = pygame.event.get()
-        redraw_needed = False
-
-        for event in events:
-            if event.type == pygame.QUIT:
-                print("Quit event detected")
-                return False
-            elif event.type == pygame.KEYDOWN:
-                if self.state == "welcome":
-                    self.handle_welcome_keydown(event)
-                    redraw_needed = True
-                elif self.state == "playing":
-                    self.handle_keystroke(event.key)
-                    redraw_needed = True
-                elif self.state == "game_over":
-                    self.handle_game_over_keydown(event)
-                    redraw_needed = True
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if self.state == "welcome":
-                    self.handle_welcome_click(event.pos)
-                    redraw_needed = True
-
-        if self.state == "playing" and self.maze:
-            self.move_zombies()
-            dt = self.clock.get_time() / 1000
-            for zombie in self.zombies:
-                zombie.update(dt)
-            redraw_needed = True
-
-        if redraw_needed:
-            self.draw()
-            pygame.display.flip()
-
-        self.clock.tick(60)  # Limit the frame rate to 60 FPS
-
-        if redraw_needed:
-            print(f"Current state: {self.state}, Active input: {self.active_input}, Player name: {self.player_name}")
-
+            log.debug("Active input changed to: %s", self.active_input)
         return True
 
 if __name__ == "__main__":
@@ -1159,21 +1405,7 @@ if __name__ == "__main__":
     pygame.display.set_caption("EscapeZombieMazia")
 
     game = Game(screen)
-    clock = pygame.time.Clock()
-    running = True
-    while running:
-        if game.state == "playing":
-            running = game.update_gameplay()
-            clock.tick(30)
-        else:
-            running = game.update_static_screen()
-        
-        # Add a small delay to reduce CPU usage
-         # Limits the frame rate to 30 FPS (frames per second) for static screens
-        # The number 30 here represents the target frame rate.
-        # It means the game loop will try to run 30 times per second.
-        # This helps reduce CPU usage when displaying static content,
-        # while still maintaining responsiveness.
+    game.run()
 
     pygame.quit()
     sys.exit()
@@ -0,0 +1,67 @@
+"""Shared pursuit field that zombies follow towards the player.
+
+The field stores, for every open cell, the next cell on a shortest path
+to the target, so a zombie's step is a single array lookup however many
+zombies there are. It is built with one BFS per maze. Every generator
+produces a perfect maze (a tree), and in a tree moving the target to an
+adjacent cell only changes the pointers of the old and the new target
+cell. Each player step is therefore an O(1) update. Mazes with loops
+fall back to a fresh BFS whenever the target moves.
+"""
+from array import array
+from collections import deque
+from typing import Optional, Tuple
+
+Point = Tuple[int, int]
+
+
+class FlowField:
+    def __init__(self, maze):
+        self.rows, self.cols = maze.rows, maze.cols
+        self.walls = bytes(cell for row in maze.grid for cell in row)
+        # Index of the next cell towards the target; -1 at the target and
+        # on cells it can't reach
+        self.toward = array('i', [-1]) * (self.rows * self.cols)
+        self.target = None
+        self.is_tree = False
+
+    def update(self, target: Point):
+        """Point the field at target; cheap when target is next to the old one."""
+        if target == self.target:
+            return
+        index = target[0] * self.cols + target[1]
+        if self.target is not None and self.is_tree:
+            old = self.target[0] * self.cols + self.target[1]
+            if self.toward[index] == old:
+                self.toward[old] = index
+                self.toward[index] = -1
+                self.target = target
+                return
+        self.rebuild(index)
+        self.target = target
+
+    def rebuild(self, start: int):
+        rows, cols, walls = self.rows, self.cols, self.walls
+        self.toward = toward = array('i', [-1]) * len(walls)
+        seen = bytearray(len(walls))
+        seen[start] = 1
+        queue = deque([start])
+        nodes = degrees = 0
+        while queue:
+            index = queue.popleft()
+            nodes += 1
+            r, c = divmod(index, cols)
+            for n, inside in ((index - cols, r > 0), (index + cols, r < rows - 1),
+                              (index - 1, c > 0), (index + 1, c < cols - 1)):
+                if inside and not walls[n]:
+                    degrees += 1
+                    if not seen[n]:
+                        seen[n] = 1
+                        toward[n] = index
+                        queue.append(n)
+        # A connected component is a tree when it has one edge fewer than nodes
+        self.is_tree = degrees // 2 == nodes - 1
+
+    def next_step(self, cell: Point) -> Optional[Point]:
+        index = self.toward[cell[0] * self.cols + cell[1]]
+        return divmod(index, self.cols) if index >= 0 else None
@@ -0,0 +1,47 @@
+"""Leveled logging for EscapeZombieMazia.
+
+debug, info, warning and error are module functions. configure() rebinds
+the ones below the chosen level to a no-op, so a disabled call costs one
+empty function call. Pass values as %-style arguments,
+log.debug("Player moved to: %s", pos), so nothing is formatted either.
+Always call through the module (log.debug), never import the functions,
+so a later configure() takes effect.
+"""
+import sys
+
+LEVELS = ['debug', 'info', 'warning', 'error']
+
+
+def _noop(message, *args):
+    pass
+
+
+def _emitter(level):
+    tag = level.upper()
+
+    def emit(message, *args):
+        if args:
+            message = message % args
+        print(f"{tag:<7} {message}", file=sys.stderr)
+    return emit
+
+
+def configure(level='warning'):
+    """Enable level and everything above it; 'off' silences all of them.
+
+    An unknown level falls back to info, with a warning.
+    """
+    level = level.lower()
+    unknown = level != 'off' and level not in LEVELS
+    if unknown:
+        requested, level = level, 'info'
+    threshold = LEVELS.index(level) if level in LEVELS else len(LEVELS)
+    functions = globals()
+    for index, name in enumerate(LEVELS):
+        functions[name] = _emitter(name) if index >= threshold else _noop
+    if unknown:
+        warning("Unknown log level %r, using info; choose from %s or off", requested, ", ".join(LEVELS))
+
+
+debug = info = warning = error = _noop
+configure()
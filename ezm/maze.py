@@ -1,14 +1,23 @@
+import heapq
 import random
-import execjs
-import os
+import time
+from array import array
+from collections import deque
 from typing import List, Tuple
+import log
+from mazegen import ALGORITHMS
+from maze_registry import registry
 
 # Type aliases for clarity
 Grid = List[List[int]]
 Point = Tuple[int, int]
 
+# Random picks tried before random_open_cell falls back to filtering every cell
+SAMPLE_ATTEMPTS = 32
+
 class Maze:
-    def __init__(self, rows: int, cols: int, generation_algorithm: str = 'recursive_division'):
+    def __init__(self, rows: int, cols: int, generation_algorithm: str = 'recursive_division', backend: str = 'native',
+                 seed: int = None, grid: Grid = None):
         # Ensure dimensions are odd
         self.rows = rows - 1 if rows % 2 == 0 else rows
         self.cols = cols - 1 if cols % 2 == 0 else cols
@@ -16,49 +25,55 @@ class Maze:
         self.in_point: Point = (0, 1)
         self.out_point: Point = (self.rows - 1, self.cols - 2)
         self.solution: List[Point] = []
+        # Steps from every cell to the exit, row-major; -1 for walls and unreachable cells
+        self.exit_distance = array('i')
+        # Row-major indices of every open cell, for O(1) random picks
+        self.open_cells = array('i')
         self.generation_algorithm = generation_algorithm
-        self.generate()
+        self.backend = backend
+        # Native mazes are reproducible from (algorithm, rows, cols, seed); the
+        # JS generators can't be seeded, so theirs stays None
+        self.seed = seed
+        # Time taken to carve the grid, measured where it was built, so it
+        # survives the trip back from a pool worker
+        self.generation_seconds = 0.0
+        if grid is None:
+            self.generate()
+        else:
+            self.grid = grid
+            self.prepare()
+
+    @property
+    def key(self):
+        return (self.generation_algorithm, self.rows, self.cols, self.seed)
 
     def generate(self):
-        print(f"Generating maze with size {self.rows}x{self.cols} using {self.generation_algorithm} algorithm")
-        js_file = f'{self.generation_algorithm.replace("_", "-")}.js'
-        
-        algorithms = {
-            'backtracking': 'backtrackingMaze',
-            'hunt_and_kill': 'huntAndKillMaze',
-            'wilsons': 'wilsonsMaze',
-            'ellers': 'ellersMaze',
-            'kruskals': 'kruskalsMaze',
-            'aldous_broder': 'aldousBroderMaze',
-            'sidewinder': 'sidewinderMaze',
-            'binary_tree': 'binaryTreeMaze',
-            'prims': 'primsMaze',
-            'recursive_division': 'recursiveDivisionMaze'  # This is correct now
-        }
-        
-        if self.generation_algorithm not in algorithms:
-            print(f"Unknown algorithm: {self.generation_algorithm}. Using backtracking.")
+        log.info("Generating maze with size %sx%s using %s algorithm", self.rows, self.cols, self.generation_algorithm)
+        if self.generation_algorithm not in ALGORITHMS:
+            log.warning("Unknown algorithm: %s. Using backtracking.", self.generation_algorithm)
             self.generation_algorithm = 'backtracking'
-        
-        try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            js_file_path = os.path.join(script_dir, 'mazeai', js_file)
-            
-            with open(js_file_path, 'r') as file:
-                js_code = file.read()
 
-            ctx = execjs.compile(js_code)
-            js_maze = ctx.call(algorithms[self.generation_algorithm], self.cols, self.rows)
-
-            self.grid = js_maze
+        if self.backend == 'js':
+            self.seed = None
+        elif self.seed is None:
+            self.seed = random.getrandbits(32)
+        start = time.perf_counter()
+        try:
+            self.grid = registry.generate(self.generation_algorithm, self.rows, self.cols, self.backend, self.seed)
         except Exception as e:
-            print(f"Error in {self.generation_algorithm} maze generation: {e}")
-            print("Falling back to Python implementation...")
+            log.warning("Error in %s maze generation: %s", self.generation_algorithm, e)
+            log.warning("Falling back to Python implementation...")
+            self.seed = None
             self.fallback_generate()
+        self.generation_seconds = time.perf_counter() - start
+        self.prepare()
 
+    def prepare(self):
         self.ensure_entrance_exit()
+        self.exit_distance = self.distance_field(self.out_point)
+        self.open_cells = array('i', (i for i, cell in enumerate(c for row in self.grid for c in row) if not cell))
         self.solution = self.find_solution()
-        print("Maze generation complete")
+        log.debug("Maze generation complete")
 
     def fallback_generate(self):
         # Implement a simple maze generation algorithm here
@@ -81,18 +96,105 @@ class Maze:
         self.grid[self.in_point[0]][self.in_point[1]] = 0
         self.grid[self.out_point[0]][self.out_point[1]] = 0
 
-    def find_solution(self):
-        def dfs(y: int, x: int, path: List[Point]) -> List[Point] | None:
-            if (y, x) == self.out_point:
-                return path
-            for dy, dx in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                ny, nx = y + dy, x + dx
-                if 0 <= ny < self.rows and 0 <= nx < self.cols and self.grid[ny][nx] == 0 and (ny, nx) not in path:
-                    result = dfs(ny, nx, path + [(ny, nx)])
-                    if result:
-                        return result
+    def distance_field(self, target: Point) -> array:
+        """Breadth-first distances from every cell to target, as a flat row-major array."""
+        rows, cols = self.rows, self.cols
+        walls = bytes(cell for row in self.grid for cell in row)
+        distance = array('i', [-1]) * (rows * cols)
+        start = target[0] * cols + target[1]
+        if walls[start]:
+            return distance
+        distance[start] = 0
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            next_distance = distance[index] + 1
+            r, c = divmod(index, cols)
+            for n, inside in ((index - cols, r > 0), (index + cols, r < rows - 1),
+                              (index - 1, c > 0), (index + 1, c < cols - 1)):
+                if inside and not walls[n] and distance[n] < 0:
+                    distance[n] = next_distance
+                    queue.append(n)
+        return distance
+
+    def distance_to_exit(self, cell: Point) -> int:
+        if not (0 <= cell[0] < self.rows and 0 <= cell[1] < self.cols):
+            return -1
+        return self.exit_distance[cell[0] * self.cols + cell[1]]
+
+    def path_to_exit(self, cell: Point) -> List[Point]:
+        """Shortest path from cell to the exit, read off the distance field."""
+        if self.distance_to_exit(cell) < 0:
+            return []
+        path = [cell]
+        while path[-1] != self.out_point:
+            d = self.distance_to_exit(path[-1])
+            path.append(next(n for n in self.get_valid_neighbors(path[-1]) if self.distance_to_exit(n) == d - 1))
+        return path
+
+    def find_solution(self) -> List[Point]:
+        return self.path_to_exit(self.in_point)
+
+    def shortest_path(self, start: Point, goal: Point) -> List[Point]:
+        """A* with the Manhattan distance, for paths that don't end at the exit."""
+        if goal == self.out_point:
+            return self.path_to_exit(start)
+        if self.is_wall(*start) or self.is_wall(*goal):
+            return []
+        came_from = {start: None}
+        cost = {start: 0}
+        heap = [(abs(goal[0] - start[0]) + abs(goal[1] - start[1]), 0, start)]
+        while heap:
+            _, g, cell = heapq.heappop(heap)
+            if cell == goal:
+                path = []
+                while cell is not None:
+                    path.append(cell)
+                    cell = came_from[cell]
+                return path[::-1]
+            if g > cost[cell]:
+                continue
+            for n in self.get_valid_neighbors(cell):
+                if n not in cost or g + 1 < cost[n]:
+                    cost[n] = g + 1
+                    came_from[n] = cell
+                    heapq.heappush(heap, (g + 1 + abs(goal[0] - n[0]) + abs(goal[1] - n[1]), g + 1, n))
+        return []
+
+    def cells_within(self, origin: Point, steps: int) -> set:
+        """Open cells at most steps moves from origin (a BFS that stops at that depth)."""
+        if steps < 0 or self.is_wall(*origin):
+            return set()
+        seen = {origin}
+        frontier = [origin]
+        for _ in range(steps):
+            frontier = [n for cell in frontier for n in self.get_valid_neighbors(cell) if n not in seen]
+            seen.update(frontier)
+        return seen
+
+    def random_open_cell(self, exclude=(), origin: Point = None, min_distance: int = 0,
+                         reachable: bool = True, rng=random) -> Point | None:
+        """Pick a random open cell not in exclude.
+
+        With origin and min_distance, cells fewer than min_distance steps from
+        origin are skipped; with reachable, so are cells cut off from the exit.
+        """
+        near = self.cells_within(origin, min_distance - 1) if origin is not None else set()
+
+        def allowed(index):
+            cell = divmod(index, self.cols)
+            return (cell not in exclude and cell not in near
+                    and (not reachable or self.exit_distance[index] >= 0))
+
+        if not self.open_cells:
             return None
-        return dfs(self.in_point[0], self.in_point[1], [self.in_point]) or []
+        for _ in range(SAMPLE_ATTEMPTS):
+            index = self.open_cells[rng.randrange(len(self.open_cells))]
+            if allowed(index):
+                return divmod(index, self.cols)
+        # Almost everything is excluded: filter the whole index once
+        candidates = [index for index in self.open_cells if allowed(index)]
+        return divmod(rng.choice(candidates), self.cols) if candidates else None
 
     def get_solution_length(self) -> int:
         return len(self.solution)
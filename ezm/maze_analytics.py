@@ -0,0 +1,204 @@
+"""Batch maze quality analytics for EscapeZombieMazia.
+
+Generates many seeded mazes per algorithm and size across worker
+processes and measures each one. The metrics are computed on the graph
+of maze cells (odd coordinates), where the entrance and exit count as
+exits of the first and last cell:
+
+- dead_end_ratio: share of cells with a single exit
+- solution_length: steps from entrance to exit on the grid
+- branching_factor: side passages per cell along the solution, i.e.
+  how many wrong turns a solver is offered per step
+- river_factor: mean number of cells in a dead-end branch, from the
+  dead end back to the nearest junction; long winding branches make a
+  maze "flow" (high river), many stubs make it bushy (low river)
+- corridor histogram: runs of cells with exactly two exits, binned by
+  length in powers of two
+- generate_ms and solve_ms: time to carve the grid, and to build the
+  distance field and solution as the game does
+
+Every record carries its seed, so any maze in a report can be replayed
+in the game by typing that seed in.
+
+    python maze_analytics.py --sizes 29x29 99x99 --count 1000 --format csv --output report.csv
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from maze import Maze
+from mazegen import ALGORITHMS, generate_grid, make_odd
+
+CORRIDOR_BINS = ['1', '2', '3-4', '5-8', '9-16', '17-32', '33+']
+METRICS = ['dead_end_ratio', 'solution_length', 'branching_factor', 'river_factor', 'generate_ms', 'solve_ms']
+CHUNK = 50  # mazes per worker task
+
+
+def corridor_bin(length: int) -> int:
+    return min((length - 1).bit_length(), len(CORRIDOR_BINS) - 1)
+
+
+def cell_degrees(grid: bytes, rows: int, cols: int) -> Dict[int, int]:
+    degrees = {}
+    for r in range(1, rows - 1, 2):
+        for index in range(r * cols + 1, (r + 1) * cols - 1, 2):
+            degrees[index] = (not grid[index - cols]) + (not grid[index + cols]) + (not grid[index - 1]) + (not grid[index + 1])
+    return degrees
+
+
+def cell_neighbors(index: int, grid: bytes, cols: int) -> List[int]:
+    # Only steps through an open wall to another cell; the openings in the
+    # outer wall (entrance and exit) lead nowhere
+    return [index + 2 * step for step in (-cols, cols, -1, 1)
+            if not grid[index + step] and 0 < index + 2 * step < len(grid)]
+
+
+def measure(maze: Maze) -> dict:
+    rows, cols = maze.rows, maze.cols
+    grid = bytes(cell for row in maze.grid for cell in row)
+    degrees = cell_degrees(grid, rows, cols)
+    cells = len(degrees)
+
+    dead_ends = [index for index, degree in degrees.items() if degree == 1]
+
+    # Walk each dead-end branch back to the first junction
+    branch_cells = 0
+    for index in dead_ends:
+        previous, length = None, 0
+        while degrees[index] <= 2:
+            length += 1
+            forward = [n for n in cell_neighbors(index, grid, cols) if n != previous]
+            if not forward:
+                break
+            previous, index = index, forward[0]
+        branch_cells += length
+
+    # Corridors: connected runs of two-exit cells
+    histogram = [0] * len(CORRIDOR_BINS)
+    seen = set()
+    for start, degree in degrees.items():
+        if degree != 2 or start in seen:
+            continue
+        seen.add(start)
+        stack, length = [start], 0
+        while stack:
+            index = stack.pop()
+            length += 1
+            for n in cell_neighbors(index, grid, cols):
+                if n not in seen and degrees.get(n) == 2:
+                    seen.add(n)
+                    stack.append(n)
+        histogram[corridor_bin(length)] += 1
+
+    solution_cells = [r * cols + c for r, c in maze.solution if r % 2 and c % 2]
+    side_passages = sum(max(0, degrees[index] - 2) for index in solution_cells)
+
+    return {
+        'dead_end_ratio': len(dead_ends) / cells,
+        'solution_length': len(maze.solution) - 1,
+        'branching_factor': side_passages / len(solution_cells) if solution_cells else 0.0,
+        'river_factor': branch_cells / len(dead_ends) if dead_ends else 0.0,
+        'corridors': histogram,
+    }
+
+
+def analyze_chunk(algorithm: str, rows: int, cols: int, seeds: List[int]) -> List[dict]:
+    records = []
+    for seed in seeds:
+        start = time.perf_counter()
+        grid = generate_grid(algorithm, rows, cols, random.Random(seed))
+        generated = time.perf_counter()
+        maze = Maze(rows, cols, algorithm, 'native', seed, grid)
+        solved = time.perf_counter()
+        record = {'algorithm': algorithm, 'rows': maze.rows, 'cols': maze.cols, 'seed': seed}
+        record.update(measure(maze))
+        record['generate_ms'] = (generated - start) * 1000
+        record['solve_ms'] = (solved - generated) * 1000
+        records.append(record)
+    return records
+
+
+def summarize(records: List[dict]) -> List[dict]:
+    groups = {}
+    for record in records:
+        groups.setdefault((record['algorithm'], record['rows'], record['cols']), []).append(record)
+    summary = []
+    for (algorithm, rows, cols), group in groups.items():
+        row = {'algorithm': algorithm, 'rows': rows, 'cols': cols, 'mazes': len(group)}
+        for metric in METRICS:
+            values = [record[metric] for record in group]
+            row[f'{metric}_mean'] = statistics.fmean(values)
+            row[f'{metric}_stdev'] = statistics.pstdev(values)
+            row[f'{metric}_min'] = min(values)
+            row[f'{metric}_max'] = max(values)
+        for i, label in enumerate(CORRIDOR_BINS):
+            row[f'corridors_{label}'] = sum(record['corridors'][i] for record in group) / len(group)
+        summary.append(row)
+    return summary
+
+
+def flatten(record: dict) -> dict:
+    row = {key: value for key, value in record.items() if key != 'corridors'}
+    for label, count in zip(CORRIDOR_BINS, record['corridors']):
+        row[f'corridors_{label}'] = count
+    return row
+
+
+def run(algorithms: List[str], sizes: List[tuple], count: int, seed: int, workers: int) -> List[dict]:
+    tasks = []
+    for algorithm in algorithms:
+        for rows, cols in sizes:
+            seeds = list(range(seed, seed + count))
+            for i in range(0, count, CHUNK):
+                tasks.append((algorithm, rows, cols, seeds[i:i + CHUNK]))
+    records = []
+    with ProcessPoolExecutor(workers) as executor:
+        for chunk in executor.map(analyze_chunk, *zip(*tasks)):
+            records.extend(chunk)
+    return records
+
+
+def write_report(rows: List[dict], output_format: str, file):
+    if output_format == 'json':
+        json.dump(rows, file, indent=2)
+        file.write('\n')
+    else:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def parse_size(text: str) -> tuple:
+    rows, _, cols = text.lower().partition('x')
+    return make_odd(int(rows)), make_odd(int(cols or rows))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure maze quality per algorithm and size")
+    parser.add_argument('--algorithms', nargs='+', choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=[(29, 29), (99, 99)],
+                        help="sizes as ROWSxCOLS, e.g. 29x29 99x151")
+    parser.add_argument('--count', type=int, default=1000, help="mazes per algorithm and size")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first maze; the rest follow on")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--format', choices=['csv', 'json'], default='csv')
+    parser.add_argument('--per-maze', action='store_true', help="one row per maze instead of a summary")
+    parser.add_argument('--output', help="file to write; standard output by default")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    records = run(args.algorithms, args.sizes, args.count, args.seed, args.workers)
+    rows = [flatten(record) for record in records] if args.per_maze else summarize(records)
+    if args.output:
+        with open(args.output, 'w', newline='') as file:
+            write_report(rows, args.format, file)
+    else:
+        write_report(rows, args.format, sys.stdout)
+    print(f"{len(records)} mazes in {time.perf_counter() - start:.1f} s", file=sys.stderr)
@@ -0,0 +1,131 @@
+"""On-disk cache of seeded mazes for EscapeZombieMazia.
+
+A native maze is fully determined by (algorithm, rows, cols, seed), so that
+tuple is its identity: it names the cache file, keys the leaderboard and
+is what players share. Each file holds a small header (rows, cols and a
+digest of the payload) followed by the grid packed at 1 bit per cell, so
+a 1999x1999 maze takes about 500 KB, small enough to read in one go. A
+file whose digest doesn't match is treated as missing.
+"""
+import hashlib
+import os
+import struct
+import tempfile
+import time
+from datetime import date, datetime, timezone
+from typing import List, Optional, Tuple
+
+import log
+from maze import Maze
+from mazegen import make_odd
+
+Grid = List[List[int]]
+MazeKey = Tuple[str, int, int, int]
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'maze_cache')
+MAGIC = b'EZM1'
+HEADER = struct.Struct('<4sII16s')  # magic, rows, cols, blake2b digest of the bits
+TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+FROM_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def maze_key(algorithm: str, rows: int, cols: int, seed: int) -> MazeKey:
+    return (algorithm, make_odd(rows), make_odd(cols), seed)
+
+
+def maze_id(key: MazeKey) -> str:
+    algorithm, rows, cols, seed = key
+    return f"{algorithm}-{rows}x{cols}-{seed}"
+
+
+def daily_seed(day: date = None) -> int:
+    # The UTC date, so players in every time zone share the same daily maze
+    return int((day or datetime.now(timezone.utc).date()).strftime('%Y%m%d'))
+
+
+def pack(grid: Grid) -> bytes:
+    # Read as a binary number, the cells are the bits of one big integer
+    cells = b''.join(bytes(row) for row in grid)
+    return int(cells.translate(TO_DIGITS), 2).to_bytes((len(cells) + 7) // 8, 'big')
+
+
+def unpack(bits, rows: int, cols: int) -> Grid:
+    cells = format(int.from_bytes(bits, 'big'), f'0{rows * cols}b').encode().translate(FROM_DIGITS)
+    return [list(cells[r * cols:(r + 1) * cols]) for r in range(rows)]
+
+
+def digest(bits) -> bytes:
+    return hashlib.blake2b(bits, digest_size=16).digest()
+
+
+class MazeCache:
+    def __init__(self, directory: str = CACHE_DIR, max_files: int = 256):
+        self.directory = directory
+        self.max_files = max_files
+
+    def path(self, key: MazeKey) -> str:
+        return os.path.join(self.directory, maze_id(key) + '.maze')
+
+    def load(self, key: MazeKey) -> Optional[Grid]:
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                return self.decode(key, file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, struct.error) as e:
+            log.warning("Ignoring unreadable maze cache file %s: %s", path, e)
+            return None
+
+    def decode(self, key: MazeKey, data: bytes) -> Optional[Grid]:
+        magic, rows, cols, expected = HEADER.unpack_from(data)
+        bits = data[HEADER.size:]
+        if magic != MAGIC or (rows, cols) != key[1:3] or digest(bits) != expected:
+            log.warning("Maze cache file for %s is corrupt, regenerating", maze_id(key))
+            return None
+        return unpack(bits, rows, cols)
+
+    def store(self, key: MazeKey, grid: Grid):
+        bits = pack(grid)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file and rename, so readers never see half a maze
+            fd, temp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as file:
+                file.write(HEADER.pack(MAGIC, len(grid), len(grid[0]), digest(bits)))
+                file.write(bits)
+            os.replace(temp, self.path(key))
+        except OSError as e:
+            log.warning("Could not write maze cache file for %s: %s", maze_id(key), e)
+            return
+        self.prune()
+
+    def prune(self):
+        """Delete the least recently written files beyond max_files."""
+        try:
+            paths = [entry.path for entry in os.scandir(self.directory) if entry.name.endswith('.maze')]
+            if len(paths) > self.max_files:
+                paths.sort(key=os.path.getmtime)
+                for path in paths[:len(paths) - self.max_files]:
+                    os.remove(path)
+        except OSError as e:
+            log.warning("Could not prune the maze cache: %s", e)
+
+
+def seeded_maze(rows: int, cols: int, algorithm: str, seed: int, cache: MazeCache = None) -> Maze:
+    """The maze for (algorithm, rows, cols, seed), from the cache when possible."""
+    cache = cache or MazeCache()
+    key = maze_key(algorithm, rows, cols, seed)
+    start = time.perf_counter()
+    grid = cache.load(key)
+    loaded = time.perf_counter() - start
+    if grid is not None:
+        log.debug("Loaded maze %s from the cache", maze_id(key))
+        maze = Maze(rows, cols, algorithm, 'native', seed, grid)
+        maze.generation_seconds = loaded
+        return maze
+    maze = Maze(rows, cols, algorithm, 'native', seed)
+    # A maze that fell back to another generator doesn't match its key
+    if maze.key == key:
+        cache.store(key, maze.grid)
+    return maze
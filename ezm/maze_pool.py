@@ -0,0 +1,116 @@
+"""Background maze pre-generation for EscapeZombieMazia.
+
+While the player is on the welcome or game-over screen, the game asks
+the pool to prefetch mazes for the current settings. Worker processes
+build them, so generation never blocks the screen, and start_game and
+replay_game can usually take a finished maze straight away. take never
+waits: while a maze for the key is still being built, building() is true
+and the game polls take from its loop. The pool
+holds mazes for a single key (rows, cols, algorithm, backend, seed). When the
+key changes, queued jobs are cancelled and any held or in-flight mazes
+for the old key are dropped. The number of mazes held is capped both by
+count and by total cells. A seeded key always gives the same maze, so
+only one is built for it, through the on-disk cache.
+"""
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+import log
+from maze import Maze
+from maze_cache import seeded_maze
+
+MazeKey = Tuple[int, int, str, str, Optional[int]]
+
+
+def build_maze(rows: int, cols: int, algorithm: str, backend: str, seed: Optional[int]) -> Maze:
+    if seed is not None:
+        return seeded_maze(rows, cols, algorithm, seed)
+    return Maze(rows, cols, algorithm, backend)
+
+
+class MazePool:
+    def __init__(self, workers: int = 1, size: int = 2, max_cells: int = 4000000, log_level: str = 'warning'):
+        self.workers = workers
+        self.log_level = log_level
+        self.size = size
+        self.max_cells = max_cells
+        self.executor = None
+        self.key: Optional[MazeKey] = None
+        self.ready = deque()
+        self.pending = deque()
+        self.enabled = workers > 0 and size > 0
+
+    def capacity(self, key: MazeKey) -> int:
+        if key[4] is not None:
+            return 1
+        return max(1, min(self.size, self.max_cells // (key[0] * key[1])))
+
+    def start_executor(self):
+        try:
+            # spawn keeps the workers clear of the parent's SDL state, and
+            # starts them with the default log level until configured here
+            self.executor = ProcessPoolExecutor(self.workers, multiprocessing.get_context('spawn'),
+                                                initializer=log.configure, initargs=(self.log_level,))
+        except (OSError, NotImplementedError) as e:
+            log.warning("Maze pool disabled: %s", e)
+            self.enabled = False
+
+    def set_key(self, key: MazeKey):
+        if key == self.key:
+            return
+        for future in self.pending:
+            future.cancel()
+        self.pending.clear()
+        self.ready.clear()
+        self.key = key
+
+    def collect(self):
+        """Move finished jobs into ready, dropping failed ones."""
+        while self.pending and self.pending[0].done():
+            future = self.pending.popleft()
+            if future.cancelled():
+                continue
+            try:
+                maze = future.result()
+            except Exception as e:
+                log.warning("Background maze generation failed: %s", e)
+                continue
+            if maze.solution:
+                self.ready.append(maze)
+
+    def prefetch(self, key: MazeKey):
+        """Queue jobs until the pool holds or is building its capacity for key."""
+        if not self.enabled:
+            return
+        self.set_key(key)
+        self.collect()
+        if self.executor is None:
+            self.start_executor()
+            if not self.enabled:
+                return
+        while len(self.ready) + len(self.pending) < self.capacity(key):
+            try:
+                self.pending.append(self.executor.submit(build_maze, *key))
+            except RuntimeError as e:
+                log.warning("Maze pool disabled: %s", e)
+                self.enabled = False
+                return
+
+    def take(self, key: MazeKey) -> Optional[Maze]:
+        """A finished maze for key, or None. Never waits for a worker."""
+        if not self.enabled:
+            return None
+        self.set_key(key)
+        self.collect()
+        return self.ready.popleft() if self.ready else None
+
+    def building(self, key: MazeKey) -> bool:
+        """True while a maze for key is queued or being built."""
+        return self.enabled and key == self.key and bool(self.pending)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
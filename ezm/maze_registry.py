@@ -0,0 +1,125 @@
+"""Process-wide registry of maze generation algorithms.
+
+Game and Maze share one registry. For the 'js' backend each mazeai/*.js
+file is read and compiled once, on first use, and the compiled context is
+reused for every later maze, retry and replay. For both backends the
+registry records how long loading and generating took per algorithm.
+"""
+import argparse
+import os
+import random
+import threading
+import time
+from typing import Dict, List
+
+import log
+from mazegen import ALGORITHMS, generate_grid
+
+BACKENDS = ('native', 'js')
+
+# Entry points of the mazeai/*.js implementations
+JS_FUNCTIONS = {
+    'backtracking': 'backtrackingMaze',
+    'hunt_and_kill': 'huntAndKillMaze',
+    'wilsons': 'wilsonsMaze',
+    'ellers': 'ellersMaze',
+    'kruskals': 'kruskalsMaze',
+    'aldous_broder': 'aldousBroderMaze',
+    'sidewinder': 'sidewinderMaze',
+    'binary_tree': 'binaryTreeMaze',
+    'prims': 'primsMaze',
+    'recursive_division': 'recursiveDivisionMaze'
+}
+
+JS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mazeai')
+
+
+class AlgorithmTiming:
+    def __init__(self):
+        self.load_seconds = 0.0
+        self.runs = 0
+        self.total_seconds = 0.0
+        self.last_seconds = 0.0
+
+    def add_run(self, seconds: float):
+        self.runs += 1
+        self.total_seconds += seconds
+        self.last_seconds = seconds
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.runs if self.runs else 0.0
+
+
+class AlgorithmRegistry:
+    def __init__(self):
+        self.contexts = {}
+        self.timings: Dict[tuple, AlgorithmTiming] = {}
+        self.lock = threading.Lock()
+
+    def timing(self, name: str, backend: str) -> AlgorithmTiming:
+        key = (backend, name)
+        if key not in self.timings:
+            self.timings[key] = AlgorithmTiming()
+        return self.timings[key]
+
+    def load_js(self, name: str):
+        """Return the compiled context for a JS algorithm, compiling it on first use."""
+        with self.lock:
+            ctx = self.contexts.get(name)
+            if ctx is None:
+                import execjs
+                start = time.perf_counter()
+                with open(os.path.join(JS_DIR, f'{name.replace("_", "-")}.js'), 'r') as file:
+                    ctx = execjs.compile(file.read())
+                self.timing(name, 'js').load_seconds = time.perf_counter() - start
+                self.contexts[name] = ctx
+            return ctx
+
+    def available(self, backend: str = 'native') -> List[str]:
+        """Names of the algorithms that can run on a backend, loading them if needed."""
+        if backend != 'js':
+            return list(ALGORITHMS)
+        names = []
+        for name in JS_FUNCTIONS:
+            try:
+                self.load_js(name)
+                names.append(name)
+            except Exception as e:
+                log.warning("Error loading algorithm %s: %s", name, e)
+        return names
+
+    def generate(self, name: str, rows: int, cols: int, backend: str = 'native', seed: int = None):
+        """Generate a grid; native grids are reproducible from seed, JS ones ignore it."""
+        start = time.perf_counter()
+        if backend == 'js':
+            grid = self.load_js(name).call(JS_FUNCTIONS[name], cols, rows)
+        else:
+            grid = generate_grid(name, rows, cols, random.Random(seed))
+        self.timing(name, backend).add_run(time.perf_counter() - start)
+        return grid
+
+    def report(self) -> str:
+        lines = [f"{'backend':<8}{'algorithm':<20}{'load ms':>10}{'runs':>6}{'mean ms':>10}{'last ms':>10}"]
+        for (backend, name), t in sorted(self.timings.items()):
+            lines.append(f"{backend:<8}{name:<20}{t.load_seconds * 1000:>10.1f}{t.runs:>6}"
+                         f"{t.mean_seconds * 1000:>10.1f}{t.last_seconds * 1000:>10.1f}")
+        return "\n".join(lines)
+
+
+registry = AlgorithmRegistry()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time maze generation per algorithm and backend")
+    parser.add_argument('--backend', choices=BACKENDS + ('both',), default='both')
+    parser.add_argument('--rows', type=int, default=99)
+    parser.add_argument('--cols', type=int, default=99)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+    backends = BACKENDS if args.backend == 'both' else (args.backend,)
+    for backend in backends:
+        for name in registry.available(backend):
+            for _ in range(args.runs):
+                registry.generate(name, args.rows, args.cols, backend)
+    print(registry.report())
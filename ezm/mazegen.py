@@ -0,0 +1,330 @@
+"""Native maze generators for EscapeZombieMazia.
+
+Every generator takes (rows, cols, rng) and returns the same grid as the
+mazeai/*.js versions: a rows x cols list of lists with 1 for walls and 0
+for passages, odd dimensions, cells on odd coordinates, the entrance at
+(0, 1) and the exit at (rows - 1, cols - 2).
+
+The carving is done on a flat bytearray. The cell above or below is
++-2 * cols and the cell to either side is +-2, so the wall between two
+cells is always the midpoint of their indices.
+"""
+import argparse
+import random
+import time
+from typing import List
+
+Grid = List[List[int]]
+
+
+def make_odd(n: int) -> int:
+    return n - 1 if n % 2 == 0 else n
+
+
+def walls(rows: int, cols: int) -> bytearray:
+    return bytearray(b'\x01') * (rows * cols)
+
+
+def cell_indices(rows: int, cols: int) -> List[int]:
+    return [r * cols + c for r in range(1, rows - 1, 2) for c in range(1, cols - 1, 2)]
+
+
+def neighbors(index: int, rows: int, cols: int) -> List[int]:
+    r, c = divmod(index, cols)
+    result = []
+    if r > 1:
+        result.append(index - 2 * cols)
+    if r < rows - 2:
+        result.append(index + 2 * cols)
+    if c > 1:
+        result.append(index - 2)
+    if c < cols - 2:
+        result.append(index + 2)
+    return result
+
+
+def finish(grid: bytearray, rows: int, cols: int) -> Grid:
+    grid[1] = 0
+    grid[(rows - 1) * cols + cols - 2] = 0
+    return [list(grid[r * cols:(r + 1) * cols]) for r in range(rows)]
+
+
+def backtracking(rows: int, cols: int, rng: random.Random) -> Grid:
+    grid = walls(rows, cols)
+    start = rng.choice(cell_indices(rows, cols))
+    grid[start] = 0
+    stack = [start]
+    while stack:
+        cell = stack[-1]
+        options = [n for n in neighbors(cell, rows, cols) if grid[n]]
+        if not options:
+            stack.pop()
+            continue
+        choice = rng.choice(options)
+        grid[choice] = grid[(cell + choice) // 2] = 0
+        stack.append(choice)
+    return finish(grid, rows, cols)
+
+
+def hunt_and_kill(rows: int, cols: int, rng: random.Random) -> Grid:
+    grid = walls(rows, cols)
+    cell = rng.choice(cell_indices(rows, cols))
+    grid[cell] = 0
+    first_row = 1
+    while cell is not None:
+        options = [n for n in neighbors(cell, rows, cols) if grid[n]]
+        if options:
+            choice = rng.choice(options)
+            grid[choice] = grid[(cell + choice) // 2] = 0
+            cell = choice
+            continue
+
+        # Hunt: the first unvisited cell next to the maze, skipping the
+        # leading rows that have no unvisited cells left
+        cell = None
+        while first_row < rows - 1 and 1 not in grid[first_row * cols + 1:(first_row + 1) * cols - 1:2]:
+            first_row += 2
+        for r in range(first_row, rows - 1, 2):
+            for index in range(r * cols + 1, (r + 1) * cols - 1, 2):
+                if grid[index]:
+                    visited = [n for n in neighbors(index, rows, cols) if not grid[n]]
+                    if visited:
+                        grid[index] = grid[(index + rng.choice(visited)) // 2] = 0
+                        cell = index
+                        break
+            if cell is not None:
+                break
+    return finish(grid, rows, cols)
+
+
+def wilsons(rows: int, cols: int, rng: random.Random) -> Grid:
+    grid = walls(rows, cols)
+    cells = cell_indices(rows, cols)
+    grid[rng.choice(cells)] = 0
+    rng.shuffle(cells)
+    for start in cells:
+        if not grid[start]:
+            continue
+        # Random walk until the maze is hit; overwriting the exit taken
+        # from a cell erases any loop the walk made through it
+        exits = {}
+        cell = start
+        while grid[cell]:
+            exits[cell] = rng.choice(neighbors(cell, rows, cols))
+            cell = exits[cell]
+        cell = start
+        while grid[cell]:
+            nxt = exits[cell]
+            grid[cell] = grid[(cell + nxt) // 2] = 0
+            cell = nxt
+    return finish(grid, rows, cols)
+
+
+def ellers(rows: int, cols: int, rng: random.Random) -> Grid:
+    grid = walls(rows, cols)
+    width = (cols - 1) // 2
+    sets = list(range(width))
+    next_set = width
+    for r in range(1, rows - 1, 2):
+        base = r * cols
+        last_row = r == rows - 2
+        members = {}
+        for k, s in enumerate(sets):
+            grid[base + 2 * k + 1] = 0
+            members.setdefault(s, []).append(k)
+
+        # Join neighbouring cells of different sets (always on the last row)
+        for k in range(width - 1):
+            a, b = sets[k], sets[k + 1]
+            if a != b and (last_row or rng.random() < 0.5):
+                grid[base + 2 * k + 2] = 0
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                for m in members[b]:
+                    sets[m] = a
+                members[a] += members.pop(b)
+        if last_row:
+            break
+
+        # Every set continues down at least once
+        next_sets = [None] * width
+        for s, columns in members.items():
+            rng.shuffle(columns)
+            for n, k in enumerate(columns):
+                if n == 0 or rng.random() < 0.5:
+                    grid[base + cols + 2 * k + 1] = 0
+                    next_sets[k] = s
+        for k in range(width):
+            if next_sets[k] is None:
+                next_sets[k] = next_set
+                next_set += 1
+        sets = next_sets
+    return finish(grid, rows, cols)
+
+
+def kruskals(rows: int, cols: int, rng: random.Random) -> Grid:
+    grid = walls(rows, cols)
+    cells = cell_indices(rows, cols)
+    edges = [(a, a + 2) for a in cells if a % cols < cols - 2]
+    edges += [(a, a + 2 * cols) for a in cells if a // cols < rows - 2]
+    rng.shuffle(edges)
+    parent = list(range(rows * cols))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a in cells:
+        grid[a] = 0
+    for a, b in edges:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_a] = root_b
+            grid[(a + b) // 2] = 0
+    return finish(grid, rows, cols)
+
+
+def aldous_broder(rows: int, cols: int, rng: random.Random) -> Grid:
+    grid = walls(rows, cols)
+    cells = cell_indices(rows, cols)
+    remaining = len(cells) - 1
+    cell = rng.choice(cells)
+    grid[cell] = 0
+    while remaining:
+        nxt = rng.choice(neighbors(cell, rows, cols))
+        if grid[nxt]:
+            grid[nxt] = grid[(cell + nxt) // 2] = 0
+            remaining -= 1
+        cell = nxt
+    return finish(grid, rows, cols)
+
+
+def sidewinder(rows: int, cols: int, rng: random.Random) -> Grid:
+    grid = walls(rows, cols)
+    for r in range(1, rows - 1, 2):
+        run_start = 1
+        for c in range(1, cols - 1, 2):
+            index = r * cols + c
+            grid[index] = 0
+            at_east = c == cols - 2
+            if r == 1:
+                if not at_east:
+                    grid[index + 1] = 0
+            elif at_east or rng.random() < 0.5:
+                # Close the run by carving north from one of its cells
+                grid[(r - 1) * cols + rng.randrange(run_start, c + 1, 2)] = 0
+                run_start = c + 2
+            else:
+                grid[index + 1] = 0
+    return finish(grid, rows, cols)
+
+
+def binary_tree(rows: int, cols: int, rng: random.Random) -> Grid:
+    grid = walls(rows, cols)
+    for r in range(1, rows - 1, 2):
+        for c in range(1, cols - 1, 2):
+            index = r * cols + c
+            grid[index] = 0
+            options = []
+            if r > 1:
+                options.append(index - cols)
+            if c > 1:
+                options.append(index - 1)
+            if options:
+                grid[rng.choice(options)] = 0
+    return finish(grid, rows, cols)
+
+
+def prims(rows: int, cols: int, rng: random.Random) -> Grid:
+    grid = walls(rows, cols)
+    in_frontier = bytearray(rows * cols)
+    start = rng.choice(cell_indices(rows, cols))
+    grid[start] = 0
+    frontier = neighbors(start, rows, cols)
+    for n in frontier:
+        in_frontier[n] = 1
+    while frontier:
+        # Swap-remove a random frontier cell
+        i = rng.randrange(len(frontier))
+        cell = frontier[i]
+        frontier[i] = frontier[-1]
+        frontier.pop()
+        around = neighbors(cell, rows, cols)
+        visited = [n for n in around if not grid[n]]
+        grid[cell] = grid[(cell + rng.choice(visited)) // 2] = 0
+        for n in around:
+            if grid[n] and not in_frontier[n]:
+                in_frontier[n] = 1
+                frontier.append(n)
+    return finish(grid, rows, cols)
+
+
+def recursive_division(rows: int, cols: int, rng: random.Random) -> Grid:
+    grid = bytearray(rows * cols)
+    grid[:cols] = grid[-cols:] = b'\x01' * cols
+    grid[::cols] = grid[cols - 1::cols] = b'\x01' * rows
+    # Chambers as (top, bottom, left, right) cell coordinates, inclusive
+    chambers = [(1, rows - 2, 1, cols - 2)]
+    while chambers:
+        top, bottom, left, right = chambers.pop()
+        height, width = bottom - top, right - left
+        if height <= 0 or width <= 0:
+            continue
+        if height > width or (height == width and rng.random() < 0.5):
+            split = rng.randrange(top + 1, bottom, 2)
+            hole = rng.randrange(left, right + 1, 2)
+            grid[split * cols + left:split * cols + right + 1] = b'\x01' * (width + 1)
+            grid[split * cols + hole] = 0
+            chambers.append((top, split - 1, left, right))
+            chambers.append((split + 1, bottom, left, right))
+        else:
+            split = rng.randrange(left + 1, right, 2)
+            hole = rng.randrange(top, bottom + 1, 2)
+            grid[top * cols + split:bottom * cols + split + 1:cols] = b'\x01' * (height + 1)
+            grid[hole * cols + split] = 0
+            chambers.append((top, bottom, left, split - 1))
+            chambers.append((top, bottom, split + 1, right))
+    return finish(grid, rows, cols)
+
+
+ALGORITHMS = {
+    'backtracking': backtracking,
+    'hunt_and_kill': hunt_and_kill,
+    'wilsons': wilsons,
+    'ellers': ellers,
+    'kruskals': kruskals,
+    'aldous_broder': aldous_broder,
+    'sidewinder': sidewinder,
+    'binary_tree': binary_tree,
+    'prims': prims,
+    'recursive_division': recursive_division,
+}
+
+
+def generate_grid(algorithm: str, rows: int, cols: int, rng: random.Random = None) -> Grid:
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    return ALGORITHMS[algorithm](make_odd(rows), make_odd(cols), rng or random.Random())
+
+
+def benchmark(rows: int, cols: int, runs: int, seed: int = 0):
+    rng = random.Random(seed)
+    print(f"{'algorithm':<20}{'ms/maze':>10}{'mazes/s':>10}")
+    for name in ALGORITHMS:
+        start = time.perf_counter()
+        for _ in range(runs):
+            generate_grid(name, rows, cols, rng)
+        elapsed = (time.perf_counter() - start) / runs
+        print(f"{name:<20}{elapsed * 1000:>10.1f}{1 / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the native maze generators")
+    parser.add_argument('--rows', type=int, default=99)
+    parser.add_argument('--cols', type=int, default=99)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    benchmark(args.rows, args.cols, args.runs, args.seed)
@@ -0,0 +1,110 @@
+"""Per-frame timing for EscapeZombieMazia.
+
+Each frame is split into the event, update, draw and flip phases. The
+overlay shows the mean of every phase over the last WINDOW frames and a
+histogram of whole-frame times. Up to HISTORY frames are kept so they can
+be dumped to CSV for offline analysis. While the profiler is off every
+call returns straight away.
+"""
+import csv
+import time
+from collections import deque
+
+import pygame
+
+PHASES = ('event', 'update', 'draw', 'flip')
+WINDOW = 240
+HISTORY = 100000
+BIN_MS = 2
+BINS = 17  # the last bin collects everything slower
+FRAME_BUDGET_MS = 1000 / 60  # bars past this are drawn red
+PHASE_COLORS = {
+    'event': (255, 165, 0),
+    'update': (0, 200, 0),
+    'draw': (80, 160, 255),
+    'flip': (255, 0, 255),
+}
+
+
+class FrameProfiler:
+    def __init__(self, active=False):
+        self.active = active
+        self.window = deque(maxlen=WINDOW)
+        self.history = deque(maxlen=HISTORY)
+        self.frame = 0
+        self.current = [0.0] * len(PHASES)
+        self.last = 0.0
+
+    def toggle(self):
+        self.active = not self.active
+        self.last = time.perf_counter()
+
+    def start_frame(self):
+        if not self.active:
+            return
+        self.current = [0.0] * len(PHASES)
+        self.last = time.perf_counter()
+
+    def mark(self, phase: str):
+        """Charge the time since the previous mark to phase."""
+        if not self.active:
+            return
+        now = time.perf_counter()
+        self.current[PHASES.index(phase)] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        if not self.active:
+            return
+        self.frame += 1
+        sample = (self.frame,) + tuple(self.current)
+        self.window.append(sample)
+        self.history.append(sample)
+
+    def means_ms(self):
+        count = len(self.window) or 1
+        return [sum(sample[i + 1] for sample in self.window) * 1000 / count for i in range(len(PHASES))]
+
+    def histogram(self):
+        counts = [0] * BINS
+        for sample in self.window:
+            counts[min(int(sum(sample[1:]) * 1000 // BIN_MS), BINS - 1)] += 1
+        return counts
+
+    def dump(self, path=None) -> str:
+        path = path or time.strftime('ezm_profile_%Y%m%d_%H%M%S.csv')
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['frame'] + [f'{phase}_ms' for phase in PHASES] + ['total_ms'])
+            for sample in self.history:
+                times = [seconds * 1000 for seconds in sample[1:]]
+                writer.writerow([sample[0]] + [f'{ms:.3f}' for ms in times] + [f'{sum(times):.3f}'])
+        return path
+
+    def draw(self, surface, font):
+        if not self.active:
+            return
+        line_height = font.get_linesize()
+        width = 220
+        bar_area = 60
+        height = line_height * (len(PHASES) + 1) + bar_area + 20
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+
+        means = self.means_ms()
+        y = 5
+        for phase, ms in zip(PHASES, means):
+            panel.blit(font.render(f"{phase:<7}{ms:6.2f} ms", True, PHASE_COLORS[phase]), (5, y))
+            y += line_height
+        panel.blit(font.render(f"frame  {sum(means):6.2f} ms", True, (255, 255, 255)), (5, y))
+        y += line_height + 5
+
+        # Frame-time histogram, BIN_MS per bar
+        counts = self.histogram()
+        peak = max(counts) or 1
+        bar_width = (width - 10) // BINS
+        for i, count in enumerate(counts):
+            bar_height = count * bar_area // peak
+            color = (255, 80, 80) if (i + 1) * BIN_MS > FRAME_BUDGET_MS else (200, 200, 200)
+            pygame.draw.rect(panel, color, (5 + i * bar_width, y + bar_area - bar_height, bar_width - 1, bar_height))
+        surface.blit(panel, (5, 5))
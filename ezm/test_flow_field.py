@@ -0,0 +1,70 @@
+import os
+from collections import deque
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from flow_field import FlowField
+from maze import Maze
+
+
+def distances(maze, target):
+    dist = {target: 0}
+    queue = deque([target])
+    while queue:
+        cell = queue.popleft()
+        for n in maze.get_valid_neighbors(cell):
+            if n not in dist:
+                dist[n] = dist[cell] + 1
+                queue.append(n)
+    return dist
+
+
+def assert_points_downhill(field, maze, target):
+    dist = distances(maze, target)
+    for cell, steps in dist.items():
+        step = field.next_step(cell)
+        if cell == target:
+            assert step is None
+        else:
+            assert dist[step] == steps - 1
+
+
+def test_incremental_updates_follow_the_player():
+    maze = Maze(41, 41, 'backtracking', 'native', 3)
+    field = FlowField(maze)
+    for cell in maze.solution[:60]:
+        field.update(cell)
+    assert field.is_tree
+    assert_points_downhill(field, maze, maze.solution[59])
+
+
+def test_mazes_with_loops_are_rebuilt():
+    maze = Maze(21, 21, 'backtracking', 'native', 3)
+    maze.grid[2][3] = maze.grid[3][2] = maze.grid[4][3] = 0
+    field = FlowField(maze)
+    for cell in maze.solution[:20]:
+        field.update(cell)
+        assert_points_downhill(field, maze, cell)
+
+
+def test_a_horde_of_pursuers_closes_in(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(pygame.mouse, 'set_cursor', lambda *args: None)
+    import ezm
+    monkeypatch.setattr(ezm, 'ZOMBIE_CELLS', 10)
+    pygame.init()
+    game = ezm.Game(pygame.display.set_mode((640, 480)))
+    game.settings.update(maze_width=99, maze_height=99, zombie_behavior='pursuit')
+    game.start_game()
+    assert game.flow_field.target == game.player_position
+    assert len(game.zombies) >= 300
+
+    dist = distances(game.maze, game.player_position)
+    before = {zombie: dist[zombie.grid_position] for zombie in game.zombies}
+    game.move_zombies()
+    for zombie in game.zombies:
+        assert dist[zombie.target_grid_position] == before[zombie] - 1
+    game.maze_pool.shutdown()
+    pygame.quit()
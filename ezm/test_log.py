@@ -0,0 +1,23 @@
+import log
+
+
+def test_unknown_level_falls_back_to_info(capsys):
+    try:
+        log.configure('verbose')
+        log.info("shown")
+        log.debug("hidden")
+        lines = capsys.readouterr().err.splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith('WARNING') and "'verbose'" in lines[0]
+        assert lines[1] == 'INFO    shown'
+    finally:
+        log.configure()
+
+
+def test_off_silences_everything(capsys):
+    try:
+        log.configure('off')
+        log.error("hidden")
+        assert capsys.readouterr().err == ''
+    finally:
+        log.configure()
@@ -0,0 +1,55 @@
+import pickle
+import random
+from datetime import date, datetime, timezone
+
+from maze_cache import MazeCache, daily_seed, maze_key, pack, seeded_maze, unpack
+from mazegen import generate_grid
+
+
+def test_pack_round_trip():
+    for rows, cols in ((3, 3), (5, 11), (21, 7)):
+        grid = [[random.randint(0, 1) for _ in range(cols)] for _ in range(rows)]
+        assert unpack(pack(grid), rows, cols) == grid
+
+
+def test_cache_round_trip(tmp_path):
+    cache = MazeCache(str(tmp_path))
+    key = maze_key('backtracking', 21, 31, 5)
+    grid = generate_grid('backtracking', 21, 31, random.Random(5))
+    assert cache.load(key) is None
+    cache.store(key, grid)
+    assert cache.load(key) == grid
+
+
+def test_corrupt_file_is_a_miss(tmp_path):
+    cache = MazeCache(str(tmp_path))
+    key = maze_key('backtracking', 21, 21, 5)
+    cache.store(key, generate_grid('backtracking', 21, 21, random.Random(5)))
+    with open(cache.path(key), 'r+b') as f:
+        f.seek(-1, 2)
+        last = f.read(1)[0]
+        f.seek(-1, 2)
+        f.write(bytes([last ^ 1]))
+    assert cache.load(key) is None
+
+
+def test_seeded_maze_is_served_from_the_cache(tmp_path):
+    cache = MazeCache(str(tmp_path))
+    first = seeded_maze(21, 21, 'backtracking', 9, cache)
+    second = seeded_maze(21, 21, 'backtracking', 9, cache)
+    assert first.grid == second.grid
+    assert cache.load(maze_key('backtracking', 21, 21, 9)) == first.grid
+
+
+def test_generation_time_travels_with_the_maze(tmp_path):
+    cache = MazeCache(str(tmp_path))
+    built = seeded_maze(51, 51, 'backtracking', 9, cache)
+    loaded = seeded_maze(51, 51, 'backtracking', 9, cache)
+    assert built.generation_seconds > 0
+    assert 0 < loaded.generation_seconds
+    assert pickle.loads(pickle.dumps(built)).generation_seconds == built.generation_seconds
+
+
+def test_daily_seed_follows_the_utc_date():
+    assert daily_seed(date(2024, 3, 9)) == 20240309
+    assert daily_seed() == int(datetime.now(timezone.utc).strftime('%Y%m%d'))
@@ -0,0 +1,25 @@
+import time
+
+from maze_pool import MazePool
+
+KEY = (301, 301, 'backtracking', 'native', None)
+
+
+def test_take_never_waits_for_a_worker():
+    pool = MazePool(workers=1, size=1)
+    try:
+        pool.prefetch(KEY)
+        start = time.perf_counter()
+        assert pool.take(KEY) is None
+        assert time.perf_counter() - start < 0.05
+        assert pool.building(KEY)
+
+        deadline = time.time() + 60
+        maze = None
+        while maze is None and time.time() < deadline:
+            time.sleep(0.05)
+            maze = pool.take(KEY)
+        assert maze is not None and maze.solution
+        assert not pool.building(KEY)
+    finally:
+        pool.shutdown()
@@ -0,0 +1,54 @@
+import random
+from collections import deque
+
+from mazegen import ALGORITHMS, generate_grid
+
+SIZES = [(5, 5), (9, 21), (31, 11), (40, 40)]
+
+
+def open_neighbors(grid, r, c):
+    rows, cols = len(grid), len(grid[0])
+    for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+        if 0 <= nr < rows and 0 <= nc < cols and not grid[nr][nc]:
+            yield nr, nc
+
+
+def assert_perfect(grid, rows, cols):
+    assert len(grid) == rows and all(len(row) == cols for row in grid)
+    assert grid[0][1] == 0 and grid[rows - 1][cols - 2] == 0
+    border = [grid[0][c] for c in range(cols) if c != 1] + [grid[rows - 1][c] for c in range(cols) if c != cols - 2]
+    border += [grid[r][0] for r in range(rows)] + [grid[r][cols - 1] for r in range(rows)]
+    assert all(border)
+    for r in range(rows):
+        for c in range(cols):
+            if r % 2 and c % 2:
+                assert grid[r][c] == 0  # every cell is open
+            elif r % 2 == 0 and c % 2 == 0:
+                assert grid[r][c] == 1  # wall corners never are
+
+    # Connected, and one edge fewer than open squares: a spanning tree
+    open_squares = [(r, c) for r in range(rows) for c in range(cols) if not grid[r][c]]
+    edges = sum(len(list(open_neighbors(grid, r, c))) for r, c in open_squares) // 2
+    assert edges == len(open_squares) - 1
+    seen = {(0, 1)}
+    queue = deque(seen)
+    while queue:
+        for n in open_neighbors(grid, *queue.popleft()):
+            if n not in seen:
+                seen.add(n)
+                queue.append(n)
+    assert len(seen) == len(open_squares)
+
+
+def test_every_generator_makes_perfect_mazes():
+    for algorithm in ALGORITHMS:
+        for rows, cols in SIZES:
+            for seed in range(5):
+                grid = generate_grid(algorithm, rows, cols, random.Random(seed))
+                assert_perfect(grid, rows - 1 + rows % 2, cols - 1 + cols % 2)
+
+
+def test_seed_fixes_the_maze():
+    for algorithm in ALGORITHMS:
+        first = generate_grid(algorithm, 21, 21, random.Random(7))
+        assert generate_grid(algorithm, 21, 21, random.Random(7)) == first
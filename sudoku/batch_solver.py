@@ -0,0 +1,122 @@
+import argparse
+import os
+import sys
+import time
+from multiprocessing import Pool
+from sudoku_engine import SudokuEngine
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+CORPUS = ['easy', 'medium', 'hard', 'expert', 'hardest']
+
+
+def parse_line(line):
+    """Parse an 81-character puzzle line ('.' or '0' for blanks).
+
+    Returns a flat list of 81 ints, or None for blank and comment lines.
+    Raises ValueError for malformed lines.
+    """
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    if len(line) != 81:
+        raise ValueError(f"expected 81 characters, got {len(line)}")
+    grid = []
+    for ch in line:
+        if ch in '.0':
+            grid.append(0)
+        elif ch in '123456789':
+            grid.append(int(ch))
+        else:
+            raise ValueError(f"invalid character {ch!r}")
+    return grid
+
+
+def solve_grid(grid):
+    """Solve one flat grid and return (solution string or None, nodes, seconds)."""
+    start = time.perf_counter()
+    engine = SudokuEngine(grid)
+    solved = engine.solve()
+    elapsed = time.perf_counter() - start
+    solution = ''.join(map(str, engine.grid)) if solved else None
+    return solution, engine.nodes, elapsed
+
+
+def solve_line(line):
+    try:
+        grid = parse_line(line)
+    except ValueError as e:
+        return line.strip(), None, 0, 0.0, str(e)
+    if grid is None:
+        return None
+    return (line.strip(),) + solve_grid(grid) + (None,)
+
+
+def solve_batch(lines, workers=None, chunksize=64):
+    """Solve puzzle lines across a process pool, yielding results in input order.
+
+    Each result is (puzzle, solution, nodes, seconds, error). solution is None
+    when the puzzle is malformed (error says why) or has no solution. Blank
+    and comment lines are skipped.
+    """
+    if workers == 1:
+        for result in map(solve_line, lines):
+            if result is not None:
+                yield result
+        return
+    with Pool(workers) as pool:
+        for result in pool.imap(solve_line, lines, chunksize):
+            if result is not None:
+                yield result
+
+
+def write_results(results, out):
+    failures = 0
+    for puzzle, solution, nodes, seconds, error in results:
+        if error:
+            failures += 1
+            out.write(f"{puzzle} error: {error}\n")
+        elif solution is None:
+            failures += 1
+            out.write(f"{puzzle} unsolvable\n")
+        else:
+            out.write(solution + '\n')
+    return failures
+
+
+def benchmark(paths, workers=None):
+    print(f"{'corpus':<12} {'puzzles':>8} {'puzzles/s':>10} {'mean ms':>8} {'max ms':>8} {'mean nodes':>10} {'max nodes':>9}")
+    for path in paths:
+        with open(path) as f:
+            lines = f.readlines()
+        start = time.perf_counter()
+        results = [r for r in solve_batch(lines, workers) if r[1] is not None]
+        wall = time.perf_counter() - start
+        if not results:
+            continue
+        nodes = [r[2] for r in results]
+        times = [r[3] * 1000 for r in results]
+        name = os.path.splitext(os.path.basename(path))[0]
+        print(f"{name:<12} {len(results):>8} {len(results) / wall:>10.1f} {sum(times) / len(times):>8.2f} "
+              f"{max(times):>8.2f} {sum(nodes) / len(nodes):>10.1f} {max(nodes):>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve sudoku puzzles given as 81-character lines")
+    parser.add_argument('file', nargs='?', help="puzzle file (default: stdin)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--benchmark', action='store_true', help="time the bundled corpus (or the given file)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        paths = [args.file] if args.file else [os.path.join(CORPUS_DIR, f"{name}.txt") for name in CORPUS]
+        benchmark(paths, args.workers)
+        return
+
+    source = open(args.file) if args.file else sys.stdin
+    with source:
+        failures = write_results(solve_batch(source, args.workers), sys.stdout)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
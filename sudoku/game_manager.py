@@ -1,6 +1,6 @@
 import time
 from enum import Enum
-from sudoku_board import SudokuBoard
+from sudoku_board import CompactSudokuBoard
 
 class Difficulty(Enum):
     EASY = 1
@@ -9,9 +9,11 @@ class Difficulty(Enum):
     EXPERT = 4
 
 class GameManager:
-    def __init__(self, solver):
+    def __init__(self, solver, bank=None):
         self.solver = solver
+        self.bank = bank
         self.board = None
+        self.solution = None
         self.difficulty = Difficulty.EASY
         self.start_time = None
         self.elapsed_time = 0
@@ -20,14 +22,18 @@ class GameManager:
     
     def new_game(self):
         try:
-            self.board = self.solver.generate_puzzle(self.difficulty)
+            puzzle = self.bank.pop(self.difficulty) if self.bank else None
+            if puzzle is None:
+                puzzle = self.solver.generate(self.difficulty)
+            self.board, self.solution = puzzle
             self.start_time = time.time()
             self.elapsed_time = 0
             self.score = 0
             self.move_history.clear()
         except Exception as e:
             print(f"Error generating new game: {e}")
-            self.board = SudokuBoard()  # Create an empty board as fallback
+            self.board = CompactSudokuBoard()  # Create an empty board as fallback
+            self.solution = None
     
     def undo(self):
         if self.move_history:
@@ -35,6 +41,12 @@ class GameManager:
             self.board.set_cell(row, col, prev_value)
     
     def hint(self):
+        if self.solution:
+            hint = self.board.get_empty_cell()
+            if hint:
+                row, col = hint
+                self.board.set_cell(row, col, self.solution.get_cell(row, col))
+            return
         hint = self.solver.get_hint(self.board)
         if hint:
             row, col, value = hint
@@ -44,6 +56,11 @@ class GameManager:
         return self.board.is_valid()
     
     def solve(self):
+        if self.solution:
+            for i in range(9):
+                for j in range(9):
+                    self.board.set_cell(i, j, self.solution.get_cell(i, j))
+            return
         self.solver.solve_puzzle(self.board)
     
     def update_time(self):
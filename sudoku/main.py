@@ -1,33 +1,44 @@
 import pygame
 import sys
 from game_manager import GameManager
+from puzzle_bank import PuzzleBank
 from sudoku_solver import SudokuSolver
 from ui_manager import UIManager
 
-pygame.init()
-
-# Set up display
 WIDTH, HEIGHT = 600, 700
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Sudoku")
-
-# Initialize game components
-solver = SudokuSolver()
-game_manager = GameManager(solver)
-ui_manager = UIManager(screen, game_manager)
-
-# Start a new game
-game_manager.new_game()
-
-# Main game loop
-clock = pygame.time.Clock()
-while True:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-        ui_manager.handle_event(event)
-    
-    ui_manager.draw()
-    pygame.display.flip()
-    clock.tick(60)
\ No newline at end of file
+
+
+def main():
+    pygame.init()
+
+    # Set up display
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Sudoku")
+
+    # Initialize game components
+    solver = SudokuSolver()
+    bank = PuzzleBank()
+    bank.start()
+    game_manager = GameManager(solver, bank)
+    ui_manager = UIManager(screen, game_manager)
+
+    # Start a new game
+    game_manager.new_game()
+
+    # Main game loop: sleep until an event arrives or the timer needs a redraw
+    while True:
+        for event in [pygame.event.wait(250)] + pygame.event.get():
+            if event.type == pygame.QUIT:
+                bank.stop()
+                pygame.quit()
+                sys.exit()
+            ui_manager.handle_event(event)
+
+        dirty_rects = ui_manager.draw()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+
+
+# Guarded, since the puzzle bank's spawned workers import this module
+if __name__ == '__main__':
+    main()
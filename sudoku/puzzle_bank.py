@@ -0,0 +1,143 @@
+import argparse
+import multiprocessing
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from game_manager import Difficulty
+from sudoku_board import CompactSudokuBoard
+from sudoku_solver import SudokuSolver
+
+BANK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'puzzles')
+# A few puzzles per difficulty ship with the game, so the first launch
+# doesn't wait for the refill workers
+SEED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'seed_puzzles')
+RECORD_SIZE = 81
+GIVEN_FLAG = 0x10
+
+# Each puzzle is stored as 81 bytes: the low nibble is the solution digit and
+# GIVEN_FLAG marks the cells that are shown to the player.
+
+
+def encode(board, solution):
+    return bytes(
+        solution.get_cell(i // 9, i % 9) | (GIVEN_FLAG if board.get_cell(i // 9, i % 9) else 0)
+        for i in range(81)
+    )
+
+
+def decode(record):
+    board = CompactSudokuBoard()
+    solution = CompactSudokuBoard()
+    for i, byte in enumerate(record):
+        value = byte & 0x0F
+        solution.set_cell(i // 9, i % 9, value)
+        if byte & GIVEN_FLAG:
+            board.set_cell(i // 9, i % 9, value)
+    return board, solution
+
+
+def generate_record(difficulty):
+    return encode(*SudokuSolver().generate(difficulty))
+
+
+class PuzzleBank:
+    def __init__(self, path=BANK_DIR, target_depth=20, seed_path=SEED_DIR):
+        self.path = path
+        self.target_depth = target_depth
+        # Reentrant, since a job that is already done runs finish inside top_up
+        self.lock = threading.RLock()
+        self.pool = None
+        self.pending = {difficulty: 0 for difficulty in Difficulty}
+        os.makedirs(self.path, exist_ok=True)
+        self.seed(seed_path)
+
+    def file_for(self, difficulty):
+        return os.path.join(self.path, f"{difficulty.name.lower()}.bin")
+
+    def seed(self, seed_path):
+        for difficulty in Difficulty:
+            source = os.path.join(seed_path, os.path.basename(self.file_for(difficulty)))
+            if self.count(difficulty) == 0 and os.path.exists(source):
+                shutil.copyfile(source, self.file_for(difficulty))
+
+    def count(self, difficulty):
+        try:
+            return os.path.getsize(self.file_for(difficulty)) // RECORD_SIZE
+        except FileNotFoundError:
+            return 0
+
+    def add(self, difficulty, records):
+        with self.lock:
+            with open(self.file_for(difficulty), 'ab') as f:
+                f.write(b''.join(records))
+                f.flush()
+                os.fsync(f.fileno())
+
+    def pop(self, difficulty):
+        """Take the newest puzzle off the bank, or return None if it is empty."""
+        with self.lock:
+            count = self.count(difficulty)
+            if count == 0:
+                return None
+            with open(self.file_for(difficulty), 'r+b') as f:
+                f.seek((count - 1) * RECORD_SIZE)
+                record = f.read(RECORD_SIZE)
+                f.truncate((count - 1) * RECORD_SIZE)
+        self.top_up()
+        return decode(record)
+
+    def top_up(self):
+        """Queue enough generation jobs to bring every difficulty to target_depth."""
+        if self.pool is None:
+            return
+        with self.lock:
+            for difficulty in Difficulty:
+                while self.count(difficulty) + self.pending[difficulty] < self.target_depth:
+                    future = self.pool.submit(generate_record, difficulty)
+                    future.add_done_callback(lambda future, difficulty=difficulty: self.finish(difficulty, future))
+                    self.pending[difficulty] += 1
+
+    def finish(self, difficulty, future):
+        # Runs on the pool's result thread
+        with self.lock:
+            self.pending[difficulty] -= 1
+        if not future.cancelled() and future.exception() is None:
+            self.add(difficulty, [future.result()])
+
+    def start(self, workers=1):
+        """Refill the bank in the background, in worker processes."""
+        if self.pool is None:
+            self.pool = worker_pool(workers)
+            self.top_up()
+
+    def stop(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+
+def worker_pool(workers=None):
+    # spawn keeps the workers clear of the game's SDL state
+    return ProcessPoolExecutor(workers or os.cpu_count(), multiprocessing.get_context('spawn'))
+
+
+def bulk_generate(bank, count, workers=None):
+    with worker_pool(workers) as pool:
+        for difficulty in Difficulty:
+            records = list(pool.map(generate_record, [difficulty] * count, chunksize=max(1, count // 64)))
+            bank.add(difficulty, records)
+            print(f"{difficulty.name}: {bank.count(difficulty)} puzzles")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-generate sudoku puzzles into the puzzle bank")
+    parser.add_argument('count', type=int, help="puzzles to generate per difficulty")
+    parser.add_argument('--path', default=BANK_DIR, help="bank directory")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+    bulk_generate(PuzzleBank(args.path), args.count, args.workers)
+
+
+if __name__ == '__main__':
+    main()
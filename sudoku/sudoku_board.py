@@ -41,4 +41,89 @@ class SudokuBoard:
         for i in range(9):
             for j in range(9):
                 new_board.set_cell(i, j, self.get_cell(i, j))
+        return new_board
+
+
+# Unit indices (row, column, box) for each of the 81 cells
+CELL_UNITS = [(i // 9, 9 + i % 9, 18 + (i // 27) * 3 + (i % 9) // 3) for i in range(81)]
+COUNTS_OFFSET = 81
+
+
+def cell_index(row, col):
+    # row * 9 + col alone would let an out-of-range column spill into the next row
+    if not (0 <= row < 9 and 0 <= col < 9):
+        raise IndexError(f"cell ({row}, {col}) is off the board")
+    return row * 9 + col
+
+class CompactSudokuBoard:
+    """SudokuBoard backed by one flat bytearray.
+
+    The first 81 bytes are the cells; after them come per-unit digit counts
+    (27 units x 10 digits) so validity and completeness are tracked as cells
+    change instead of being recomputed.
+    """
+    
+    def __init__(self):
+        self.data = bytearray(COUNTS_OFFSET + 27 * 10)
+        self.empty = 81
+        self.duplicates = 0
+    
+    def set_cell(self, row, col, value):
+        index = cell_index(row, col)
+        data = self.data
+        old = data[index]
+        if old == value:
+            return
+        units = CELL_UNITS[index]
+        if old:
+            for unit in units:
+                k = COUNTS_OFFSET + unit * 10 + old
+                data[k] -= 1
+                if data[k]:
+                    self.duplicates -= 1
+        else:
+            self.empty -= 1
+        if value:
+            for unit in units:
+                k = COUNTS_OFFSET + unit * 10 + value
+                if data[k]:
+                    self.duplicates += 1
+                data[k] += 1
+        else:
+            self.empty += 1
+        data[index] = value
+    
+    def get_cell(self, row, col):
+        return self.data[cell_index(row, col)]
+    
+    def is_valid(self):
+        return self.duplicates == 0
+    
+    def is_unit_valid(self, unit):
+        start = COUNTS_OFFSET + unit * 10 + 1
+        return max(self.data[start:start + 9]) <= 1
+    
+    def is_row_valid(self, row):
+        return self.is_unit_valid(row)
+    
+    def is_column_valid(self, col):
+        return self.is_unit_valid(9 + col)
+    
+    def is_box_valid(self, box):
+        return self.is_unit_valid(18 + box)
+    
+    def is_complete(self):
+        return self.empty == 0
+    
+    def get_empty_cell(self):
+        if self.empty == 0:
+            return None
+        index = self.data.index(0, 0, 81)
+        return index // 9, index % 9
+    
+    def copy(self):
+        new_board = CompactSudokuBoard.__new__(CompactSudokuBoard)
+        new_board.data = self.data[:]
+        new_board.empty = self.empty
+        new_board.duplicates = self.duplicates
         return new_board
\ No newline at end of file
@@ -0,0 +1,181 @@
+ALL_DIGITS = 0x1FF
+
+ROW_OF = [i // 9 for i in range(81)]
+COL_OF = [i % 9 for i in range(81)]
+BOX_OF = [(i // 27) * 3 + (i % 9) // 3 for i in range(81)]
+
+UNITS = (
+    [[r * 9 + c for c in range(9)] for r in range(9)] +
+    [[r * 9 + c for r in range(9)] for c in range(9)] +
+    [[(b // 3) * 27 + (b % 3) * 3 + (k // 3) * 9 + k % 3 for k in range(9)] for b in range(9)]
+)
+
+# Maps a single-bit candidate mask to its digit
+DIGIT_OF_BIT = {1 << (d - 1): d for d in range(1, 10)}
+
+
+def bit_count(mask):
+    count = 0
+    while mask:
+        mask &= mask - 1
+        count += 1
+    return count
+
+
+def bits_of(mask):
+    while mask:
+        low = mask & -mask
+        yield low
+        mask ^= low
+
+
+class SudokuEngine:
+    """Bitmask constraint-propagation solver working on a flat 81-cell grid.
+
+    Each row, column and box keeps a 9-bit mask of the digits already placed,
+    so the candidates for a cell are a single OR of three masks. The search
+    fills naked and hidden singles before branching on the cell with the
+    fewest candidates (MRV).
+    """
+
+    def __init__(self, grid=None):
+        self.grid = [0] * 81
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        self.valid = True
+        self.nodes = 0
+        if grid is not None:
+            for cell, value in enumerate(grid):
+                if value and not self.place(cell, value):
+                    self.valid = False
+
+    @classmethod
+    def from_board(cls, board):
+        return cls([board.get_cell(i // 9, i % 9) for i in range(81)])
+
+    def copy(self):
+        engine = SudokuEngine.__new__(SudokuEngine)
+        engine.grid = self.grid[:]
+        engine.rows = self.rows[:]
+        engine.cols = self.cols[:]
+        engine.boxes = self.boxes[:]
+        engine.valid = self.valid
+        engine.nodes = 0
+        return engine
+
+    def candidates(self, cell):
+        return ALL_DIGITS & ~(self.rows[ROW_OF[cell]] | self.cols[COL_OF[cell]] | self.boxes[BOX_OF[cell]])
+
+    def place(self, cell, value):
+        bit = 1 << (value - 1)
+        if not self.candidates(cell) & bit:
+            return False
+        self.grid[cell] = value
+        self.rows[ROW_OF[cell]] |= bit
+        self.cols[COL_OF[cell]] |= bit
+        self.boxes[BOX_OF[cell]] |= bit
+        return True
+
+    def propagate(self):
+        """Fill naked and hidden singles until nothing changes.
+
+        Returns False on a contradiction, otherwise the empty cell with the
+        fewest candidates (or None when the grid is full).
+        """
+        grid = self.grid
+        while True:
+            changed = False
+            best_cell = None
+            best_count = 10
+            for cell in range(81):
+                if grid[cell]:
+                    continue
+                cands = self.candidates(cell)
+                if not cands:
+                    return False
+                if cands & (cands - 1) == 0:
+                    self.place(cell, DIGIT_OF_BIT[cands])
+                    changed = True
+                    continue
+                if not changed:
+                    count = bit_count(cands)
+                    if count < best_count:
+                        best_cell, best_count = cell, count
+            if changed:
+                continue
+
+            for unit in UNITS:
+                once = twice = placed = 0
+                for cell in unit:
+                    value = grid[cell]
+                    if value:
+                        placed |= 1 << (value - 1)
+                    else:
+                        cands = self.candidates(cell)
+                        twice |= once & cands
+                        once |= cands
+                if (once | placed) != ALL_DIGITS:
+                    return False
+                hidden = once & ~twice
+                for bit in bits_of(hidden):
+                    for cell in unit:
+                        if not grid[cell] and self.candidates(cell) & bit:
+                            if not self.place(cell, DIGIT_OF_BIT[bit]):
+                                return False
+                            changed = True
+                            break
+            if not changed:
+                return best_cell
+
+    def solve(self, rng=None):
+        """Solve in place and return True, or return False if unsolvable.
+
+        Pass a ``random.Random`` as ``rng`` to try candidates in random order,
+        which is how full grids are generated from an empty board.
+        """
+        if not self.valid:
+            return False
+        self.nodes += 1
+        cell = self.propagate()
+        if cell is False:
+            return False
+        if cell is None:
+            return True
+        digits = [DIGIT_OF_BIT[bit] for bit in bits_of(self.candidates(cell))]
+        if rng is not None:
+            rng.shuffle(digits)
+        for value in digits:
+            branch = self.copy()
+            branch.place(cell, value)
+            solved = branch.solve(rng)
+            self.nodes += branch.nodes
+            if solved:
+                self.grid, self.rows, self.cols, self.boxes = branch.grid, branch.rows, branch.cols, branch.boxes
+                return True
+        return False
+
+    def count_solutions(self, limit=2):
+        """Count solutions, stopping as soon as ``limit`` have been found."""
+        if not self.valid:
+            return 0
+        self.nodes += 1
+        cell = self.propagate()
+        if cell is False:
+            return 0
+        if cell is None:
+            return 1
+        count = 0
+        for bit in bits_of(self.candidates(cell)):
+            branch = self.copy()
+            branch.place(cell, DIGIT_OF_BIT[bit])
+            count += branch.count_solutions(limit - count)
+            self.nodes += branch.nodes
+            if count >= limit:
+                break
+        return count
+
+    def to_board(self, board):
+        for i in range(81):
+            board.set_cell(i // 9, i % 9, self.grid[i])
+        return board
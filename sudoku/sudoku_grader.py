@@ -0,0 +1,231 @@
+from itertools import combinations
+from game_manager import Difficulty
+from sudoku_engine import ALL_DIGITS, DIGIT_OF_BIT, UNITS, bit_count, bits_of
+
+PEERS = [sorted({p for unit in UNITS if cell in unit for p in unit} - {cell}) for cell in range(81)]
+ROWS, COLS, BOXES = UNITS[:9], UNITS[9:18], UNITS[18:]
+BIT_COUNT = [bit_count(mask) for mask in range(ALL_DIGITS + 1)]
+# Every box/line intersection as (its 3 cells, the rest of the box, the rest of the line)
+INTERSECTIONS = [
+    (segment, [c for c in box if c not in segment], [c for c in line if c not in segment])
+    for box in BOXES for line in ROWS + COLS
+    for segment in [[c for c in box if c in line]] if segment
+]
+
+# Named techniques from easiest to hardest, with the difficulty each one implies
+TECHNIQUES = [
+    ('hidden single', Difficulty.EASY),
+    ('naked single', Difficulty.EASY),
+    ('pointing', Difficulty.MEDIUM),
+    ('naked pair', Difficulty.HARD),
+    ('hidden pair', Difficulty.HARD),
+    ('naked triple', Difficulty.HARD),
+    ('hidden triple', Difficulty.HARD),
+    ('x-wing', Difficulty.EXPERT),
+    ('swordfish', Difficulty.EXPERT),
+]
+GUESSING = 'guessing'
+
+
+class SudokuGrader:
+    """Solves a puzzle the way a person would and rates it by the hardest
+    technique it needed.
+
+    Techniques are tried in the order of TECHNIQUES; after any progress the
+    grader starts again from the easiest one. A puzzle the techniques cannot
+    finish is rated GUESSING / Difficulty.EXPERT.
+    """
+
+    def grade(self, board):
+        """Return (difficulty, hardest technique name) for a board."""
+        self.load([board.get_cell(i // 9, i % 9) for i in range(81)])
+        steps = [getattr(self, 'apply_' + name.replace(' ', '_').replace('-', '_')) for name, _ in TECHNIQUES]
+        hardest = 0
+        while self.empty:
+            for level, step in enumerate(steps):
+                if step():
+                    hardest = max(hardest, level)
+                    break
+            else:
+                return Difficulty.EXPERT, GUESSING
+        name, difficulty = TECHNIQUES[hardest]
+        return difficulty, name
+
+    def load(self, grid):
+        self.grid = grid
+        self.cands = [0] * 81
+        self.empty = 0
+        for cell in range(81):
+            if not grid[cell]:
+                used = 0
+                for peer in PEERS[cell]:
+                    if grid[peer]:
+                        used |= 1 << (grid[peer] - 1)
+                self.cands[cell] = ALL_DIGITS & ~used
+                self.empty += 1
+        self.unit_positions = None
+
+    def place(self, cell, bit):
+        self.unit_positions = None
+        self.grid[cell] = DIGIT_OF_BIT[bit]
+        self.cands[cell] = 0
+        self.empty -= 1
+        cands = self.cands
+        for peer in PEERS[cell]:
+            cands[peer] &= ~bit
+
+    def eliminate(self, cells, mask):
+        progress = False
+        cands = self.cands
+        for cell in cells:
+            if cands[cell] & mask:
+                cands[cell] &= ~mask
+                progress = True
+        if progress:
+            self.unit_positions = None
+        return progress
+
+    def positions(self):
+        """For every unit and digit, the positions (bit k = unit[k]) where
+        the digit can still go.
+
+        Hidden subsets and fish all read this, so it is built once and kept
+        until the candidates change.
+        """
+        if self.unit_positions is None:
+            cands = self.cands
+            self.unit_positions = table = []
+            for unit in UNITS:
+                positions = [0] * 9
+                for k, cell in enumerate(unit):
+                    mask = cands[cell]
+                    while mask:
+                        low = mask & -mask
+                        positions[DIGIT_OF_BIT[low] - 1] |= 1 << k
+                        mask ^= low
+                table.append(positions)
+        return self.unit_positions
+
+    def apply_hidden_single(self):
+        progress = False
+        cands = self.cands
+        for unit in UNITS:
+            once = twice = 0
+            for cell in unit:
+                mask = cands[cell]
+                twice |= once & mask
+                once |= mask
+            if once == twice:
+                continue
+            for bit in bits_of(once & ~twice):
+                for cell in unit:
+                    if cands[cell] & bit:
+                        self.place(cell, bit)
+                        progress = True
+                        break
+        return progress
+
+    def apply_naked_single(self):
+        progress = False
+        cands = self.cands
+        for cell in range(81):
+            mask = cands[cell]
+            if mask and mask & (mask - 1) == 0:
+                self.place(cell, mask)
+                progress = True
+        return progress
+
+    def apply_pointing(self):
+        # Pointing: a digit confined to one row/column of a box is removed
+        # from the rest of that line. Claiming is the same with line and box
+        # swapped.
+        cands = self.cands
+        for segment, box_rest, line_rest in INTERSECTIONS:
+            inside = cands[segment[0]] | cands[segment[1]] | cands[segment[2]]
+            if not inside:
+                continue
+            in_box = in_line = 0
+            for c in box_rest:
+                in_box |= cands[c]
+            for c in line_rest:
+                in_line |= cands[c]
+            pointing = inside & ~in_box & in_line
+            if pointing and self.eliminate(line_rest, pointing):
+                return True
+            claiming = inside & ~in_line & in_box
+            if claiming and self.eliminate(box_rest, claiming):
+                return True
+        return False
+
+    def naked_subset(self, size):
+        cands = self.cands
+        for unit in UNITS:
+            cells = [c for c in unit if cands[c] and BIT_COUNT[cands[c]] <= size]
+            if len(cells) < size:
+                continue
+            for subset in combinations(cells, size):
+                mask = 0
+                for c in subset:
+                    mask |= cands[c]
+                if BIT_COUNT[mask] == size and self.eliminate([c for c in unit if c not in subset], mask):
+                    return True
+        return False
+
+    def hidden_subset(self, size):
+        for unit, positions in zip(UNITS, self.positions()):
+            # A subset filling every open cell of the unit eliminates nothing
+            open_spots = 0
+            for spots in positions:
+                open_spots |= spots
+            if BIT_COUNT[open_spots] <= size:
+                continue
+            digits = [d for d in range(9) if 2 <= BIT_COUNT[positions[d]] <= size]
+            if len(digits) < size:
+                continue
+            for subset in combinations(digits, size):
+                spots = 0
+                for d in subset:
+                    spots |= positions[d]
+                if BIT_COUNT[spots] == size:
+                    keep = sum(1 << d for d in subset)
+                    if self.eliminate([unit[k] for k in range(9) if spots >> k & 1], ALL_DIGITS & ~keep):
+                        return True
+        return False
+
+    def fish(self, size):
+        # A row's positions are columns and a column's positions are rows
+        table = self.positions()
+        for lines, cross, first in ((ROWS, COLS, 0), (COLS, ROWS, 9)):
+            for d in range(9):
+                spots = [table[first + i][d] for i in range(9)]
+                bases = [i for i in range(9) if 2 <= BIT_COUNT[spots[i]] <= size]
+                if len(bases) < size:
+                    continue
+                for base in combinations(bases, size):
+                    cover = 0
+                    for i in base:
+                        cover |= spots[i]
+                    if BIT_COUNT[cover] == size:
+                        base_cells = {c for i in base for c in lines[i]}
+                        targets = [c for j in range(9) if cover >> j & 1 for c in cross[j] if c not in base_cells]
+                        if self.eliminate(targets, 1 << d):
+                            return True
+        return False
+
+    def apply_naked_pair(self):
+        return self.naked_subset(2)
+
+    def apply_hidden_pair(self):
+        return self.hidden_subset(2)
+
+    def apply_naked_triple(self):
+        return self.naked_subset(3)
+
+    def apply_hidden_triple(self):
+        return self.hidden_subset(3)
+
+    def apply_x_wing(self):
+        return self.fish(2)
+
+    def apply_swordfish(self):
+        return self.fish(3)
@@ -1,71 +1,84 @@
 import random
-from sudoku_board import SudokuBoard
+from sudoku_board import CompactSudokuBoard
+from sudoku_engine import SudokuEngine
+from sudoku_grader import SudokuGrader
 from game_manager import Difficulty
 
+MAX_ATTEMPTS = 20
+
 class SudokuSolver:
+    def __init__(self):
+        self.grader = SudokuGrader()
+    
     def generate_puzzle(self, difficulty):
-        board = SudokuBoard()
-        self.fill_board(board)
-        self.remove_numbers(board, difficulty)
-        return board
+        return self.generate(difficulty)[0]
+    
+    def generate(self, difficulty):
+        # Retry until the technique rating hits the target, keeping the
+        # closest puzzle in case it never does
+        best = None
+        for _ in range(MAX_ATTEMPTS):
+            solution = CompactSudokuBoard()
+            self.fill_board(solution)
+            board = solution.copy()
+            rating = self.remove_numbers(board, difficulty)
+            if rating == difficulty:
+                return board, solution
+            if best is None or difficulty.value - rating.value < difficulty.value - best[2].value:
+                best = board, solution, rating
+        return best[0], best[1]
     
     def fill_board(self, board):
-        self.solve_puzzle(board)
+        engine = SudokuEngine.from_board(board)
+        if engine.solve(random.Random()):
+            engine.to_board(board)
     
     def remove_numbers(self, board, difficulty):
         cells_to_remove = {
-            Difficulty.EASY: 40,
-            Difficulty.MEDIUM: 50,
-            Difficulty.HARD: 60,
-            Difficulty.EXPERT: 70
+            Difficulty.EASY: 45,
+            Difficulty.MEDIUM: 55,
+            Difficulty.HARD: 64,
+            Difficulty.EXPERT: 64
         }[difficulty]
         
         cells = [(i, j) for i in range(9) for j in range(9)]
         random.shuffle(cells)
         
-        for i, j in cells[:cells_to_remove]:
+        # Only blank a cell if the puzzle still has exactly one solution and
+        # does not need a technique harder than the target difficulty
+        removed = 0
+        rating = Difficulty.EASY
+        for i, j in cells:
+            if removed == cells_to_remove:
+                break
+            value = board.get_cell(i, j)
             board.set_cell(i, j, 0)
+            if self.count_solutions(board) != 1:
+                board.set_cell(i, j, value)
+                continue
+            new_rating = self.grader.grade(board)[0]
+            if new_rating.value > difficulty.value:
+                board.set_cell(i, j, value)
+                continue
+            rating = new_rating
+            removed += 1
+        return rating
     
-    def solve_puzzle(self, board):
-        empty = board.get_empty_cell()
-        if not empty:
-            return True
-        row, col = empty
-        
-        nums = list(range(1, 10))
-        random.shuffle(nums)
-        for num in nums:
-            if self.is_safe(board, row, col, num):
-                board.set_cell(row, col, num)
-                if self.solve_puzzle(board):
-                    return True
-                board.set_cell(row, col, 0)
-        
-        return False
+    def count_solutions(self, board, limit=2):
+        return SudokuEngine.from_board(board).count_solutions(limit)
     
-    def is_safe(self, board, row, col, num):
-        # Check row
-        if num in [board.get_cell(row, i) for i in range(9) if board.get_cell(row, i) != 0]:
-            return False
-        
-        # Check column
-        if num in [board.get_cell(i, col) for i in range(9) if board.get_cell(i, col) != 0]:
+    def solve_puzzle(self, board):
+        engine = SudokuEngine.from_board(board)
+        if not engine.solve():
             return False
-        
-        # Check 3x3 box
-        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(box_row, box_row + 3):
-            for j in range(box_col, box_col + 3):
-                if board.get_cell(i, j) == num:
-                    return False
-        
+        engine.to_board(board)
         return True
     
     def get_hint(self, board):
-        solved_board = board.copy()
-        if self.solve_puzzle(solved_board):
+        engine = SudokuEngine.from_board(board)
+        if engine.solve():
             for i in range(9):
                 for j in range(9):
                     if board.get_cell(i, j) == 0:
-                        return i, j, solved_board.get_cell(i, j)
+                        return i, j, engine.grid[i * 9 + j]
         return None
\ No newline at end of file
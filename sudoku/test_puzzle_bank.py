@@ -0,0 +1,43 @@
+import os
+import time
+
+from game_manager import Difficulty
+from puzzle_bank import SEED_DIR, PuzzleBank, decode
+
+
+def test_seed_puzzles_are_solved_by_their_solutions():
+    for difficulty in Difficulty:
+        with open(os.path.join(SEED_DIR, f"{difficulty.name.lower()}.bin"), 'rb') as f:
+            data = f.read()
+        assert data and len(data) % 81 == 0
+        for start in range(0, len(data), 81):
+            board, solution = decode(data[start:start + 81])
+            assert solution.is_complete() and solution.is_valid()
+            for i in range(81):
+                value = board.get_cell(i // 9, i % 9)
+                assert value in (0, solution.get_cell(i // 9, i % 9))
+
+
+def test_first_launch_is_served_from_the_seed_bank(tmp_path):
+    bank = PuzzleBank(str(tmp_path))
+    for difficulty in Difficulty:
+        assert bank.count(difficulty) > 0
+        board, solution = bank.pop(difficulty)
+        assert solution.is_complete() and not board.is_complete()
+
+
+def test_workers_refill_the_bank(tmp_path):
+    bank = PuzzleBank(str(tmp_path), target_depth=2, seed_path=str(tmp_path / 'none'))
+    bank.start()
+    try:
+        deadline = time.time() + 120
+        while any(bank.count(d) < 2 for d in Difficulty) and time.time() < deadline:
+            time.sleep(0.1)
+        assert all(bank.count(d) == 2 for d in Difficulty)
+        bank.pop(Difficulty.EASY)
+        deadline = time.time() + 60
+        while bank.count(Difficulty.EASY) < 2 and time.time() < deadline:
+            time.sleep(0.1)
+        assert bank.count(Difficulty.EASY) == 2
+    finally:
+        bank.stop()
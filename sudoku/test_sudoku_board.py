@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from sudoku_board import CompactSudokuBoard, SudokuBoard
+
+
+def assert_same(compact, plain):
+    for i in range(9):
+        assert compact.is_row_valid(i) == plain.is_row_valid(i)
+        assert compact.is_column_valid(i) == plain.is_column_valid(i)
+        assert compact.is_box_valid(i) == plain.is_box_valid(i)
+    assert compact.is_valid() == plain.is_valid()
+    assert compact.is_complete() == plain.is_complete()
+    assert compact.get_empty_cell() == plain.get_empty_cell()
+    assert [[compact.get_cell(r, c) for c in range(9)] for r in range(9)] == plain.board
+
+
+def test_validity_matches_the_plain_board():
+    rng = random.Random(1)
+    for _ in range(50):
+        compact, plain = CompactSudokuBoard(), SudokuBoard()
+        for _ in range(300):
+            # Mostly filling, with clears and overwrites mixed in
+            row, col = rng.randrange(9), rng.randrange(9)
+            value = rng.choice([0] + list(range(1, 10)) * 3)
+            compact.set_cell(row, col, value)
+            plain.set_cell(row, col, value)
+            assert_same(compact, plain)
+
+
+def test_solved_grid_is_valid_and_complete():
+    compact, plain = CompactSudokuBoard(), SudokuBoard()
+    for r in range(9):
+        for c in range(9):
+            value = (r * 3 + r // 3 + c) % 9 + 1
+            compact.set_cell(r, c, value)
+            plain.set_cell(r, c, value)
+    assert_same(compact, plain)
+    assert compact.is_valid() and compact.is_complete()
+
+
+def test_copy_is_independent():
+    board = CompactSudokuBoard()
+    board.set_cell(0, 0, 5)
+    copy = board.copy()
+    copy.set_cell(0, 1, 5)
+    assert board.is_valid() and not copy.is_valid()
+    assert board.get_cell(0, 1) == 0
+
+
+def test_off_board_cells_raise():
+    board = CompactSudokuBoard()
+    for row, col in ((0, 9), (0, 11), (9, 0), (-1, 0), (0, -1)):
+        with pytest.raises(IndexError):
+            board.set_cell(row, col, 1)
+        with pytest.raises(IndexError):
+            board.get_cell(row, col)
+    assert board.empty == 81 and board.is_valid()
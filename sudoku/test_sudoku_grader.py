@@ -0,0 +1,45 @@
+import os
+import time
+
+from batch_solver import CORPUS_DIR, parse_line
+from game_manager import Difficulty
+from sudoku_board import SudokuBoard
+from sudoku_grader import SudokuGrader
+
+# Grading runs while the player waits for a new puzzle
+BUDGET_MS = 10
+
+
+def corpus(name):
+    boards = []
+    with open(os.path.join(CORPUS_DIR, f"{name}.txt")) as f:
+        for line in f:
+            grid = parse_line(line)
+            if grid is not None:
+                board = SudokuBoard()
+                for i, value in enumerate(grid):
+                    board.set_cell(i // 9, i % 9, value)
+                boards.append(board)
+    return boards
+
+
+def test_graded_corpus_keeps_its_labels():
+    grader = SudokuGrader()
+    for difficulty in Difficulty:
+        ratings = {grader.grade(board)[0] for board in corpus(difficulty.name.lower())}
+        assert ratings == {difficulty}
+
+
+def test_every_corpus_puzzle_grades_within_budget():
+    grader = SudokuGrader()
+    slowest = 0.0
+    for name in ('easy', 'medium', 'hard', 'expert', 'hardest'):
+        for board in corpus(name):
+            # Best of three, so a busy machine doesn't fail the test
+            best = float('inf')
+            for _ in range(3):
+                start = time.perf_counter()
+                grader.grade(board)
+                best = min(best, time.perf_counter() - start)
+            slowest = max(slowest, best)
+    assert slowest * 1000 < BUDGET_MS
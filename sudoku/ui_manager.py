@@ -1,5 +1,10 @@
 import pygame
 
+BACKGROUND_COLOR = (255, 255, 255)
+TEXT_COLOR = (0, 0, 0)
+SELECTED_COLOR = (200, 200, 200)
+BUTTON_COLOR = (200, 200, 200)
+
 class UIManager:
     def __init__(self, screen, game_manager):
         self.screen = screen
@@ -10,7 +15,15 @@ class UIManager:
         self.button_width = 100
         self.button_height = 40
         self.selected_cell = None
+        self.fonts = {size: pygame.font.Font(None, size) for size in (24, 36)}
+        self.glyphs = {}
         self.initialize_buttons()
+        self.timer_rect = pygame.Rect(self.margin, self.board_size + 3*self.margin + self.button_height,
+                                      self.board_size, self.margin)
+        self.score_rect = pygame.Rect(self.margin, self.board_size + 4*self.margin + self.button_height,
+                                      self.board_size, self.margin + 10)
+        self.background = self.render_background()
+        self.invalidate()
     
     def initialize_buttons(self):
         self.buttons = {
@@ -21,11 +34,47 @@ class UIManager:
             'Solve': pygame.Rect(self.margin + 4*self.button_width + 40, self.board_size + 2*self.margin, self.button_width, self.button_height),
         }
     
+    def glyph(self, text, size, color=TEXT_COLOR):
+        key = (text, size, color)
+        surface = self.glyphs.get(key)
+        if surface is None:
+            surface = self.fonts[size].render(text, True, color)
+            self.glyphs[key] = surface
+        return surface
+    
+    def render_background(self):
+        # Everything that never changes: grid lines and buttons
+        background = pygame.Surface(self.screen.get_size())
+        background.fill(BACKGROUND_COLOR)
+        for i in range(9):
+            for j in range(9):
+                cell_rect = pygame.Rect(j * self.cell_size, i * self.cell_size, self.cell_size, self.cell_size)
+                pygame.draw.rect(background, TEXT_COLOR, cell_rect, 1)
+        for i in range(0, 10, 3):
+            pygame.draw.line(background, TEXT_COLOR, (0, i * self.cell_size), (self.board_size, i * self.cell_size), 3)
+            pygame.draw.line(background, TEXT_COLOR, (i * self.cell_size, 0), (i * self.cell_size, self.board_size), 3)
+        for button, rect in self.buttons.items():
+            pygame.draw.rect(background, BUTTON_COLOR, rect)
+            text = self.glyph(button, 24)
+            background.blit(text, text.get_rect(center=rect.center))
+        return background
+    
+    def invalidate(self):
+        # draw() only repaints cells, timer and score that differ from these, so clear them all
+        self.drawn_cells = {}
+        self.drawn_timer = None
+        self.drawn_score = None
+        self.full_redraw = True
+    
     def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.invalidate()
+        elif event.type == pygame.MOUSEBUTTONDOWN:
             x, y = event.pos
             if y < self.board_size:
-                self.selected_cell = (y // self.cell_size, x // self.cell_size)
+                # Clicks right of the board select nothing
+                if x < self.board_size:
+                    self.selected_cell = (y // self.cell_size, x // self.cell_size)
             else:
                 for button, rect in self.buttons.items():
                     if rect.collidepoint(x, y):
@@ -51,52 +100,58 @@ class UIManager:
             self.game_manager.solve()
     
     def draw(self):
-        self.screen.fill((255, 255, 255))  # White background
-        self.draw_board()
-        self.draw_controls()
-        self.draw_timer()
-        self.draw_score()
+        """Redraw only what changed and return the dirty rects for display.update."""
+        dirty = []
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            dirty.append(self.screen.get_rect())
+            self.full_redraw = False
+        dirty += self.draw_board()
+        dirty += self.draw_timer()
+        dirty += self.draw_score()
+        return dirty
     
     def draw_board(self):
+        dirty = []
+        board = self.game_manager.board
         for i in range(9):
             for j in range(9):
-                x = j * self.cell_size
-                y = i * self.cell_size
-                cell_rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
-                pygame.draw.rect(self.screen, (0, 0, 0), cell_rect, 1)
-                
-                if (i, j) == self.selected_cell:
-                    pygame.draw.rect(self.screen, (200, 200, 200), cell_rect)
-                
-                value = self.game_manager.board.get_cell(i, j)
-                if value != 0:
-                    font = pygame.font.Font(None, 36)
-                    text = font.render(str(value), True, (0, 0, 0))
-                    text_rect = text.get_rect(center=(x + self.cell_size // 2, y + self.cell_size // 2))
-                    self.screen.blit(text, text_rect)
-        
-        # Draw thicker lines for 3x3 boxes
-        for i in range(0, 10, 3):
-            pygame.draw.line(self.screen, (0, 0, 0), (0, i * self.cell_size), (self.board_size, i * self.cell_size), 3)
-            pygame.draw.line(self.screen, (0, 0, 0), (i * self.cell_size, 0), (i * self.cell_size, self.board_size), 3)
+                state = (board.get_cell(i, j), (i, j) == self.selected_cell)
+                if self.drawn_cells.get((i, j)) == state:
+                    continue
+                self.drawn_cells[(i, j)] = state
+                dirty.append(self.draw_cell(i, j, *state))
+        return dirty
     
-    def draw_controls(self):
-        for button, rect in self.buttons.items():
-            pygame.draw.rect(self.screen, (200, 200, 200), rect)
-            font = pygame.font.Font(None, 24)
-            text = font.render(button, True, (0, 0, 0))
-            text_rect = text.get_rect(center=rect.center)
-            self.screen.blit(text, text_rect)
+    def draw_cell(self, i, j, value, selected):
+        x = j * self.cell_size
+        y = i * self.cell_size
+        cell_rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
+        # Repaint the cell from the background, then fill inside the grid lines
+        self.screen.blit(self.background, cell_rect, cell_rect)
+        if selected:
+            pygame.draw.rect(self.screen, SELECTED_COLOR, cell_rect.inflate(-4, -4))
+        if value != 0:
+            text = self.glyph(str(value), 36)
+            self.screen.blit(text, text.get_rect(center=cell_rect.center))
+        return cell_rect
+    
+    def draw_text_region(self, rect, text):
+        self.screen.blit(self.background, rect, rect)
+        self.screen.blit(self.fonts[36].render(text, True, TEXT_COLOR), rect.topleft)
+        return rect
     
     def draw_timer(self):
         self.game_manager.update_time()
-        font = pygame.font.Font(None, 36)
         timer_text = f"Time: {self.game_manager.elapsed_time}s"
-        text = font.render(timer_text, True, (0, 0, 0))
-        self.screen.blit(text, (self.margin, self.board_size + 3*self.margin + self.button_height))
+        if timer_text == self.drawn_timer:
+            return []
+        self.drawn_timer = timer_text
+        return [self.draw_text_region(self.timer_rect, timer_text)]
     
     def draw_score(self):
-        font = pygame.font.Font(None, 36)
         score_text = f"Score: {self.game_manager.score}"
-        text = font.render(score_text, True, (0, 0, 0))
-        self.screen.blit(text, (self.margin, self.board_size + 4*self.margin + self.button_height))
\ No newline at end of file
+        if score_text == self.drawn_score:
+            return []
+        self.drawn_score = score_text
+        return [self.draw_text_region(self.score_rect, score_text)]
\ No newline at end of file